@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark parserów HTML na zapisanej stronie wyników wyszukiwania RCL.
+
+Użycie:
+    python benchmarks/bench_html_parsers.py [--repeat N]
+    
+Mierzy samo budowanie drzewa (make_soup) oraz pełne RCLTagMonitor._parse_search_results
+dla każdego dostępnego parsera i sprawdza, czy wszystkie dają te same wyniki.
+"""
+
+import argparse
+import os
+from datetime import datetime
+
+from common import FakePage, load_saved_search_page, measure, print_row
+
+from pl_monitoring.constants import HTML_PARSER_BACKENDS, HTML_PARSER_ENV
+from pl_monitoring.monitors.rcl_tag_monitor import RCLTagMonitor
+from pl_monitoring.parsers.html_backend import _is_available, make_soup
+
+
+def parse_args():
+    """Parsuje argumenty wiersza poleceń."""
+    parser = argparse.ArgumentParser(description="Benchmark parserów HTML")
+    parser.add_argument('--repeat', type=int, default=10, help="Liczba powtórzeń (domyślnie 10)")
+    return parser.parse_args()
+
+
+def main():
+    """Główna funkcja."""
+    args = parse_args()
+    html = load_saved_search_page()
+    page = FakePage(html)
+    monitor = RCLTagMonitor(load_tags_fn=list, browser_extraction='html')
+    start_date, end_date = datetime(2000, 1, 1), datetime(2100, 1, 1)
+    
+    # html.parser jako punkt odniesienia
+    backends = ['html.parser'] + [
+        name for name in HTML_PARSER_BACKENDS if name != 'html.parser' and _is_available(name)
+    ]
+    print(f"Strona: {len(html) / 1024 / 1024:.2f} MB, parsery: {', '.join(backends)}")
+    
+    print("\nmake_soup:")
+    baseline = None
+    for name in backends:
+        timings = measure(lambda: make_soup(html, name), args.repeat)
+        print_row(name, timings, baseline)
+        baseline = baseline or timings
+    
+    print("\n_parse_search_results:")
+    baseline = None
+    results = {}
+    for name in backends:
+        os.environ[HTML_PARSER_ENV] = name
+        timings = measure(lambda: monitor._parse_search_results(page, start_date, end_date), args.repeat)
+        results[name] = monitor._parse_search_results(page, start_date, end_date)
+        print_row(name, timings, baseline)
+        baseline = baseline or timings
+    os.environ.pop(HTML_PARSER_ENV, None)
+    
+    print()
+    for name, result in results.items():
+        status = "OK" if result == results['html.parser'] else "RÓŻNICA względem html.parser"
+        print(f"Wyniki {name}: {len(result)} wierszy - {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark wyciągania dat modyfikacji ze strony projektu RCL.
+
+Użycie:
+    python benchmarks/bench_rcl_project_page.py [--stages N] [--repeat N]
+    
+Porównuje pełne parsowanie DOM (make_soup + _extract_modification_dates) ze
+skanem surowego HTML (extract_modification_dates) na syntetycznej stronie
+projektu o rozmiarze zbliżonym do stron RCL i sprawdza zgodność wyników.
+"""
+
+import argparse
+
+from common import measure, print_row
+
+from pl_monitoring.monitors.rcl_project_monitor import RCLProjectMonitor
+from pl_monitoring.parsers.html_backend import make_soup
+from pl_monitoring.parsers.rcl_project_page import extract_modification_dates
+
+# Nawigacja, skrypty i stopka - większość objętości prawdziwej strony projektu
+_BOILERPLATE = ''.join(
+    f'<li class="menu-item"><a href="/kategoria/{i}" title="Pozycja menu {i}">Pozycja {i}</a></li>'
+    for i in range(400)
+)
+
+_STAGE = """
+<div class="etap">
+  <div class="row"><div class="col-md-8"><a href="/projekt/12345678/katalog/{n}">{n}. Etap procedury legislacyjnej</a></div></div>
+  <ul class="files">{files}</ul>
+  <div class="small2">Data ostatniej modyfikacji: {day:02d}-{month:02d}-2025</div>
+</div>
+"""
+
+_FILE = '<li><a href="/docs//2/12345678/{n}/{i}/dokument.docx?lastUpdateDay={i}">Dokument {i} (docx, 64 KB)</a></li>'
+
+
+def build_project_page(stages: int) -> bytes:
+    """
+    Buduje syntetyczną stronę projektu RCL.
+    
+    Args:
+        stages: Liczba etapów projektu
+        
+    Returns:
+        Treść strony (bajty)
+    """
+    body = ''.join(
+        _STAGE.format(
+            n=n,
+            files=''.join(_FILE.format(n=n, i=i) for i in range(8)),
+            day=n % 28 + 1,
+            month=n % 12 + 1
+        )
+        for n in range(stages)
+    )
+    html = (
+        f'<html><head><title>Projekt</title></head><body>'
+        f'<nav><ul>{_BOILERPLATE}</ul></nav><div id="content">{body}</div>'
+        f'<footer><ul>{_BOILERPLATE}</ul></footer></body></html>'
+    )
+    return html.encode('utf-8')
+
+
+def parse_args():
+    """Parsuje argumenty wiersza poleceń."""
+    parser = argparse.ArgumentParser(description="Benchmark wyciągania dat modyfikacji RCL")
+    parser.add_argument('--stages', type=int, default=30, help="Liczba etapów projektu (domyślnie 30)")
+    parser.add_argument('--repeat', type=int, default=20, help="Liczba powtórzeń (domyślnie 20)")
+    return parser.parse_args()
+
+
+def main():
+    """Główna funkcja."""
+    args = parse_args()
+    html = build_project_page(args.stages)
+    monitor = RCLProjectMonitor()
+    print(f"Strona: {len(html) / 1024:.0f} KB, etapów: {args.stages}")
+    
+    baseline = None
+    results = {}
+    for parser in ('html.parser', 'lxml'):
+        label = f"DOM ({parser})"
+        timings = measure(lambda: monitor._extract_modification_dates(make_soup(html, parser)), args.repeat)
+        results[label] = monitor._extract_modification_dates(make_soup(html, parser))
+        print_row(label, timings, baseline)
+        baseline = baseline or timings
+    
+    timings = measure(lambda: extract_modification_dates(html), args.repeat)
+    results['skan surowego HTML'] = extract_modification_dates(html)
+    print_row('skan surowego HTML', timings, baseline)
+    
+    print()
+    expected = results['DOM (html.parser)']
+    for label, dates in results.items():
+        status = "OK" if dates == expected else "RÓŻNICA względem DOM (html.parser)"
+        print(f"Wyniki {label}: {len(dates or [])} dat - {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark wyciągania wierszy z tabeli wyników wyszukiwania RCL.
+
+Użycie:
+    python benchmarks/bench_rcl_search_results.py [--rows N] [--repeat N]
+    
+Porównuje poprzednie parsowanie (pełne drzewo, find_all na każdej tabeli i
+wierszu) z extract_search_rows na zapisanej stronie wyników. Opcja --rows
+powiela wiersze tabeli, żeby zasymulować wyszukiwanie tagu z setkami wyników.
+
+Dla trybu 'js' (extract_search_rows_from_page) mierzona jest tylko część po
+stronie Pythona i rozmiar danych przekazywanych z przeglądarki - skrypt
+wykonuje się w Chromium.
+"""
+
+import argparse
+import json
+import os
+import re
+
+from common import load_saved_search_page, measure, print_row
+
+from pl_monitoring.constants import HTML_PARSER_ENV
+from pl_monitoring.parsers.html_backend import make_soup
+from pl_monitoring.parsers.rcl_search_results import extract_search_rows, extract_search_rows_from_page
+
+
+def legacy_parse(html: str):
+    """Poprzednia implementacja RCLTagMonitor._parse_search_results (bez filtrowania dat)."""
+    soup = make_soup(html)
+    table = None
+    for t in soup.find_all('table'):
+        rows = t.find_all('tr')
+        if len(rows) > 1 and rows[1].find('a', href=re.compile(r'/projekt/\d+')):
+            table = t
+            break
+    if not table:
+        return []
+    
+    results = []
+    for row in table.find_all('tr')[1:]:
+        cells = row.find_all(['td', 'th'])
+        has_checkbox = bool(cells) and cells[0].find('a', href=re.compile(r'/zapisz/projekt'))
+        title_idx, number_idx, updated_idx = (1, 3, 5) if has_checkbox else (0, 2, 4)
+        if len(cells) <= updated_idx:
+            continue
+        title_link = cells[title_idx].find('a', href=re.compile(r'/projekt/\d+'))
+        if not title_link:
+            continue
+        match = re.search(r'/projekt/(\d+)', title_link.get('href', ''))
+        results.append({
+            "title": title_link.get_text(strip=True),
+            "id": int(match.group(1)) if match else None,
+            "updated_date": cells[updated_idx].get_text(strip=True),
+            "number": cells[number_idx].get_text(strip=True)
+        })
+    return results
+
+
+def multiply_rows(html: str, rows: int) -> str:
+    """
+    Powiela wiersze tabeli wyników.
+    
+    Args:
+        html: Zapisana strona wyników
+        rows: Docelowa liczba wierszy
+        
+    Returns:
+        Strona z powielonymi wierszami (kolejne ID projektów)
+    """
+    start = html.index('<tbody>', html.index('<table id="table"')) + len('<tbody>')
+    end = html.index('</tbody>', start)
+    template = html[start:end]
+    template_rows = max(1, template.count('/projekt/'))
+    
+    copies = []
+    for copy in range(max(1, rows // template_rows)):
+        copies.append(re.sub(r'/projekt/(\d+)', lambda m: f"/projekt/{int(m.group(1)) + copy * 10}", template))
+    return html[:start] + ''.join(copies) + html[end:]
+
+
+class ScriptPage:
+    """Zastępuje Playwright Page - page.evaluate zwraca wiersze przygotowane wcześniej."""
+    
+    def __init__(self, data):
+        self.data = data
+    
+    def evaluate(self, script, arg):
+        # Jak Playwright: wynik skryptu przychodzi z przeglądarki jako JSON
+        return json.loads(self.data)
+
+
+def parse_args():
+    """Parsuje argumenty wiersza poleceń."""
+    parser = argparse.ArgumentParser(description="Benchmark tabeli wyników wyszukiwania RCL")
+    parser.add_argument('--rows', type=int, default=0, help="Liczba wierszy (domyślnie jak na zapisanej stronie)")
+    parser.add_argument('--repeat', type=int, default=10, help="Liczba powtórzeń (domyślnie 10)")
+    return parser.parse_args()
+
+
+def main():
+    """Główna funkcja."""
+    args = parse_args()
+    html = load_saved_search_page()
+    if args.rows:
+        html = multiply_rows(html, args.rows)
+    
+    expected = legacy_parse(html)
+    print(f"Strona: {len(html) / 1024 / 1024:.2f} MB, wierszy: {len(expected)}")
+    
+    for parser in ('html.parser', 'lxml'):
+        os.environ[HTML_PARSER_ENV] = parser
+        print(f"\n{parser}:")
+        baseline = measure(lambda: legacy_parse(html), args.repeat)
+        print_row('poprzednie parsowanie', baseline)
+        timings = measure(lambda: extract_search_rows(html), args.repeat)
+        print_row('extract_search_rows', timings, baseline)
+    os.environ.pop(HTML_PARSER_ENV, None)
+    
+    data = json.dumps([
+        [row.project_id, row.title, row.number, row.created_date, row.updated_date]
+        for row in extract_search_rows(html)
+    ], ensure_ascii=False)
+    print(f"\npage.evaluate (tryb 'js', {len(data.encode('utf-8')) / 1024:.1f} KB zamiast "
+          f"{len(html.encode('utf-8')) / 1024:.0f} KB z page.content()):")
+    timings = measure(lambda: extract_search_rows_from_page(ScriptPage(data)), args.repeat)
+    print_row('extract_search_rows_from_page', timings, baseline)
+    
+    rows = [row.to_dict() for row in extract_search_rows(html)]
+    status = "OK" if rows == expected else "RÓŻNICA względem poprzedniego parsowania"
+    print(f"\nWyniki: {len(rows)} wierszy - {status}")
+
+
+if __name__ == "__main__":
+    main()
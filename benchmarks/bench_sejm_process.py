@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Benchmark wyciągania etapów procesu legislacyjnego ze strony Sejmu.
+
+Użycie:
+    python benchmarks/bench_sejm_process.py [--stages N] [--repeat N]
+    
+Porównuje poprzednie parsowanie etapów (słowniki, podwójne get_text na każdym
+<p>, kopiowanie pól przy formatowaniu do JSON) z extract_process_stages na
+syntetycznym długim procesie (np. ustawa budżetowa) i sprawdza, czy wynik
+zapisywany w JSON jest identyczny. Drzewo strony jest budowane raz - mierzone
+jest samo wyciąganie etapów i formatowanie do JSON.
+"""
+
+import argparse
+import re
+from typing import Dict, List, Optional
+
+from common import measure, print_row
+
+from pl_monitoring.exceptions import DataParseError
+from pl_monitoring.parsers.html_backend import make_soup
+from pl_monitoring.parsers.sejm_process import extract_process_stages
+from pl_monitoring.utils.date_utils import parse_polish_date_full
+from pl_monitoring.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_MONTHS = (
+    'stycznia', 'lutego', 'marca', 'kwietnia', 'maja', 'czerwca',
+    'lipca', 'sierpnia', 'września', 'października', 'listopada', 'grudnia'
+)
+
+_MAIN_STAGE = """
+  <li class="krok">
+    <span>{date}</span>
+    <h3>{n}. {title} <a href="druk.xsp?nr={print_number}">druk nr {print_number}</a></h3>
+    <div>
+      <p>Nr posiedzenia: <strong>{sitting}</strong></p>
+      <p>Głosowanie: za {votes_for}, przeciw {votes_against}, wstrzymało się 3</p>
+      <p>Wynik: przyjęto</p>
+      <p>Decyzja: skierowano do komisji</p>
+      <p>Komentarz: etap {n}</p>
+      <p></p>
+    </div>
+    <ul>
+      <li class="poczatek"><span>{date}</span><h4>Praca w komisjach</h4></li>
+      <li class="koniec"><span>{date}</span><h4>Sprawozdanie komisji <a href="druk.xsp?nr={report}">druk nr {report}</a></h4>
+        <div><p>Komisja Finansów Publicznych</p><p>Komisja Gospodarki</p></div></li>
+    </ul>
+  </li>
+"""
+
+
+def build_process_page(stages: int) -> str:
+    """
+    Buduje syntetyczną stronę przebiegu procesu.
+    
+    Args:
+        stages: Liczba głównych etapów (każdy ma dwa etapy pracy w komisjach)
+        
+    Returns:
+        Treść strony
+    """
+    items = []
+    for n in range(stages):
+        if n % 10 == 0:
+            items.append(f'<li class="rok">{2024 + n // 120}</li>')
+        items.append(_MAIN_STAGE.format(
+            n=n,
+            date=f"{n % 28 + 1} {_MONTHS[n % 12]} {2024 + n // 120}",
+            title="Czytanie projektu ustawy budżetowej na rok 2026",
+            print_number=1000 + n,
+            report=5000 + n,
+            sitting=n // 3 + 1,
+            votes_for=230 + n % 100,
+            votes_against=200 - n % 100
+        ))
+    return f'<html><body><ul class="proces">{"".join(items)}</ul></body></html>'
+
+
+# Poprzednia implementacja SejmProjectMonitor (punkt odniesienia i kontrola zgodności wyników)
+
+def legacy_process_stages(soup) -> List[Dict]:
+    """
+    Parsuje wszystkie etapy procesu legislacyjnego z HTML.
+    
+    Args:
+        soup: BeautifulSoup obiekt strony procesu
+        
+    Returns:
+        Lista słowników z etapami procesu
+        
+    Raises:
+        DataParseError: Jeśli wystąpi błąd podczas parsowania
+    """
+    stages = []
+    
+    try:
+        # Znajdź główną listę procesu
+        process_list = soup.find('ul', class_=re.compile(r'proces'))
+        if not process_list:
+            logger.warning("Nie znaleziono listy procesu legislacyjnego")
+            return []
+        
+        # Iteruj przez wszystkie <li> w liście procesu
+        for li in process_list.find_all('li', recursive=False):
+            # Pomiń elementy z klasą "rok"
+            if 'rok' in li.get('class', []):
+                continue
+            
+            # Główne etapy (class="krok")
+            if 'krok' in li.get('class', []):
+                stage = _legacy_main_stage(li)
+                if stage:
+                    stages.append(stage)
+            
+            # Zagnieżdżone listy (praca w komisjach)
+            nested_ul = li.find('ul')
+            if nested_ul:
+                nested_stages = _legacy_nested_stages(nested_ul)
+                stages.extend(nested_stages)
+    
+    except Exception as e:
+        raise DataParseError(f"Błąd podczas parsowania etapów procesu: {e}") from e
+    
+    return stages
+
+
+def _legacy_main_stage(li_element) -> Optional[Dict]:
+    """
+    Parsuje główny etap procesu (class="krok").
+    
+    Args:
+        li_element: Element <li class="krok">
+        
+    Returns:
+        Słownik z danymi etapu lub None
+    """
+    # Wyciągnij datę
+    date_span = li_element.find('span')
+    if not date_span:
+        return None
+    
+    date_str = date_span.get_text(strip=True)
+    date = parse_polish_date_full(date_str)
+    if not date:
+        logger.debug(f"Nie udało się sparsować daty: {date_str}")
+        return None
+    
+    # Wyciągnij typ etapu z <h3>
+    h3 = li_element.find('h3')
+    stage_type = h3.get_text(strip=True) if h3 else ""
+    
+    # Wyciągnij numer druku z linku jeśli jest
+    print_number = None
+    if h3:
+        print_link = h3.find('a', href=re.compile(r'druk\.xsp\?nr='))
+        if print_link:
+            match = re.search(r'nr=(\d+)', print_link.get('href', ''))
+            if match:
+                print_number = match.group(1)
+    
+    # Wyciągnij szczegóły z <div>
+    details = {}
+    details_div = li_element.find('div')
+    if details_div:
+        # Przejdź przez wszystkie <p> w div
+        for p in details_div.find_all('p'):
+            text = p.get_text(strip=True)
+            if not text:
+                continue
+            
+            # Nr posiedzenia
+            if 'Nr posiedzenia:' in text:
+                strong = p.find('strong')
+                if strong:
+                    details['sitting_number'] = strong.get_text(strip=True)
+            
+            # Głosowanie
+            elif text.startswith('Głosowanie:'):
+                details['voting'] = text.replace('Głosowanie:', '').strip()
+            
+            # Wynik głosowania
+            elif text.startswith('Wynik:'):
+                details['voting_result'] = text.replace('Wynik:', '').strip()
+            
+            # Decyzja
+            elif text.startswith('Decyzja:'):
+                details['decision'] = text.replace('Decyzja:', '').strip()
+            
+            # Komentarz
+            elif text.startswith('Komentarz:'):
+                details['comment'] = text.replace('Komentarz:', '').strip()
+        
+        # Zbierz wszystkie teksty jako opis
+        all_texts = [p.get_text(strip=True) for p in details_div.find_all('p') if p.get_text(strip=True)]
+        details['description'] = ' | '.join(all_texts) if all_texts else ""
+    
+    return {
+        'date': date,
+        'stage_type': stage_type,
+        'print_number': print_number,
+        **details
+    }
+
+
+def _legacy_nested_stages(ul_element) -> List[Dict]:
+    """
+    Parsuje zagnieżdżone etapy (praca w komisjach).
+    
+    Args:
+        ul_element: Element <ul> z zagnieżdżonymi etapami
+        
+    Returns:
+        Lista słowników z etapami
+    """
+    stages = []
+    
+    for li in ul_element.find_all('li', recursive=False):
+        # Etapy z datą (class="koniec" lub "poczatek")
+        if 'koniec' in li.get('class', []) or 'poczatek' in li.get('class', []):
+            stage = _legacy_nested_stage(li)
+            if stage:
+                stages.append(stage)
+    
+    return stages
+
+
+def _legacy_nested_stage(li_element) -> Optional[Dict]:
+    """
+    Parsuje zagnieżdżony etap (praca w komisjach).
+    
+    Args:
+        li_element: Element <li> z zagnieżdżonym etapem
+        
+    Returns:
+        Słownik z danymi etapu lub None
+    """
+    # Wyciągnij datę jeśli jest
+    date_span = li_element.find('span')
+    date = None
+    if date_span:
+        date_str = date_span.get_text(strip=True)
+        date = parse_polish_date_full(date_str)
+    
+    # Wyciągnij typ etapu z <h3> lub <h4>
+    h3 = li_element.find('h3')
+    h4 = li_element.find('h4')
+    stage_type = ""
+    if h4:
+        stage_type = h4.get_text(strip=True)
+    elif h3:
+        stage_type = h3.get_text(strip=True)
+    
+    # Wyciągnij numer druku z linku jeśli jest
+    print_number = None
+    element_with_link = h4 or h3
+    if element_with_link:
+        print_link = element_with_link.find('a', href=re.compile(r'druk\.xsp\?nr='))
+        if print_link:
+            match = re.search(r'nr=(\d+)', print_link.get('href', ''))
+            if match:
+                print_number = match.group(1)
+    
+    # Wyciągnij szczegóły z <div>
+    details = {}
+    details_div = li_element.find('div')
+    if details_div:
+        # Zbierz wszystkie teksty jako opis
+        all_texts = [p.get_text(strip=True) for p in details_div.find_all('p') if p.get_text(strip=True)]
+        details['description'] = ' | '.join(all_texts) if all_texts else ""
+    
+    # Jeśli nie ma daty, pomiń etap
+    if not date:
+        return None
+    
+    return {
+        'date': date,
+        'stage_type': stage_type,
+        'print_number': print_number,
+        **details
+    }
+
+
+def legacy_format_stage(stage: Dict) -> Dict:
+    """
+    Formatuje etap do zapisu w JSON (konwertuje datetime na string).
+    
+    Args:
+        stage: Słownik z danymi etapu
+        
+    Returns:
+        Słownik gotowy do zapisu w JSON
+    """
+    formatted = {
+        'date': stage['date'].strftime('%Y-%m-%d'),
+        'stage_type': stage.get('stage_type', ''),
+    }
+    
+    # Dodaj opcjonalne pola
+    if stage.get('print_number'):
+        formatted['print_number'] = stage['print_number']
+    
+    if stage.get('sitting_number'):
+        formatted['sitting_number'] = stage['sitting_number']
+    
+    if stage.get('decision'):
+        formatted['decision'] = stage['decision']
+    
+    if stage.get('voting_result'):
+        formatted['voting_result'] = stage['voting_result']
+    
+    if stage.get('description'):
+        formatted['description'] = stage['description']
+    
+    if stage.get('comment'):
+        formatted['comment'] = stage['comment']
+    
+    return formatted
+
+
+def legacy_parse(soup) -> List[Dict]:
+    """Poprzednie parsowanie etapów wraz z formatowaniem do JSON."""
+    return [legacy_format_stage(stage) for stage in legacy_process_stages(soup)]
+
+
+def parse_args():
+    """Parsuje argumenty wiersza poleceń."""
+    parser = argparse.ArgumentParser(description="Benchmark etapów procesu Sejmu")
+    parser.add_argument('--stages', type=int, default=60, help="Liczba głównych etapów (domyślnie 60)")
+    parser.add_argument('--repeat', type=int, default=20, help="Liczba powtórzeń (domyślnie 20)")
+    return parser.parse_args()
+
+
+def main():
+    """Główna funkcja."""
+    args = parse_args()
+    html = build_process_page(args.stages)
+    soup = make_soup(html)
+    print(f"Strona: {len(html) / 1024:.0f} KB, głównych etapów: {args.stages}")
+    
+    baseline = measure(lambda: legacy_parse(soup), args.repeat)
+    print_row('poprzednie parsowanie', baseline)
+    timings = measure(lambda: [stage.to_json() for stage in extract_process_stages(soup)], args.repeat)
+    print_row('extract_process_stages', timings, baseline)
+    
+    expected = legacy_parse(soup)
+    result = [stage.to_json() for stage in extract_process_stages(soup)]
+    status = "OK" if result == expected else "RÓŻNICA względem poprzedniego parsowania"
+    print(f"\nWyniki: {len(result)} etapów - {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Wspólne narzędzia dla benchmarków parsowania."""
+
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+# Dodaj główny katalog projektu do ścieżki
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pl_monitoring  # noqa: E402 - konfiguruje logger pakietu
+
+# Wyciszamy logi monitorów (np. "✓ Znaleziono") - zaburzają pomiary i wyjście
+logging.getLogger('pl_monitoring').setLevel(logging.WARNING)
+
+# Zapisana strona wyników wyszukiwania RCL (ok. 1.7 MB)
+SAVED_SEARCH_PAGE = next(PROJECT_ROOT.glob('view-source_https___legislacja.rcl.gov.pl_szukaj*.html'), None)
+
+
+class FakePage:
+    """Zastępuje Playwright Page - zwraca zapisany HTML z content()."""
+    
+    def __init__(self, html: str):
+        self.html = html
+    
+    def content(self) -> str:
+        return self.html
+
+
+def load_saved_search_page() -> str:
+    """
+    Wczytuje zapisaną stronę wyników wyszukiwania RCL.
+    
+    Returns:
+        Treść HTML strony
+    """
+    if SAVED_SEARCH_PAGE is None:
+        print("Błąd: brak zapisanej strony view-source_https___legislacja.rcl.gov.pl_szukaj*.html")
+        sys.exit(1)
+    return SAVED_SEARCH_PAGE.read_text(encoding='utf-8')
+
+
+def measure(fn: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """
+    Mierzy czas wykonania funkcji.
+    
+    Args:
+        fn: Mierzona funkcja
+        repeat: Liczba powtórzeń
+        
+    Returns:
+        Słownik z czasem minimalnym i medianą (w milisekundach)
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {'min': min(timings), 'median': statistics.median(timings)}
+
+
+def print_row(label: str, timings: Dict[str, float], baseline: Dict[str, float] = None) -> None:
+    """Wypisuje wiersz wyników (z przyspieszeniem względem baseline)."""
+    speedup = f"{baseline['median'] / timings['median']:6.1f}x" if baseline else "      -"
+    print(f"  {label:<40} min {timings['min']:9.2f} ms   mediana {timings['median']:9.2f} ms   {speedup}")
@@ -24,6 +24,14 @@ REGISTER_CSV = DATA_DIR / "Rejestr_20874195.csv"
 REGISTER_RESULTS = DATA_DIR / "register_results.json"
 FINANCIAL_RESULTS = DATA_DIR / "financial_results.json"
 
+# Cache HTTP
+HTTP_VALIDATORS_CACHE = DATA_DIR / "http_validators.json"
+RESPONSE_CACHE_DIR = DATA_DIR / "http_cache"
+
+# Trwałe profile przeglądarki (cache HTTP i ciasteczka między uruchomieniami)
+BROWSER_PROFILE_DIR = DATA_DIR / "browser_profile"
+BROWSER_STORAGE_STATE = DATA_DIR / "browser_state.json"
+
 
 def load_config(file_path: Path) -> Dict[str, Any]:
     """
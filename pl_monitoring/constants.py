@@ -10,7 +10,75 @@ SEJM_PROCESS_URL_TEMPLATE = "/Sejm10.nsf/PrzebiegProc.xsp?nr={number}"
 # Timeouty (w sekundach)
 HTTP_TIMEOUT = 10
 PLAYWRIGHT_TIMEOUT = 30000
-PLAYWRIGHT_WAIT_TIMEOUT = 2000
+RCL_RESULTS_WAIT_TIMEOUT = 5000  # Limit (ms) oczekiwania na tabelę wyników po załadowaniu strony
+
+# Pula połączeń HTTP (keep-alive)
+HTTP_POOL_SIZE = 10  # Maksymalna liczba połączeń utrzymywanych dla jednego hosta
+HTTP_POOL_HOSTS = 10  # Liczba hostów, dla których przechowujemy osobne pule
+DEFAULT_MAX_WORKERS = 4  # Domyślna liczba równoległych pobrań stron z jednego hosta
+DEFAULT_ASYNC_CONCURRENCY = 10  # Domyślny limit równoległych żądań w trybie asyncio
+
+# Pula przeglądarek (Playwright) dla wyszukiwań RCL
+RCL_BROWSER_POOL_SIZE = 3  # Liczba równolegle pracujących przeglądarek
+RCL_ASYNC_BROWSER_PAGES = 5  # Liczba stron sterowanych równolegle w jednej przeglądarce (tryb asyncio)
+RCL_BROWSER_MAX_NAVIGATIONS = 50  # Po tylu nawigacjach strona jest zamykana i otwierana od nowa (zwalnia pamięć renderera)
+RCL_BROWSER_MAX_JS_HEAP_MB = 256  # Limit sterty JS strony (MB), po przekroczeniu strona jest odświeżana
+RCL_BROWSER_CRASH_RETRIES = 1  # Ile razy powtórzyć zadanie po awarii strony przeglądarki
+RCL_SEARCH_FORM_SELECTOR = 'form#searchForm'  # Formularz wyszukiwania gotowy do wypełnienia
+RCL_RESULT_COUNT_TEXT = 'Projekty według wybranych kryteriów'  # Nagłówek z liczbą wyników
+RCL_SEARCH_RESULTS_SELECTOR = f'table#table, :text("{RCL_RESULT_COUNT_TEXT}")'  # Wyniki wyszukiwania
+RCL_BROWSER_EXTRACTION_MODES = ('js', 'html')  # Wiersze skryptem w przeglądarce albo z page.content() + BeautifulSoup
+DEFAULT_RCL_BROWSER_EXTRACTION = 'js'
+RCL_SEARCH_PAGE_SIZE = 100  # Wierszy na stronę wyników (parametr pSize; RCL pozwala na 10, 50, 100 i 0 = wszystkie)
+RCL_PAGE_SIZE_PARAM = 'pSize'
+RCL_PAGE_SIZE_ALL = '0'  # pSize dla wszystkich wyników na jednej stronie (opcja "wszystkie")
+RCL_PAGE_SIZE_STEPS = (10, 50, 100)  # Kolejne rozmiary strony przy powiększaniu wyników (na końcu RCL_PAGE_SIZE_ALL)
+RCL_NARROW_WINDOW_DAYS = 7  # Okno monitoringu (kończące się najwyżej tyle dni temu), dla którego wystarcza mała strona wyników
+RCL_NARROW_WINDOW_PAGE_SIZE = 10  # pSize dla wąskiego okna - zwykle wystarcza, a jeśli nie, następny krok to 50
+
+# Zasoby blokowane w sesjach Playwright (parsery ich nie używają)
+# Style nie są blokowane - od nich zależy widoczność zakładek i przycisków formularza RCL
+BROWSER_BLOCKED_RESOURCE_TYPES = ('image', 'media', 'font')
+BROWSER_BLOCKED_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'facebook.net',
+    'hotjar.com',
+)
+
+# Dyskowy cache odpowiedzi HTTP
+RESPONSE_CACHE_MAX_BYTES = 100 * 1024 * 1024  # Łączny limit rozmiaru skompresowanych stron
+RESPONSE_CACHE_DEFAULT_TTL = 15 * 60  # TTL (w sekundach) dla hostów spoza RESPONSE_CACHE_TTL_BY_HOST
+RESPONSE_CACHE_TTL_BY_HOST = {
+    'legislacja.rcl.gov.pl': 60 * 60,
+    'www.sejm.gov.pl': 30 * 60,
+}
+
+# Tempo i współbieżność żądań per host (token bucket + AIMD)
+DEFAULT_HOST_RATE_LIMIT = 5.0  # Żądań na sekundę dla hostów spoza HOST_RATE_LIMITS
+HOST_RATE_LIMITS = {
+    'legislacja.rcl.gov.pl': 5.0,
+    'www.sejm.gov.pl': 5.0,
+}
+HOST_RATE_BURST = 5  # Liczba żądań, które można wysłać naraz po okresie bezczynności
+HOST_INITIAL_CONCURRENCY = 2  # Początkowy limit jednoczesnych żądań do hosta
+HOST_MAX_CONCURRENCY = HTTP_POOL_SIZE  # Górna granica limitu (nie więcej niż pula połączeń)
+HOST_LATENCY_TARGET = 2.0  # Odpowiedzi szybsze niż tyle sekund zwiększają limit współbieżności
+
+# Ponawianie żądań
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+MAX_RETRY_AFTER = 60  # Maksymalny honorowany czas z nagłówka Retry-After (w sekundach)
+RUN_RETRY_BUDGET = 50  # Łączna liczba ponowień żądań w jednym uruchomieniu
+
+# Bezpiecznik (circuit breaker) per host
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5  # Kolejne błędy, po których host jest uznawany za niedostępny
+CIRCUIT_BREAKER_PROBE_INTERVAL = 30  # Odstęp (w sekundach) między żądaniami próbnymi
+
+# Parser HTML (BeautifulSoup)
+DEFAULT_HTML_PARSER = 'lxml'
+HTML_PARSER_BACKENDS = ('lxml', 'html.parser', 'html5lib')
+HTML_PARSER_ENV = 'PL_MONITORING_HTML_PARSER'  # Zmienna środowiskowa wybierająca parser
 
 # Domyślne wartości
 DEFAULT_DATE_FORMAT = "%Y-%m-%d"
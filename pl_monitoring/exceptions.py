@@ -16,11 +16,42 @@ class DataFetchError(PLMonitoringError):
     pass
 
 
+class CacheMissError(DataFetchError):
+    """Brak strony w cache odpowiedzi w trybie offline."""
+    pass
+
+
+class HostUnavailableError(DataFetchError):
+    """Host uznany za niedostępny przez bezpiecznik - żądanie nie zostało wysłane."""
+    
+    def __init__(self, host: str):
+        """
+        Args:
+            host: Nazwa niedostępnego hosta
+        """
+        super().__init__(f"Host niedostępny: {host}")
+        self.host = host
+
+
 class DataParseError(PLMonitoringError):
     """Błąd podczas parsowania danych."""
     pass
 
 
+class PageNotModified(PLMonitoringError):
+    """Strona nie zmieniła się od ostatniego pobrania (HTTP 304)."""
+    
+    def __init__(self, url: str, payload):
+        """
+        Args:
+            url: Adres URL strony
+            payload: Wynik parsowania zapisany przy poprzednim pobraniu
+        """
+        super().__init__(f"Strona nie zmieniła się od ostatniego pobrania: {url}")
+        self.url = url
+        self.payload = payload
+
+
 class ValidationError(PLMonitoringError):
     """Błąd walidacji danych wejściowych."""
     pass
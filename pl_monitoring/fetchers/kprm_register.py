@@ -1,26 +1,42 @@
 """Pobieranie rejestru prac legislacyjnych z KPRM."""
 
 import os
+import time
 from pathlib import Path
+from typing import Optional
+
+import requests
 from playwright.sync_api import BrowserContext
 
 from ..constants import KPRM_REGISTER_URL, KPRM_DIRECT_CSV_URL
-from ..config import REGISTER_CSV, DATA_DIR
-from ..exceptions import KPRMConnectionError
-from ..utils.http_client import get_browser_context
+from ..config import REGISTER_CSV, DATA_DIR, BROWSER_STORAGE_STATE
+from ..exceptions import KPRMConnectionError, DataFetchError
+from ..utils.browser_launcher import BrowserLauncher
+from ..utils.http_client import HTTPClient, get_default_http_client, retry_request
 from ..utils.logger import get_logger
+from ..utils.validator_cache import ValidatorCache
 
 logger = get_logger(__name__)
 
 
 class KPRMRegisterFetcher:
-    """Klasa do pobierania pliku CSV z rejestru prac legislacyjnych KPRM."""
+    """
+    Klasa do pobierania pliku CSV z rejestru prac legislacyjnych KPRM.
+    
+    Plik jest pobierany zwykłym żądaniem HTTP. Walidatory odpowiedzi
+    (ETag/Last-Modified) są zapisywane obok pliku CSV, więc kolejne pobranie
+    wysyła żądanie warunkowe i przy odpowiedzi 304 nie pobiera pliku ponownie.
+    Przeglądarka jest uruchamiana tylko wtedy, gdy pobranie przez HTTP się nie uda.
+    """
     
     def __init__(
         self,
         output_file: Path = None,
         register_url: str = KPRM_REGISTER_URL,
-        direct_url: str = KPRM_DIRECT_CSV_URL
+        direct_url: str = KPRM_DIRECT_CSV_URL,
+        launcher: Optional[BrowserLauncher] = None,
+        http_client: Optional[HTTPClient] = None,
+        validator_cache: Optional[ValidatorCache] = None
     ):
         """
         Inicjalizuje fetcher.
@@ -29,41 +45,115 @@ class KPRMRegisterFetcher:
             output_file: Ścieżka do pliku wyjściowego (domyślnie z config.py)
             register_url: URL strony rejestru KPRM
             direct_url: Bezpośredni URL do pliku CSV
+            launcher: Launcher przeglądarki (domyślnie headless ze stanem sesji w BROWSER_STORAGE_STATE)
+            http_client: Klient HTTP do pobrania pliku (domyślnie współdzielony)
+            validator_cache: Cache walidatorów ETag/Last-Modified pliku (domyślnie
+                <output_file>.validators.json obok pliku CSV)
         """
-        self.output_file = output_file or REGISTER_CSV
+        self.output_file = Path(output_file or REGISTER_CSV)
         self.register_url = register_url
         self.direct_url = direct_url
+        self.launcher = launcher or BrowserLauncher(storage_state=BROWSER_STORAGE_STATE)
+        self.http_client = http_client or get_default_http_client()
+        self.validator_cache = validator_cache or ValidatorCache(
+            cache_file=self.output_file.with_name(f"{self.output_file.name}.validators.json")
+        )
+        self.unchanged = False
         DATA_DIR.mkdir(exist_ok=True)
     
     def download(self) -> bool:
         """
-        Pobiera plik CSV z rejestru prac legislacyjnych.
+        Pobiera plik CSV z rejestru prac legislacyjnych (jeśli zmienił się od ostatniego pobrania).
+        
+        Po wywołaniu atrybut unchanged mówi, czy rejestr był bez zmian i plik
+        nie został pobrany ponownie.
         
         Returns:
-            True jeśli pobieranie się powiodło, False w przeciwnym razie
+            True jeśli plik jest aktualny (pobrany lub bez zmian), False w przeciwnym razie
             
         Raises:
             KPRMConnectionError: Jeśli nie udało się pobrać pliku
         """
         logger.info("Pobieranie pliku CSV z rejestru prac legislacyjnych...")
+        self.unchanged = False
         
-        browser, context = get_browser_context(headless=False)
+        if self._try_http_download():
+            return True
         
+        logger.info("Pobranie przez HTTP nie powiodło się - uruchamiam przeglądarkę")
         try:
-            # Spróbuj najpierw bezpośrednie pobranie
-            if self._try_direct_download(context):
-                return True
-            
-            # Jeśli bezpośrednie nie zadziałało, spróbuj przez stronę
-            return self._download_via_page(context, browser)
+            with self.launcher.session() as context:
+                # Spróbuj najpierw bezpośrednie pobranie
+                if self._try_direct_download(context):
+                    return True
+                
+                # Jeśli bezpośrednie nie zadziałało, spróbuj przez stronę
+                return self._download_via_page(context, context.browser)
             
         except KPRMConnectionError:
             raise
         except Exception as e:
             logger.exception("Nieoczekiwany błąd podczas pobierania pliku")
             raise KPRMConnectionError(f"Błąd podczas pobierania pliku: {e}") from e
-        finally:
-            browser.close()
+    
+    def _try_http_download(self) -> bool:
+        """
+        Pobiera plik żądaniem warunkowym HTTP (bez przeglądarki).
+        
+        Returns:
+            True jeśli plik jest aktualny (pobrany lub 304), False jeśli trzeba użyć przeglądarki
+        """
+        url = self.direct_url
+        # Bez pliku na dysku odpowiedź 304 nic by nie dała - pobierz całość
+        headers = self.validator_cache.conditional_headers(url) if self.output_file.exists() else {}
+        
+        try:
+            logger.debug(f"Pobieranie przez HTTP z: {url}")
+            response = retry_request(
+                lambda: self.http_client.fetch(url, headers=headers, stream=True),
+                max_retries=3,
+                retry_delay=1.0,
+                retry_budget=self.http_client.retry_budget
+            )
+            with response:
+                if response.status_code == 304:
+                    self.validator_cache.record_hit()
+                    self.unchanged = True
+                    logger.info(f"✓ Rejestr bez zmian (304), pozostawiono plik: {self.output_file}")
+                    return True
+                
+                # Strona HTML (np. ochrona przed botami) zamiast pliku CSV
+                if 'html' in response.headers.get('Content-Type', '').lower():
+                    logger.debug("Serwer zwrócił stronę HTML zamiast pliku CSV")
+                    return False
+                
+                self._save_stream(response)
+        except (requests.RequestException, DataFetchError, OSError) as e:
+            logger.debug(f"Pobranie przez HTTP nie powiodło się: {e}")
+            return False
+        
+        self.validator_cache.record_miss()
+        self.validator_cache.remember_validators(url, response.headers)
+        self.validator_cache.store_payload(url, {'size': os.path.getsize(self.output_file)})
+        self.validator_cache.save()
+        
+        file_size_mb = os.path.getsize(self.output_file) / (1024 * 1024)
+        logger.info(f"✓ Pobrano plik przez HTTP: {self.output_file}")
+        logger.info(f"  Rozmiar: {file_size_mb:.2f} MB")
+        return True
+    
+    def _save_stream(self, response: requests.Response) -> None:
+        """Zapisuje treść odpowiedzi do pliku tymczasowego i podmienia nim plik wyjściowy."""
+        tmp_file = self.output_file.with_name(f"{self.output_file.name}.part")
+        try:
+            with open(tmp_file, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+            os.replace(tmp_file, self.output_file)
+        except BaseException:
+            # Przerwane pobranie nie może nadpisać poprzedniej wersji rejestru
+            tmp_file.unlink(missing_ok=True)
+            raise
     
     def _try_direct_download(self, context: BrowserContext) -> bool:
         """Próbuje pobrać plik bezpośrednio z URL."""
@@ -92,7 +182,9 @@ class KPRMRegisterFetcher:
         
         try:
             logger.debug(f"Ładowanie strony: {self.register_url}")
+            started = time.monotonic()
             page.goto(self.register_url, wait_until="load", timeout=60000)
+            logger.info(f"Pierwsza nawigacja (strona rejestru) trwała {time.monotonic() - started:.2f}s")
             
             logger.debug("Oczekiwanie na załadowanie JavaScript...")
             page.wait_for_timeout(5000)
@@ -130,6 +222,8 @@ class KPRMRegisterFetcher:
                 return True
             else:
                 raise KPRMConnectionError(f"Nie udało się pobrać pliku. Status: {response.status}")
+        finally:
+            page.close()
     
     def _find_download_link(self, page) -> object:
         """Znajduje link do pobrania pliku CSV."""
@@ -4,6 +4,17 @@ from .rcl_project_monitor import RCLProjectMonitor
 from .rcl_tag_monitor import RCLTagMonitor
 from .rcl_search_monitor import RCLSearchMonitor
 from .sejm_project_monitor import SejmProjectMonitor
+from .async_sejm_project_monitor import AsyncSejmProjectMonitor
+from .async_rcl_tag_monitor import AsyncRCLTagMonitor
+from .async_rcl_search_monitor import AsyncRCLSearchMonitor
 
-__all__ = ['RCLProjectMonitor', 'RCLTagMonitor', 'RCLSearchMonitor', 'SejmProjectMonitor']
+__all__ = [
+    'RCLProjectMonitor',
+    'RCLTagMonitor',
+    'RCLSearchMonitor',
+    'SejmProjectMonitor',
+    'AsyncSejmProjectMonitor',
+    'AsyncRCLTagMonitor',
+    'AsyncRCLSearchMonitor',
+]
 
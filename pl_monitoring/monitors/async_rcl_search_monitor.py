@@ -0,0 +1,138 @@
+"""Asynchroniczne wyszukiwanie projektów RCL po identyfikatorach zewnętrznych (asyncio + playwright.async_api)."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from ..constants import RCL_BASE_URL, DEFAULT_RCL_BROWSER_EXTRACTION, RCL_ASYNC_BROWSER_PAGES
+from ..exceptions import RCLConnectionError
+from ..utils.async_rcl_browser_manager import AsyncRCLBrowserManager
+from ..utils.http_client import HTTPClient
+from ..utils.logger import get_logger
+from .async_rcl_tag_monitor import _AsyncRCLGatherMixin
+from .rcl_search_monitor import RCLSearchMonitor, _SEARCH_DESCRIPTIONS, _SEARCH_LABELS
+
+logger = get_logger(__name__)
+
+
+class AsyncRCLSearchMonitor(_AsyncRCLGatherMixin, RCLSearchMonitor):
+    """
+    Wariant RCLSearchMonitor działający w pętli zdarzeń asyncio.
+    
+    Wyszukiwania wymagające przeglądarki są wykonywane równolegle na wielu
+    stronach jednej przeglądarki (AsyncRCLBrowserManager). Parsowanie i format
+    wyników (projects.json) są identyczne jak w RCLSearchMonitor.
+    """
+    
+    def __init__(
+        self,
+        load_queries_fn: Optional[Callable[[], List[Dict]]] = None,
+        output_file: Optional[Path] = None,
+        base_url: str = RCL_BASE_URL,
+        http_client: Optional[HTTPClient] = None,
+        browser_manager: Optional[AsyncRCLBrowserManager] = None,
+        browser_extraction: str = DEFAULT_RCL_BROWSER_EXTRACTION,
+        max_concurrency: int = RCL_ASYNC_BROWSER_PAGES
+    ):
+        """
+        Inicjalizuje asynchroniczny monitor wyszukiwania.
+        
+        Args:
+            load_queries_fn: Funkcja do wczytania zapytań (dependency injection)
+            output_file: Plik wyjściowy dla wyników (domyślnie data/rcl_search_results_YYYY-MM-DD.json)
+            base_url: Bazowy URL RCL
+            http_client: Klient HTTP do pobierania stron wyników (domyślnie współdzielony)
+            browser_manager: Asynchroniczny manager przeglądarki (domyślnie tworzony na czas amonitor())
+            browser_extraction: Sposób wyciągania wierszy ze strony w przeglądarce ('js' lub 'html')
+            max_concurrency: Maksymalna liczba jednoczesnych wyszukiwań (i stron przeglądarki)
+        """
+        super().__init__(
+            load_queries_fn=load_queries_fn,
+            output_file=output_file,
+            base_url=base_url,
+            http_client=http_client,
+            browser_extraction=browser_extraction
+        )
+        self.max_concurrency = max(1, max_concurrency)
+        self.browser_manager = browser_manager or AsyncRCLBrowserManager(
+            active_tab='tab2', max_pages=self.max_concurrency
+        )
+        self.waits = self.browser_manager.waits
+    
+    async def amonitor(self, start_date: datetime, end_date: datetime) -> List[Dict]:
+        """
+        Monitoruje projekty w podanym zakresie dat, wykonując wyszukiwania równolegle.
+        
+        Args:
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista znalezionych projektów w formacie gotowym do projects.json
+        """
+        queries = self.load_queries()
+        
+        logger.info("Wyszukiwanie projektów RCL po identyfikatorach zewnętrznych (async)")
+        logger.info(f"Zakres dat: {start_date.strftime('%Y-%m-%d')} - {end_date.strftime('%Y-%m-%d')}")
+        logger.info(f"Znaleziono {len(queries)} zapytanie(ń) do wykonania")
+        
+        searches = self._plan_searches(queries)
+        for query_idx, kind, value in searches:
+            logger.info(f"Zapytanie {query_idx}/{len(queries)}: Wyszukiwanie po {_SEARCH_LABELS[kind]}: {value}")
+        
+        search_results = await self._agather_http(
+            lambda search: self._search_identifier_http_safe(*search, start_date, end_date),
+            searches
+        )
+        
+        browser_searches = [idx for idx, results in enumerate(search_results) if results is None]
+        if browser_searches:
+            logger.info(f"Wyszukiwanie {len(browser_searches)} zapytań w przeglądarce (async)")
+            browser_results = await self._agather_browser(
+                lambda idx: self._arun_browser_search(*searches[idx][1:], start_date, end_date),
+                browser_searches
+            )
+            for idx, results in zip(browser_searches, browser_results):
+                search_results[idx] = results
+        
+        return self._store_search_results(search_results, start_date, end_date)
+    
+    async def _arun_browser_search(
+        self,
+        kind: str,
+        value: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """
+        Asynchroniczny odpowiednik _run_browser_search (na stronie wypożyczonej z managera).
+        
+        Args:
+            kind: Rodzaj wyszukiwania ('ue_act' lub 'kprm')
+            value: Numer aktu UE lub numer z wykazu KPRM
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista znalezionych projektów (pusta przy błędzie)
+        """
+        description = f"{_SEARCH_DESCRIPTIONS[kind]} {value}"
+        search_url = self._identifier_search_url(kind, value, start_date, end_date)
+        
+        async def search(page) -> List[Dict]:
+            results = await self._asearch_url_browser(page, search_url, description, start_date, end_date)
+            if results is not None:
+                return results
+            
+            # Strona po nawigacji ma pola wypełnione z URL - wyczyść formularz przed wypełnieniem
+            await self.browser_manager.clear_search_form(page)
+            return await self._asearch_form(page, kind, value, start_date, end_date)
+        
+        try:
+            return await self.browser_manager.run(search) or []
+        except RCLConnectionError as e:
+            logger.error(f"Błąd podczas wyszukiwania dla {description}: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Nieoczekiwany błąd podczas wyszukiwania dla {description}: {e}")
+            return []
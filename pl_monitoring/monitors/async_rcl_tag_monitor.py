@@ -0,0 +1,167 @@
+"""Asynchroniczny monitoring aktów prawnych w RCL na podstawie tagów (asyncio + playwright.async_api)."""
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from ..constants import RCL_BASE_URL, DEFAULT_RCL_BROWSER_EXTRACTION, RCL_ASYNC_BROWSER_PAGES
+from ..exceptions import RCLConnectionError, DataParseError
+from ..utils.async_rcl_browser_manager import AsyncRCLBrowserManager
+from ..utils.http_client import HTTPClient
+from ..utils.logger import get_logger
+from .rcl_tag_monitor import RCLTagMonitor
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class _AsyncRCLGatherMixin:
+    """Równoległe wykonanie wyszukiwań RCL (HTTP w puli wątków, przeglądarka na wielu stronach)."""
+    
+    def _create_browser_pool(self, active_tab: str) -> None:
+        """Monitory asynchroniczne nie używają RCLBrowserPool - przeglądarką zarządza AsyncRCLBrowserManager."""
+        return None
+    
+    async def _agather_http(self, fn: Callable[[T], R], items: List[T]) -> List[R]:
+        """
+        Wykonuje synchroniczne wyszukiwania HTTP w puli wątków pętli zdarzeń (max_concurrency naraz).
+        
+        Args:
+            fn: Funkcja wyszukująca (blokująca - klient HTTP)
+            items: Elementy do wyszukania
+            
+        Returns:
+            Wyniki w kolejności elementów
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run(item: T) -> R:
+            async with semaphore:
+                return await loop.run_in_executor(None, fn, item)
+        
+        # asyncio.gather zwraca wyniki w kolejności przekazanych korutyn
+        return list(await asyncio.gather(*(run(item) for item in items)))
+    
+    async def _agather_browser(self, fn: Callable[[T], Awaitable[R]], items: List[T]) -> List[R]:
+        """
+        Wykonuje wyszukiwania w przeglądarce równolegle (limit stron w AsyncRCLBrowserManager).
+        
+        Przeglądarka uruchomiona poza monitorem nie jest zamykana.
+        
+        Args:
+            fn: Korutyna wyszukująca
+            items: Elementy do wyszukania
+            
+        Returns:
+            Wyniki w kolejności elementów
+        """
+        if self.browser_manager.started:
+            results = await asyncio.gather(*(fn(item) for item in items))
+        else:
+            async with self.browser_manager:
+                results = await asyncio.gather(*(fn(item) for item in items))
+        self.browser_manager.log_stats()
+        return list(results)
+
+
+class AsyncRCLTagMonitor(_AsyncRCLGatherMixin, RCLTagMonitor):
+    """
+    Wariant RCLTagMonitor działający w pętli zdarzeń asyncio.
+    
+    Strony wyników są najpierw pobierane klientem HTTP (w puli wątków pętli),
+    a tagi wymagające przeglądarki są wyszukiwane równolegle na wielu stronach
+    jednej przeglądarki (AsyncRCLBrowserManager). Parsowanie i format wyników
+    są identyczne jak w RCLTagMonitor.
+    """
+    
+    def __init__(
+        self,
+        load_tags_fn: Optional[Callable[[], List[Dict]]] = None,
+        output_file: Optional[Path] = None,
+        base_url: str = RCL_BASE_URL,
+        http_client: Optional[HTTPClient] = None,
+        browser_manager: Optional[AsyncRCLBrowserManager] = None,
+        browser_extraction: str = DEFAULT_RCL_BROWSER_EXTRACTION,
+        max_concurrency: int = RCL_ASYNC_BROWSER_PAGES
+    ):
+        """
+        Inicjalizuje asynchroniczny monitor tagów.
+        
+        Args:
+            load_tags_fn: Funkcja do wczytania tagów (dependency injection)
+            output_file: Plik wyjściowy dla wyników
+            base_url: Bazowy URL RCL
+            http_client: Klient HTTP do pobierania stron wyników (domyślnie współdzielony)
+            browser_manager: Asynchroniczny manager przeglądarki; już uruchomiony (np. przez
+                serwis asyncio) jest używany bez zamykania, domyślnie tworzony na czas amonitor()
+            browser_extraction: Sposób wyciągania wierszy ze strony w przeglądarce ('js' lub 'html')
+            max_concurrency: Maksymalna liczba jednoczesnych wyszukiwań (i stron przeglądarki)
+            
+        Raises:
+            ConfigurationError: Jeśli podano nieznany sposób wyciągania wierszy
+        """
+        super().__init__(
+            load_tags_fn=load_tags_fn,
+            output_file=output_file,
+            base_url=base_url,
+            http_client=http_client,
+            browser_extraction=browser_extraction
+        )
+        self.max_concurrency = max(1, max_concurrency)
+        self.browser_manager = browser_manager or AsyncRCLBrowserManager(
+            active_tab='tab1', max_pages=self.max_concurrency
+        )
+        self.waits = self.browser_manager.waits
+    
+    async def amonitor(self, start_date: datetime, end_date: datetime) -> List[Dict]:
+        """
+        Monitoruje akty prawne z tagami w podanym zakresie dat, wyszukując tagi równolegle.
+        
+        Args:
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista znalezionych aktów prawnych (w kolejności tagów z konfiguracji)
+        """
+        tags = self._load_and_log_tags(start_date, end_date)
+        tag_ids = [tag['id'] for tag in tags]
+        
+        def search_http(tag_id: int) -> Optional[List[Dict]]:
+            try:
+                return self._search_by_tag_http(
+                    tag_id, self._tag_search_url(tag_id, start_date, end_date), start_date, end_date
+                )
+            except (RCLConnectionError, DataParseError) as e:
+                logger.error(f"Błąd podczas wyszukiwania dla tagu {tag_id}: {e}")
+                return []
+        
+        http_results = await self._agather_http(search_http, tag_ids)
+        results_by_tag = {
+            tag_id: results for tag_id, results in zip(tag_ids, http_results) if results is not None
+        }
+        
+        browser_tags = [tag_id for tag_id, results in zip(tag_ids, http_results) if results is None]
+        if browser_tags:
+            logger.info(f"Wyszukiwanie {len(browser_tags)} tag(ów) w przeglądarce (async)")
+            
+            async def search_browser(tag_id: int) -> Optional[List[Dict]]:
+                search_url = self._tag_search_url(tag_id, start_date, end_date)
+                try:
+                    return await self.browser_manager.run(
+                        lambda page: self._asearch_by_tag_browser(page, tag_id, search_url, start_date, end_date)
+                    )
+                except RCLConnectionError as e:
+                    logger.error(f"Błąd podczas wyszukiwania dla tagu {tag_id}: {e}")
+                    return None
+            
+            browser_results = await self._agather_browser(search_browser, browser_tags)
+            results_by_tag.update(
+                {tag_id: results for tag_id, results in zip(browser_tags, browser_results) if results is not None}
+            )
+        
+        return self._store_tag_results(tags, results_by_tag, start_date, end_date)
@@ -0,0 +1,286 @@
+"""Asynchroniczny monitoring projektów ustaw w Sejmie (asyncio + aiohttp)."""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import List, Dict, Optional, Callable, Mapping, Tuple
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp jest zależnością opcjonalną: pip install "pl-monitoring[async]"
+    aiohttp = None
+
+from ..constants import SEJM_WWW_BASE_URL, HTTP_TIMEOUT, DEFAULT_ASYNC_CONCURRENCY
+from ..exceptions import (
+    ConfigurationError,
+    SejmConnectionError,
+    HostUnavailableError,
+    DataParseError,
+    PageNotModified,
+)
+from ..parsers.html_backend import make_soup
+from ..parsers.sejm_process import ProcessStage
+from ..utils.http_client import HTTPClient, async_retry_request, get_http_headers
+from ..utils.logger import get_logger
+from ..utils.rate_control import parse_retry_after
+from ..utils.validator_cache import ValidatorCache
+from .sejm_project_monitor import SejmProjectMonitor
+
+logger = get_logger(__name__)
+
+
+class AsyncSejmProjectMonitor(SejmProjectMonitor):
+    """
+    Wariant SejmProjectMonitor pobierający strony przebiegu procesu równolegle w asyncio.
+    
+    Parsowanie etapów i format wyników są identyczne jak w SejmProjectMonitor.
+    """
+    
+    def __init__(
+        self,
+        load_projects_fn: Optional[Callable[[], List[Dict]]] = None,
+        save_projects_fn: Optional[Callable[[List[Dict]], None]] = None,
+        base_url: str = SEJM_WWW_BASE_URL,
+        http_client: Optional[HTTPClient] = None,
+        max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+        session: Optional["aiohttp.ClientSession"] = None,
+        validator_cache: Optional[ValidatorCache] = None
+    ):
+        """
+        Inicjalizuje asynchroniczny monitor projektów Sejm.
+        
+        Args:
+            load_projects_fn: Funkcja do wczytania projektów (dependency injection)
+            save_projects_fn: Funkcja do zapisania projektów (dependency injection)
+            base_url: Bazowy URL strony Sejmu
+            http_client: Klient HTTP używany przez synchroniczną metodę monitor()
+            max_concurrency: Maksymalna liczba jednoczesnych żądań do Sejmu
+            session: Istniejąca sesja aiohttp (np. z serwisu asyncio); domyślnie
+                tworzona na czas wywołania amonitor()
+            validator_cache: Cache walidatorów ETag/Last-Modified dla żądań warunkowych
+                (domyślnie trwały cache w katalogu data/, wspólny ze ścieżką synchroniczną)
+                
+        Raises:
+            ConfigurationError: Jeśli biblioteka aiohttp nie jest zainstalowana
+        """
+        if aiohttp is None:
+            raise ConfigurationError(
+                "AsyncSejmProjectMonitor wymaga biblioteki aiohttp: pip install \"pl-monitoring[async]\""
+            )
+        
+        super().__init__(
+            load_projects_fn=load_projects_fn,
+            save_projects_fn=save_projects_fn,
+            base_url=base_url,
+            http_client=http_client,
+            validator_cache=validator_cache
+        )
+        self.max_concurrency = max(1, max_concurrency)
+        self.session = session
+    
+    async def amonitor(self, start_date: datetime, end_date: datetime) -> List[Dict]:
+        """
+        Monitoruje projekty Sejm w podanym zakresie dat, pobierając strony równolegle.
+        
+        Args:
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista projektów z informacją o zmianach (w kolejności z konfiguracji)
+        """
+        all_projects = self.load_projects()
+        sejm_projects = self._prepare_projects(all_projects, start_date, end_date)
+        
+        if not sejm_projects:
+            return []
+        
+        logger.info(f"Asynchroniczne pobieranie stron procesu (max_concurrency={self.max_concurrency})")
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        if self.session is not None:
+            updated_projects = await self._acheck_projects(
+                self.session, semaphore, sejm_projects, start_date, end_date
+            )
+        else:
+            async with self._create_session() as session:
+                updated_projects = await self._acheck_projects(
+                    session, semaphore, sejm_projects, start_date, end_date
+                )
+        
+        self._store_results(all_projects)
+        self.validator_cache.save()
+        self.validator_cache.log_stats()
+        self.http_client.rate_controller.log_stats()
+        self.http_client.circuit_breaker.log_stats()
+        self._single_flight.log_stats('stron procesu Sejm')
+        self._report_skipped()
+        
+        return updated_projects
+    
+    def _create_session(self) -> "aiohttp.ClientSession":
+        """Tworzy sesję aiohttp z limitem połączeń do hosta równym max_concurrency."""
+        connector = aiohttp.TCPConnector(limit_per_host=self.max_concurrency)
+        return aiohttp.ClientSession(
+            headers=get_http_headers(),
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+            connector=connector
+        )
+    
+    async def _acheck_projects(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        projects: List[Dict],
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """
+        Sprawdza wszystkie projekty równolegle (z limitem semafora).
+        
+        Args:
+            session: Sesja aiohttp
+            semaphore: Semafor ograniczający liczbę jednoczesnych żądań
+            projects: Projekty Sejm do sprawdzenia
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista zaktualizowanych projektów (kolejność zgodna z projects)
+        """
+        async def check(project: Dict) -> Dict:
+            project_id = str(project.get('id'))
+            logger.debug(f"Sprawdzam: {project.get('title', f'Projekt {project_id}')} (ID: {project_id})")
+            
+            try:
+                stages = await self._single_flight.ado(
+                    self._process_url(project_id),
+                    lambda: self._aget_stages(session, semaphore, project_id)
+                )
+            except HostUnavailableError:
+                logger.warning(f"  Pominięto projekt {project_id} (host niedostępny)")
+                self.skipped_projects.append(project_id)
+                return project
+            except SejmConnectionError as e:
+                logger.error(f"Błąd połączenia dla projektu {project_id}: {e}")
+                return project
+            except DataParseError as e:
+                logger.error(f"Błąd parsowania etapów dla projektu {project_id}: {e}")
+                return project
+            
+            return self._update_project(project, stages, start_date, end_date)
+        
+        # asyncio.gather zwraca wyniki w kolejności przekazanych korutyn
+        return list(await asyncio.gather(*(check(project) for project in projects)))
+    
+    async def _aget_stages(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        print_number: str
+    ) -> Optional[List[ProcessStage]]:
+        """
+        Asynchronicznie pobiera stronę przebiegu procesu i zwraca etapy (z cache walidatorów przy 304).
+        
+        Args:
+            session: Sesja aiohttp
+            semaphore: Semafor ograniczający liczbę jednoczesnych żądań
+            print_number: Numer druku (ID projektu)
+            
+        Returns:
+            Lista etapów procesu lub None jeśli nie udało się pobrać strony
+            
+        Raises:
+            SejmConnectionError: Jeśli nie udało się pobrać strony
+            HostUnavailableError: Jeśli Sejm uznano za niedostępny
+            DataParseError: Jeśli wystąpi błąd podczas parsowania
+        """
+        try:
+            soup = await self._afetch_process_page(session, semaphore, print_number)
+        except PageNotModified as e:
+            logger.debug(f"  Strona procesu {print_number} bez zmian (304), używam zapisanych etapów")
+            return self._stages_from_payload(e.payload)
+        
+        return self._stages_from_soup(print_number, soup)
+    
+    async def _afetch_process_page(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        print_number: str
+    ) -> Optional[BeautifulSoup]:
+        """
+        Asynchronicznie pobiera stronę HTML przebiegu procesu legislacyjnego.
+        
+        Args:
+            session: Sesja aiohttp
+            semaphore: Semafor ograniczający liczbę jednoczesnych żądań
+            print_number: Numer druku (ID projektu)
+            
+        Returns:
+            BeautifulSoup obiekt lub None w przypadku błędu
+            
+        Raises:
+            SejmConnectionError: Jeśli nie udało się pobrać strony
+            HostUnavailableError: Jeśli Sejm uznano za niedostępny (bez wysyłania żądania)
+            PageNotModified: Jeśli strona nie zmieniła się od ostatniego pobrania (HTTP 304)
+        """
+        url = self._process_url(print_number)
+        host = urlsplit(url).netloc
+        # Ten sam kontroler tempa i bezpiecznik co w ścieżce synchronicznej (z http_client)
+        controller = self.http_client.rate_controller.for_host(host)
+        breaker = self.http_client.circuit_breaker
+        
+        async def request(headers: Dict[str, str]) -> Tuple[int, bytes, Mapping[str, str]]:
+            # Semafor trzymany tylko na czas żądania - nie podczas oczekiwania na ponowienie
+            async with semaphore:
+                breaker.before_request(host)
+                await controller.aacquire()
+                started = time.monotonic()
+                status = None
+                retry_after = None
+                try:
+                    async with session.get(url, headers=headers) as response:
+                        status = response.status
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                        if status >= 500:
+                            breaker.record_failure(host)
+                        else:
+                            breaker.record_success(host)
+                        response.raise_for_status()
+                        return status, await response.read(), response.headers
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if status is None:
+                        breaker.record_failure(host)
+                    raise
+                finally:
+                    controller.release(status, time.monotonic() - started, retry_after)
+        
+        async def fetch(headers: Dict[str, str]) -> Tuple[int, bytes, Mapping[str, str]]:
+            return await async_retry_request(
+                lambda: request(headers),
+                max_retries=3,
+                retry_delay=1.0,
+                retryable_exceptions=(aiohttp.ClientError, asyncio.TimeoutError),
+                retry_budget=self.http_client.retry_budget
+            )
+        
+        try:
+            status, content, response_headers = await fetch(self.validator_cache.conditional_headers(url))
+            if status == 304:
+                payload = self.validator_cache.get_payload(url)
+                if payload is not None:
+                    self.validator_cache.record_hit()
+                    raise PageNotModified(url, payload)
+                # Brak zapisanego wyniku - pobierz stronę bez nagłówków warunkowych
+                status, content, response_headers = await fetch({})
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise SejmConnectionError(f"Błąd przy pobieraniu strony procesu dla druku {print_number}: {e}") from e
+        
+        self.validator_cache.record_miss()
+        self.validator_cache.remember_validators(url, response_headers)
+        return make_soup(content)
@@ -1,18 +1,30 @@
 """Monitoring konkretnych projektów ustaw w RCL."""
 
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Union
 
 import requests
 from bs4 import BeautifulSoup
 
-from ..constants import RCL_BASE_URL, HTTP_TIMEOUT
-from ..exceptions import RCLConnectionError, DataParseError
+from ..constants import RCL_BASE_URL, DEFAULT_MAX_WORKERS, DEFAULT_DATE_FORMAT
+from ..exceptions import (
+    RCLConnectionError,
+    DataParseError,
+    PageNotModified,
+    CacheMissError,
+    HostUnavailableError,
+)
+from ..parsers.html_backend import make_soup
+from ..parsers.rcl_project_page import extract_modification_dates
 from ..utils.date_utils import parse_polish_date
-from ..utils.http_client import get_http_headers, retry_request
+from ..utils.http_client import HTTPClient, get_default_http_client, retry_request
 from ..utils.logger import get_logger
-from ..utils.project_utils import filter_projects_by_source, ensure_source_field
+from ..utils.project_utils import filter_projects_by_source, ensure_source_field, normalize_project_id
+from ..utils.single_flight import SingleFlight
+from ..utils.validator_cache import ValidatorCache
 
 logger = get_logger(__name__)
 
@@ -24,7 +36,10 @@ class RCLProjectMonitor:
         self,
         load_projects_fn: Optional[Callable[[], List[Dict]]] = None,
         save_projects_fn: Optional[Callable[[List[Dict]], None]] = None,
-        base_url: str = RCL_BASE_URL
+        base_url: str = RCL_BASE_URL,
+        http_client: Optional[HTTPClient] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        validator_cache: Optional[ValidatorCache] = None
     ):
         """
         Inicjalizuje monitor projektów.
@@ -33,6 +48,11 @@ class RCLProjectMonitor:
             load_projects_fn: Funkcja do wczytania projektów (dependency injection)
             save_projects_fn: Funkcja do zapisania projektów (dependency injection)
             base_url: Bazowy URL RCL
+            http_client: Klient HTTP z pulą połączeń (domyślnie współdzielony klient)
+            max_workers: Liczba równoległych pobrań stron projektów (1 = sekwencyjnie);
+                ograniczona rozmiarem puli połączeń klienta HTTP
+            validator_cache: Cache walidatorów ETag/Last-Modified dla żądań warunkowych
+                (domyślnie trwały cache w katalogu data/)
         """
         from ..config import load_projects, save_projects
         
@@ -40,6 +60,21 @@ class RCLProjectMonitor:
         self._load_all_projects = load_projects_fn or load_projects
         self._save_all_projects = save_projects_fn or save_projects
         self.base_url = base_url
+        self.http_client = http_client or get_default_http_client()
+        
+        # Nie otwieraj więcej równoległych połączeń do RCL niż mieści pula
+        if max_workers > self.http_client.pool_size:
+            logger.warning(
+                f"max_workers={max_workers} przekracza rozmiar puli połączeń "
+                f"({self.http_client.pool_size}), ograniczam do {self.http_client.pool_size}"
+            )
+        self.max_workers = max(1, min(max_workers, self.http_client.pool_size))
+        self.validator_cache = validator_cache or ValidatorCache()
+        
+        # ID projektów pominiętych w ostatnim uruchomieniu (host niedostępny)
+        self.skipped_projects: List = []
+        self._skipped_lock = threading.Lock()
+        self._single_flight = SingleFlight()
     
     def monitor(self, start_date: datetime, end_date: datetime) -> List[Dict]:
         """
@@ -66,72 +101,23 @@ class RCLProjectMonitor:
         logger.info(f"Monitoring projektów RCL od {start_date.strftime('%Y-%m-%d')} do {end_date.strftime('%Y-%m-%d')}")
         logger.info(f"Znaleziono {len(projects)} projektów do sprawdzenia")
         
-        updated_projects = []
+        self.skipped_projects = []
+        # Projekty o tym samym (znormalizowanym) ID pobieramy i parsujemy raz na uruchomienie
+        self._single_flight = SingleFlight()
         
-        for project in projects:
-            # Obsługa zarówno formatu z obiektem jak i tylko ID
-            if isinstance(project, dict):
-                project_id = project.get('id')
-                project_title = project.get('title', f'Projekt {project_id}')
-            else:
-                project_id = project
-                project_title = f'Projekt {project_id}'
-            
-            logger.debug(f"Sprawdzam: {project_title} (ID: {project_id})")
-            
-            # Pobranie strony projektu
-            try:
-                soup = self._fetch_project_page(project_id)
-            except RCLConnectionError as e:
-                logger.error(f"Błąd połączenia dla projektu {project_id}: {e}")
-                updated_projects.append(project)
-                continue
-            
-            if not soup:
-                updated_projects.append(project)
-                continue
-            
-            # Wyciągnięcie dat modyfikacji
-            try:
-                modification_dates = self._extract_modification_dates(soup)
-            except DataParseError as e:
-                logger.error(f"Błąd parsowania dat dla projektu {project_id}: {e}")
-                updated_projects.append(project)
-                continue
-            
-            if not modification_dates:
-                logger.debug(f"  Brak dat modyfikacji dla projektu {project_id}")
-                updated_projects.append(project)
-                continue
-            
-            logger.debug(f"  Znaleziono {len(modification_dates)} dat modyfikacji")
-            
-            # Sprawdzenie czy któraś data mieści się w zakresie
-            last_hit = self._check_date_in_range(modification_dates, start_date, end_date)
-            
-            if last_hit:
-                # Zapisanie wyniku
-                if isinstance(project, dict):
-                    # Upewnij się że projekt ma source='rcl'
-                    project = ensure_source_field(project, 'rcl')
-                    project['last_hit'] = last_hit.strftime("%Y-%m-%d")
-                else:
-                    # Konwersja na dict jeśli było tylko ID
-                    project = {
-                        'id': project_id,
-                        'source': 'rcl',
-                        'last_hit': last_hit.strftime("%Y-%m-%d")
-                    }
-                
-                logger.info(f"  ✓ Projekt {project_id}: Ostatnia zmiana: {last_hit.strftime('%Y-%m-%d')}")
-            else:
-                logger.debug(f"  Brak zmian w okresie dla projektu {project_id}")
-            
-            # Upewnij się że projekt ma source='rcl'
-            if isinstance(project, dict):
-                project = ensure_source_field(project, 'rcl')
-            
-            updated_projects.append(project)
+        if self.max_workers > 1 and len(projects) > 1:
+            logger.info(f"Równoległe sprawdzanie projektów (max_workers={self.max_workers})")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # executor.map zachowuje kolejność projektów z konfiguracji
+                updated_projects = list(executor.map(
+                    lambda project: self._check_project(project, start_date, end_date),
+                    projects
+                ))
+        else:
+            updated_projects = [
+                self._check_project(project, start_date, end_date)
+                for project in projects
+            ]
         
         # Zapisanie zaktualizowanych danych (wszystkie projekty, nie tylko RCL)
         try:
@@ -150,9 +136,134 @@ class RCLProjectMonitor:
             logger.error(f"Błąd podczas zapisywania projektów: {e}")
             raise
         
+        self.validator_cache.save()
+        self.validator_cache.log_stats()
+        self.http_client.log_stats()
+        self._single_flight.log_stats('stron projektów RCL')
+        
+        if self.skipped_projects:
+            logger.warning(
+                f"Pominięto {len(self.skipped_projects)} projektów RCL (host niedostępny): "
+                f"{', '.join(str(project_id) for project_id in self.skipped_projects)}"
+            )
+        
         return updated_projects
     
-    def _fetch_project_page(self, project_id: int) -> Optional[BeautifulSoup]:
+    def _check_project(self, project, start_date: datetime, end_date: datetime):
+        """
+        Sprawdza pojedynczy projekt: pobiera stronę, wyciąga daty i porównuje z zakresem.
+        
+        Metoda jest wywoływana równolegle z wielu wątków, więc nie modyfikuje
+        współdzielonego stanu monitora (poza listą pominiętych projektów, chronioną blokadą).
+        
+        Args:
+            project: Projekt (dict z 'id' lub samo ID)
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Projekt z zaktualizowanym polem 'last_hit' (jeśli była zmiana w zakresie)
+        """
+        # Obsługa zarówno formatu z obiektem jak i tylko ID
+        if isinstance(project, dict):
+            project_id = project.get('id')
+            project_title = project.get('title', f'Projekt {project_id}')
+        else:
+            project_id = project
+            project_title = f'Projekt {project_id}'
+        
+        logger.debug(f"Sprawdzam: {project_title} (ID: {project_id})")
+        
+        # Pobranie strony projektu i wyciągnięcie dat modyfikacji
+        try:
+            modification_dates = self._single_flight.do(
+                self._project_url(project_id),
+                lambda: self._get_modification_dates(project_id)
+            )
+        except HostUnavailableError:
+            logger.warning(f"  Pominięto projekt {project_id} (host niedostępny)")
+            with self._skipped_lock:
+                self.skipped_projects.append(project_id)
+            return project
+        except RCLConnectionError as e:
+            logger.error(f"Błąd połączenia dla projektu {project_id}: {e}")
+            return project
+        except DataParseError as e:
+            logger.error(f"Błąd parsowania dat dla projektu {project_id}: {e}")
+            return project
+        
+        if modification_dates is None:
+            return project
+        
+        if not modification_dates:
+            logger.debug(f"  Brak dat modyfikacji dla projektu {project_id}")
+            return project
+        
+        logger.debug(f"  Znaleziono {len(modification_dates)} dat modyfikacji")
+        
+        # Sprawdzenie czy któraś data mieści się w zakresie
+        last_hit = self._check_date_in_range(modification_dates, start_date, end_date)
+        
+        if last_hit:
+            # Zapisanie wyniku
+            if isinstance(project, dict):
+                # Upewnij się że projekt ma source='rcl'
+                project = ensure_source_field(project, 'rcl')
+                project['last_hit'] = last_hit.strftime("%Y-%m-%d")
+            else:
+                # Konwersja na dict jeśli było tylko ID
+                project = {
+                    'id': project_id,
+                    'source': 'rcl',
+                    'last_hit': last_hit.strftime("%Y-%m-%d")
+                }
+            
+            logger.info(f"  ✓ Projekt {project_id}: Ostatnia zmiana: {last_hit.strftime('%Y-%m-%d')}")
+        else:
+            logger.debug(f"  Brak zmian w okresie dla projektu {project_id}")
+        
+        # Upewnij się że projekt ma source='rcl'
+        if isinstance(project, dict):
+            project = ensure_source_field(project, 'rcl')
+        
+        return project
+    
+    def _project_url(self, project_id) -> str:
+        """Zwraca URL strony projektu w RCL."""
+        return f"{self.base_url}/projekt/{normalize_project_id(project_id)}"
+    
+    def _get_modification_dates(self, project_id) -> Optional[List[datetime]]:
+        """
+        Zwraca daty modyfikacji projektu - z cache walidatorów (304) lub z pobranej strony.
+        
+        Args:
+            project_id: ID projektu
+            
+        Returns:
+            Lista dat modyfikacji lub None jeśli nie udało się pobrać strony
+            
+        Raises:
+            RCLConnectionError: Jeśli nie udało się pobrać strony
+            HostUnavailableError: Jeśli RCL uznano za niedostępny (bez wysyłania żądania)
+            DataParseError: Jeśli wystąpi błąd podczas parsowania
+        """
+        try:
+            content = self._fetch_project_page(project_id)
+        except PageNotModified as e:
+            logger.debug(f"  Strona projektu {project_id} bez zmian (304), używam zapisanych dat")
+            return [datetime.strptime(date_str, DEFAULT_DATE_FORMAT) for date_str in e.payload]
+        
+        if not content:
+            return None
+        
+        modification_dates = self._parse_modification_dates(content)
+        self.validator_cache.store_payload(
+            self._project_url(project_id),
+            [date.strftime(DEFAULT_DATE_FORMAT) for date in modification_dates]
+        )
+        return modification_dates
+    
+    def _fetch_project_page(self, project_id: int) -> Optional[bytes]:
         """
         Pobiera stronę projektu z RCL.
         
@@ -160,25 +271,63 @@ class RCLProjectMonitor:
             project_id: ID projektu
             
         Returns:
-            BeautifulSoup obiekt lub None w przypadku błędu
+            Treść strony (bajty) lub None w przypadku błędu
             
         Raises:
             RCLConnectionError: Jeśli nie udało się pobrać strony
+            HostUnavailableError: Jeśli RCL uznano za niedostępny (bez wysyłania żądania)
+            PageNotModified: Jeśli strona nie zmieniła się od ostatniego pobrania (HTTP 304)
         """
-        url = f"{self.base_url}/projekt/{project_id}"
-        headers = get_http_headers()
+        url = self._project_url(project_id)
+        headers = self.validator_cache.conditional_headers(url)
         
         try:
             response = retry_request(
-                lambda: requests.get(url, headers=headers, timeout=HTTP_TIMEOUT),
+                lambda: self.http_client.fetch(url, headers=headers),
                 max_retries=3,
-                retry_delay=1.0
+                retry_delay=1.0,
+                retry_budget=self.http_client.retry_budget
             )
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
-        except requests.RequestException as e:
+            if response.status_code == 304:
+                payload = self.validator_cache.get_payload(url)
+                if payload is not None:
+                    self.validator_cache.record_hit()
+                    raise PageNotModified(url, payload)
+                # Brak zapisanego wyniku - pobierz stronę bez nagłówków warunkowych
+                response = retry_request(
+                    lambda: self.http_client.fetch(url),
+                    max_retries=3,
+                    retry_delay=1.0,
+                    retry_budget=self.http_client.retry_budget
+                )
+            
+            self.validator_cache.record_miss()
+            self.validator_cache.remember_validators(url, response.headers)
+            return response.content
+        except (requests.RequestException, CacheMissError) as e:
             raise RCLConnectionError(f"Błąd przy pobieraniu projektu {project_id}: {e}") from e
     
+    def _parse_modification_dates(self, content: Union[bytes, str]) -> List[datetime]:
+        """
+        Wyciąga daty modyfikacji ze strony projektu.
+        
+        Najpierw skanuje surowy HTML (bez budowania drzewa DOM), a gdy to nie
+        daje pewnego wyniku - parsuje całą stronę.
+        
+        Args:
+            content: Treść strony projektu
+            
+        Returns:
+            Lista dat modyfikacji
+            
+        Raises:
+            DataParseError: Jeśli wystąpi błąd podczas parsowania
+        """
+        dates = extract_modification_dates(content)
+        if dates is not None:
+            return dates
+        return self._extract_modification_dates(make_soup(content))
+    
     def _extract_modification_dates(self, soup: BeautifulSoup) -> List[datetime]:
         """
         Wyciąga wszystkie daty modyfikacji z etapów projektu.
@@ -3,19 +3,25 @@
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
+from typing import Any, List, Dict, Optional, Callable, Tuple
+from urllib.parse import urlencode
 
 from playwright.sync_api import Page
 
-from ..constants import RCL_BASE_URL, PLAYWRIGHT_TIMEOUT, PLAYWRIGHT_WAIT_TIMEOUT
+from ..constants import RCL_BASE_URL, DEFAULT_RCL_BROWSER_EXTRACTION
 from ..config import DATA_DIR
 from ..exceptions import RCLConnectionError, DataParseError
-from ..utils.rcl_browser_manager import RCLBrowserManager
+from ..utils.http_client import HTTPClient
+from ..utils.rcl_browser_manager import RCLBrowserManager, RCLBrowserPool
 from ..utils.logger import get_logger
-from .rcl_tag_monitor import RCLTagMonitor
+from .rcl_tag_monitor import RCLTagMonitor, _date_window_params
 
 logger = get_logger(__name__)
 
+# Rodzaje wyszukiwań po identyfikatorach zewnętrznych (do logów)
+_SEARCH_LABELS = {'ue_act': 'akcie UE', 'kprm': 'numerze KPRM'}
+_SEARCH_DESCRIPTIONS = {'ue_act': 'aktu UE', 'kprm': 'numeru KPRM'}
+
 
 class RCLSearchMonitor(RCLTagMonitor):
     """Klasa do monitorowania projektów RCL po identyfikatorach zewnętrznych."""
@@ -24,7 +30,10 @@ class RCLSearchMonitor(RCLTagMonitor):
         self,
         load_queries_fn: Optional[Callable[[], List[Dict]]] = None,
         output_file: Optional[Path] = None,
-        base_url: str = RCL_BASE_URL
+        base_url: str = RCL_BASE_URL,
+        http_client: Optional[HTTPClient] = None,
+        browser_pool: Optional[RCLBrowserPool] = None,
+        browser_extraction: str = DEFAULT_RCL_BROWSER_EXTRACTION
     ):
         """
         Inicjalizuje monitor wyszukiwania.
@@ -33,11 +42,21 @@ class RCLSearchMonitor(RCLTagMonitor):
             load_queries_fn: Funkcja do wczytania zapytań (dependency injection)
             output_file: Plik wyjściowy dla wyników (domyślnie data/rcl_search_results_YYYY-MM-DD.json)
             base_url: Bazowy URL RCL
+            http_client: Klient HTTP do pobierania stron wyników (domyślnie współdzielony)
+            browser_pool: Pula przeglądarek dla zapytań wymagających Playwright
+            browser_extraction: Sposób wyciągania wierszy ze strony w przeglądarce ('js' lub 'html')
         """
         from ..config import load_rcl_search_queries
         
         # Wywołaj __init__ z klasy bazowej, ale nie używamy load_tags
-        super().__init__(load_tags_fn=None, output_file=None, base_url=base_url)
+        super().__init__(
+            load_tags_fn=None,
+            output_file=None,
+            base_url=base_url,
+            http_client=http_client,
+            browser_pool=browser_pool or self._create_browser_pool('tab2'),
+            browser_extraction=browser_extraction
+        )
         
         self.load_queries = load_queries_fn or load_rcl_search_queries
         
@@ -53,6 +72,10 @@ class RCLSearchMonitor(RCLTagMonitor):
         """
         Monitoruje projekty w podanym zakresie dat na podstawie zapytań wyszukiwawczych.
         
+        Każde wyszukiwanie (po akcie UE, po numerze KPRM) jest najpierw wykonywane
+        jako zwykłe żądanie GET na URL wyszukiwania. Przeglądarka jest używana
+        tylko dla wyszukiwań, których strona wyników nie zawiera tabeli.
+        
         Args:
             start_date: Data początkowa zakresu
             end_date: Data końcowa zakresu
@@ -66,93 +89,102 @@ class RCLSearchMonitor(RCLTagMonitor):
         logger.info(f"Zakres dat: {start_date.strftime('%Y-%m-%d')} - {end_date.strftime('%Y-%m-%d')}")
         logger.info(f"Znaleziono {len(queries)} zapytanie(ń) do wykonania")
         
+        searches = self._plan_searches(queries)
+        
+        search_results: List[Optional[List[Dict]]] = []
+        browser_searches = []
+        for idx, (query_idx, kind, value) in enumerate(searches):
+            logger.info(f"Zapytanie {query_idx}/{len(queries)}: Wyszukiwanie po {_SEARCH_LABELS[kind]}: {value}")
+            results = self._search_identifier_http_safe(query_idx, kind, value, start_date, end_date)
+            if results is None:
+                browser_searches.append(idx)
+            search_results.append(results)
+        
+        # Wyszukiwania wymagające przeglądarki są rozdzielane między strony z puli
+        if browser_searches:
+            logger.info(f"Wyszukiwanie {len(browser_searches)} zapytań w przeglądarce")
+            browser_results = self.browser_pool.map(
+                lambda browser, idx: self._run_browser_search(browser, *searches[idx][1:], start_date, end_date),
+                browser_searches
+            )
+            self.browser_pool.log_stats()
+            for idx, results in zip(browser_searches, browser_results):
+                search_results[idx] = results
+        
+        return self._store_search_results(search_results, start_date, end_date)
+    
+    def _plan_searches(self, queries: List[Dict]) -> List[Tuple[int, str, str]]:
+        """
+        Zamienia zapytania z konfiguracji na wyszukiwania w kolejności zapytań.
+        
+        Args:
+            queries: Zapytania z konfiguracji
+            
+        Returns:
+            Lista krotek (numer zapytania, rodzaj wyszukiwania, wartość)
+        """
+        searches = []
+        for query_idx, query in enumerate(queries, 1):
+            query_searches = self._query_searches(query)
+            if not query_searches:
+                logger.warning(f"Zapytanie {query_idx}/{len(queries)}: Brak wartości do wyszukania, pomijam")
+            for kind, value in query_searches:
+                searches.append((query_idx, kind, value))
+        return searches
+    
+    def _search_identifier_http_safe(
+        self,
+        query_idx: int,
+        kind: str,
+        value: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[List[Dict]]:
+        """
+        Wykonuje _search_identifier_http, zamieniając błąd wyszukiwania na pustą listę.
+        
+        Returns:
+            Lista znalezionych projektów lub None jeśli trzeba użyć przeglądarki
+        """
+        try:
+            return self._search_identifier_http(kind, value, start_date, end_date)
+        except (RCLConnectionError, DataParseError) as e:
+            logger.error(f"Błąd podczas wyszukiwania dla zapytania {query_idx}: {e}")
+            return []
+    
+    def _store_search_results(
+        self,
+        search_results: List[Optional[List[Dict]]],
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """
+        Łączy wyniki wyszukiwań (w kolejności zapytań, bez duplikatów) i zapisuje je.
+        
+        Args:
+            search_results: Wyniki kolejnych wyszukiwań (None dla nieudanych)
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista znalezionych projektów w formacie gotowym do projects.json
+        """
         all_results = []
         seen_ids = set()  # Do usuwania duplikatów
-        
-        # Użyj jednej przeglądarki dla wszystkich wyszukiwań
-        with RCLBrowserManager(active_tab='tab2', headless=False) as browser:
-            for query_idx, query in enumerate(queries, 1):
-                ue_act_number = query.get('ue_act_number')
-                title = query.get('title')
-                kprm_number = query.get('kprm_number')
-                
-                try:
-                    # Wyszukiwanie tylko po numerze aktu UE (title jest ignorowany)
-                    has_ue_act = bool(ue_act_number)
-                    has_kprm = bool(kprm_number)
-                    
-                    query_results = []  # Zbierz wyniki z wszystkich wyszukiwań dla tego zapytania
-                    
-                    if has_ue_act and has_kprm:
-                        # Wykonaj oba wyszukiwania osobno i połącz wyniki (OR)
-                        search_value = self._build_ue_act_value(ue_act_number, title)
-                        logger.info(f"Zapytanie {query_idx}/{len(queries)}: Wyszukiwanie po akcie UE: {search_value}")
-                        try:
-                            ue_results = self._search_by_ue_act(browser.page, search_value, start_date, end_date)
-                            query_results.extend(ue_results)
-                        except RCLConnectionError as e:
-                            logger.warning(f"Błąd podczas wyszukiwania po akcie UE: {e}")
-                        
-                        # Wyczyść formularz przed następnym wyszukiwaniem
-                        browser.clear_search_form()
-                        
-                        logger.info(f"Zapytanie {query_idx}/{len(queries)}: Wyszukiwanie po numerze KPRM: {kprm_number}")
-                        try:
-                            kprm_results = self._search_by_kprm_number(browser.page, kprm_number, start_date, end_date)
-                            query_results.extend(kprm_results)
-                        except RCLConnectionError as e:
-                            logger.warning(f"Błąd podczas wyszukiwania po numerze KPRM: {e}")
-                        
-                        results = query_results
-                    elif has_ue_act:
-                        # Wyszukiwanie po akcie UE (tylko numer)
-                        search_value = self._build_ue_act_value(ue_act_number, title)
-                        logger.info(f"Zapytanie {query_idx}/{len(queries)}: Wyszukiwanie po akcie UE: {search_value}")
-                        results = self._search_by_ue_act(browser.page, search_value, start_date, end_date)
-                    elif has_kprm:
-                        # Wyszukiwanie po numerze KPRM
-                        logger.info(f"Zapytanie {query_idx}/{len(queries)}: Wyszukiwanie po numerze KPRM: {kprm_number}")
-                        results = self._search_by_kprm_number(browser.page, kprm_number, start_date, end_date)
-                    else:
-                        logger.warning(f"Zapytanie {query_idx}/{len(queries)}: Brak wartości do wyszukania, pomijam")
-                        continue
-                    
-                    # Dodaj wyniki, unikając duplikatów
-                    for result in results:
-                        project_id = result.get('id')
-                        if project_id and project_id not in seen_ids:
-                            seen_ids.add(project_id)
-                            # Konwertuj do formatu projects.json
-                            project = {
-                                "id": project_id,
-                                "title": result.get('title', ''),
-                                "number": result.get('number', ''),
-                                "source": "rcl"
-                            }
-                            all_results.append(project)
-                    
-                    # Wyczyść formularz przed następnym zapytaniem (oprócz ostatniego)
-                    if query_idx < len(queries):
-                        browser.clear_search_form()
-                
-                except RCLConnectionError as e:
-                    logger.error(f"Błąd podczas wyszukiwania dla zapytania {query_idx}: {e}")
-                    # Wyczyść formularz nawet po błędzie, jeśli to nie ostatnie zapytanie
-                    if query_idx < len(queries):
-                        try:
-                            browser.clear_search_form()
-                        except Exception:
-                            pass
-                    continue
-                except Exception as e:
-                    logger.error(f"Nieoczekiwany błąd dla zapytania {query_idx}: {e}")
-                    # Wyczyść formularz nawet po błędzie, jeśli to nie ostatnie zapytanie
-                    if query_idx < len(queries):
-                        try:
-                            browser.clear_search_form()
-                        except Exception:
-                            pass
-                    continue
+        for results in search_results:
+            # Dodaj wyniki (w kolejności zapytań), unikając duplikatów
+            for result in results or []:
+                project_id = result.get('id')
+                if project_id and project_id not in seen_ids:
+                    seen_ids.add(project_id)
+                    # Konwertuj do formatu projects.json
+                    project = {
+                        "id": project_id,
+                        "title": result.get('title', ''),
+                        "number": result.get('number', ''),
+                        "source": "rcl"
+                    }
+                    all_results.append(project)
         
         # Zapisz wyniki
         if all_results:
@@ -162,6 +194,259 @@ class RCLSearchMonitor(RCLTagMonitor):
         
         return all_results
     
+    def _query_searches(self, query: Dict) -> List[Tuple[str, str]]:
+        """
+        Zamienia zapytanie z konfiguracji na listę wyszukiwań.
+        
+        Zapytanie z numerem aktu UE i numerem KPRM daje dwa osobne wyszukiwania,
+        których wyniki są łączone (OR).
+        
+        Args:
+            query: Zapytanie z konfiguracji
+            
+        Returns:
+            Lista par (rodzaj wyszukiwania: 'ue_act' lub 'kprm', wartość)
+        """
+        searches = []
+        if query.get('ue_act_number'):
+            searches.append(('ue_act', self._build_ue_act_value(query['ue_act_number'], query.get('title'))))
+        if query.get('kprm_number'):
+            searches.append(('kprm', query['kprm_number']))
+        return searches
+    
+    def _identifier_search_url(self, kind: str, value: str, start_date: datetime, end_date: datetime) -> str:
+        """
+        Buduje URL wyszukiwania z parametrem UEActValue lub number.
+        
+        Formularz wyszukiwania RCL jest wysyłany metodą GET, więc wyniki można
+        otworzyć bezpośrednio, bez wypełniania pól i klikania "Szukaj".
+        
+        Args:
+            kind: Rodzaj wyszukiwania ('ue_act' lub 'kprm')
+            value: Numer aktu UE lub numer z wykazu KPRM
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            URL strony wyników (bez fragmentu #list)
+        """
+        params = [
+            ('typeId', '1'),
+            ('typeId', '2'),
+            ('_typeId', '1'),
+            ('progress', ''),
+            ('status', ''),
+            ('tenure', ''),
+            ('title', ''),
+            ('_keywordId', '1'),
+            ('applicantId', ''),
+            ('periodId', ''),
+            ('_deptId', '1'),
+            ('_wordkeyId', '1'),
+            ('amended', ''),
+            ('repealed', ''),
+            ('topic', ''),
+            ('signatureActName', ''),
+            ('UEActValue', value if kind == 'ue_act' else ''),
+            ('number', value if kind == 'kprm' else ''),
+            ('developedby', ''),
+            ('_isUEAct', 'on'),
+            ('_isActEstablishingNumber', 'on'),
+            ('_isTKAct', 'on'),
+            ('_isSeparateMode', 'on'),
+            ('_isDU', 'on'),
+            ('_isNumerSejm', 'on'),
+            ('activeTab', 'tab2'),
+            ('sKey', 'modifiedDate'),
+            ('sOrder', 'desc'),
+            *_date_window_params(start_date, end_date).items()
+        ]
+        return f"{self.base_url}/szukaj?{urlencode(params)}"
+    
+    def _search_identifier_http(
+        self,
+        kind: str,
+        value: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[List[Dict]]:
+        """
+        Wykonuje wyszukiwanie po akcie UE lub numerze KPRM zwykłym żądaniem HTTP.
+        
+        Args:
+            kind: Rodzaj wyszukiwania ('ue_act' lub 'kprm')
+            value: Numer aktu UE lub numer z wykazu KPRM
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista znalezionych projektów lub None jeśli trzeba użyć przeglądarki
+            
+        Raises:
+            RCLConnectionError: Jeśli RCL uznano za niedostępny
+        """
+        return self._search_url_http(
+            self._identifier_search_url(kind, value, start_date, end_date),
+            f"{_SEARCH_DESCRIPTIONS[kind]} {value}",
+            start_date,
+            end_date
+        )
+    
+    def _run_browser_search(
+        self,
+        browser: RCLBrowserManager,
+        kind: str,
+        value: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """
+        Wykonuje jedno wyszukiwanie na stronie z puli przeglądarek.
+        
+        Najpierw otwiera URL wyszukiwania (jedna nawigacja), a formularz
+        wypełnia tylko wtedy, gdy otwarta strona nie zawiera tabeli wyników.
+        
+        Args:
+            browser: Manager przeglądarki przydzielony przez pulę
+            kind: Rodzaj wyszukiwania ('ue_act' lub 'kprm')
+            value: Numer aktu UE lub numer z wykazu KPRM
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista znalezionych projektów (pusta przy błędzie)
+        """
+        description = f"{_SEARCH_DESCRIPTIONS[kind]} {value}"
+        try:
+            search_url = self._identifier_search_url(kind, value, start_date, end_date)
+            results = self._search_url_browser(browser.page, search_url, description, start_date, end_date)
+            if results is not None:
+                return results
+            
+            # Strona po nawigacji ma pola wypełnione z URL - wyczyść formularz przed wypełnieniem
+            browser.clear_search_form()
+            if kind == 'ue_act':
+                return self._search_by_ue_act(browser.page, value, start_date, end_date)
+            return self._search_by_kprm_number(browser.page, value, start_date, end_date)
+        
+        except RCLConnectionError as e:
+            logger.error(f"Błąd podczas wyszukiwania dla {description}: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Nieoczekiwany błąd podczas wyszukiwania dla {description}: {e}")
+            return []
+    
+    def _search_url_browser(
+        self,
+        page: Page,
+        search_url: str,
+        description: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[List[Dict]]:
+        """
+        Otwiera URL wyszukiwania w przeglądarce i parsuje tabelę wyników.
+        
+        Args:
+            page: Playwright Page obiekt (strona z puli przeglądarek)
+            search_url: URL strony wyników
+            description: Opis wyszukiwania do logów
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista znalezionych projektów lub None jeśli trzeba wypełnić formularz
+            
+        Raises:
+            RCLConnectionError: Jeśli nie udało się załadować strony
+        """
+        try:
+            self.waits.open_results(page, f"{search_url}#list")
+        except Exception as e:
+            raise RCLConnectionError(f"Błąd podczas ładowania wyników dla {description}: {e}") from e
+        
+        rows = self._extract_page_rows(page)
+        if rows is None:
+            return self._results_without_table(self._page_result_count(page), description)
+        
+        rows = self._complete_rows_browser(page, rows, start_date)
+        return self._filter_search_rows(rows, start_date, end_date)
+    
+    # Odpowiedniki dla playwright.async_api (AsyncRCLSearchMonitor)
+    
+    async def _asearch_url_browser(
+        self,
+        page: Any,
+        search_url: str,
+        description: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[List[Dict]]:
+        """Asynchroniczny odpowiednik _search_url_browser."""
+        try:
+            await self.waits.aopen_results(page, f"{search_url}#list")
+        except Exception as e:
+            raise RCLConnectionError(f"Błąd podczas ładowania wyników dla {description}: {e}") from e
+        
+        rows = await self._aextract_page_rows(page)
+        if rows is None:
+            return self._results_without_table(await self._apage_result_count(page), description)
+        
+        rows = await self._acomplete_rows_browser(page, rows, start_date)
+        return self._filter_search_rows(rows, start_date, end_date)
+    
+    async def _asearch_form(
+        self,
+        page: Any,
+        kind: str,
+        value: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """
+        Asynchroniczny odpowiednik _search_by_ue_act i _search_by_kprm_number.
+        
+        Args:
+            page: Asynchroniczny Playwright Page obiekt z czystym formularzem
+            kind: Rodzaj wyszukiwania ('ue_act' lub 'kprm')
+            value: Numer aktu UE lub numer z wykazu KPRM
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista znalezionych projektów
+            
+        Raises:
+            RCLConnectionError: Jeśli wystąpi błąd połączenia
+        """
+        # Pole numeru KPRM może być ukryte w sekcji "dodatkowe kryteria"
+        selector, visible = ('input#UEActValue', True) if kind == 'ue_act' else ('input#number', False)
+        try:
+            if 'szukaj' not in page.url or 'tab2' not in page.url:
+                await self.waits.aopen_search_form(page, f"{self.base_url}/szukaj?typeId=1&typeId=2&activeTab=tab2#list")
+            
+            await self.waits.ainput_ready(page, selector, visible=visible)
+            field = page.locator(selector).first
+            if visible or await page.locator(f"{selector}:visible").count() > 0:
+                await field.fill(value)
+            else:
+                await field.fill(value, force=True)
+            
+            await self.waits.asubmit_search(page, lambda: self._aclick_search(page, selector))
+            return await self._aparse_search_results(page, start_date, end_date)
+        except Exception as e:
+            raise RCLConnectionError(f"Błąd podczas wyszukiwania po {_SEARCH_LABELS[kind]} '{value}': {e}") from e
+    
+    async def _aclick_search(self, page: Any, input_selector: str) -> None:
+        """Asynchroniczny odpowiednik _click_search."""
+        try:
+            await page.click('button:has-text("Szukaj")', timeout=5000)
+        except Exception:
+            try:
+                await page.click('input[type="submit"]', timeout=5000)
+            except Exception:
+                await page.press(input_selector, 'Enter')
+    
     def _build_ue_act_value(self, ue_act_number: Optional[str], title: Optional[str]) -> str:
         """
         Buduje wartość do wyszukiwania po akcie UE (tylko numer).
@@ -208,35 +493,20 @@ class RCLSearchMonitor(RCLTagMonitor):
                 # Tylko wtedy przeładuj jeśli nie jesteśmy na stronie wyszukiwania
                 search_url = f"{self.base_url}/szukaj?typeId=1&typeId=2&activeTab=tab2#list"
                 logger.debug("Przechodzenie do strony wyszukiwania...")
-                page.goto(search_url, wait_until="networkidle", timeout=PLAYWRIGHT_TIMEOUT)
-                page.wait_for_timeout(PLAYWRIGHT_WAIT_TIMEOUT)
+                self.waits.open_search_form(page, search_url)
             
             # Poczekaj aż pole UEActValue będzie widoczne i gotowe do użycia
             logger.debug("Oczekiwanie na pole UEActValue...")
+            self.waits.input_ready(page, 'input#UEActValue')
             ue_act_input = page.locator('input#UEActValue').first
-            ue_act_input.wait_for(state='visible', timeout=PLAYWRIGHT_TIMEOUT)
-            page.wait_for_timeout(PLAYWRIGHT_WAIT_TIMEOUT)  # Dodatkowe oczekiwanie na stabilizację
             
             # Wypełnij pole UEActValue
             logger.debug(f"Wypełnianie pola UEActValue wartością: {ue_act_value}")
             ue_act_input.fill(ue_act_value)
             
-            # Kliknij przycisk "Szukaj" - próbuj różnych selektorów
-            logger.debug("Klikanie przycisku Szukaj...")
-            try:
-                # Spróbuj najpierw button z tekstem "Szukaj"
-                page.click('button:has-text("Szukaj")', timeout=5000)
-            except:
-                try:
-                    # Spróbuj input submit
-                    page.click('input[type="submit"]', timeout=5000)
-                except:
-                    # Spróbuj submit formularza przez Enter
-                    page.press('input#UEActValue', 'Enter')
-            
-            # Poczekaj na wyniki
-            logger.debug("Oczekiwanie na wyniki wyszukiwania...")
-            page.wait_for_timeout(PLAYWRIGHT_WAIT_TIMEOUT * 2)  # Dłuższe oczekiwanie na wyniki
+            # Wyślij formularz i poczekaj na odpowiedź serwera i tabelę wyników
+            logger.debug("Klikanie przycisku Szukaj i oczekiwanie na wyniki...")
+            self.waits.submit_search(page, lambda: self._click_search(page, 'input#UEActValue'))
             
             # Parsuj wyniki używając metody z klasy bazowej
             results = self._parse_search_results(page, start_date, end_date)
@@ -278,8 +548,7 @@ class RCLSearchMonitor(RCLTagMonitor):
                 # Tylko wtedy przeładuj jeśli nie jesteśmy na stronie wyszukiwania
                 search_url = f"{self.base_url}/szukaj?typeId=1&typeId=2&activeTab=tab2#list"
                 logger.debug("Przechodzenie do strony wyszukiwania...")
-                page.goto(search_url, wait_until="networkidle", timeout=PLAYWRIGHT_TIMEOUT)
-                page.wait_for_timeout(PLAYWRIGHT_WAIT_TIMEOUT)
+                self.waits.open_search_form(page, search_url)
             
             # Pole number może być ukryte w sekcji "dodatkowe kryteria"
             # Spróbuj znaleźć widoczne pole, jeśli nie ma, użyj force
@@ -289,8 +558,8 @@ class RCLSearchMonitor(RCLTagMonitor):
             number_input_visible = page.locator('input#number:visible').first
             number_input_all = page.locator('input#number').first
             
-            # Poczekaj chwilę na załadowanie
-            page.wait_for_timeout(PLAYWRIGHT_WAIT_TIMEOUT)
+            # Poczekaj, aż pole będzie w DOM i aktywne (może być niewidoczne)
+            self.waits.input_ready(page, 'input#number', visible=False)
             
             # Wypełnij pole number
             logger.debug(f"Wypełnianie pola number wartością: {kprm_number}")
@@ -307,22 +576,9 @@ class RCLSearchMonitor(RCLTagMonitor):
                 logger.debug(f"Błąd podczas wypełniania, próba force fill: {e}")
                 number_input_all.fill(kprm_number, force=True)
             
-            # Kliknij przycisk "Szukaj" - próbuj różnych selektorów
-            logger.debug("Klikanie przycisku Szukaj...")
-            try:
-                # Spróbuj najpierw button z tekstem "Szukaj"
-                page.click('button:has-text("Szukaj")', timeout=5000)
-            except:
-                try:
-                    # Spróbuj input submit
-                    page.click('input[type="submit"]', timeout=5000)
-                except:
-                    # Spróbuj submit formularza przez Enter
-                    page.press('input#number', 'Enter')
-            
-            # Poczekaj na wyniki
-            logger.debug("Oczekiwanie na wyniki wyszukiwania...")
-            page.wait_for_timeout(PLAYWRIGHT_WAIT_TIMEOUT * 2)  # Dłuższe oczekiwanie na wyniki
+            # Wyślij formularz i poczekaj na odpowiedź serwera i tabelę wyników
+            logger.debug("Klikanie przycisku Szukaj i oczekiwanie na wyniki...")
+            self.waits.submit_search(page, lambda: self._click_search(page, 'input#number'))
             
             # Parsuj wyniki używając metody z klasy bazowej
             results = self._parse_search_results(page, start_date, end_date)
@@ -332,6 +588,25 @@ class RCLSearchMonitor(RCLTagMonitor):
         except Exception as e:
             raise RCLConnectionError(f"Błąd podczas wyszukiwania po numerze KPRM '{kprm_number}': {e}") from e
     
+    def _click_search(self, page: Page, input_selector: str) -> None:
+        """
+        Wysyła formularz wyszukiwania - próbuje różnych selektorów przycisku "Szukaj".
+        
+        Args:
+            page: Playwright Page obiekt
+            input_selector: Selektor wypełnionego pola (zapasowo: Enter w tym polu)
+        """
+        try:
+            # Spróbuj najpierw button z tekstem "Szukaj"
+            page.click('button:has-text("Szukaj")', timeout=5000)
+        except:
+            try:
+                # Spróbuj input submit
+                page.click('input[type="submit"]', timeout=5000)
+            except:
+                # Spróbuj submit formularza przez Enter
+                page.press(input_selector, 'Enter')
+    
     def _save_results(
         self,
         all_results: List[Dict],
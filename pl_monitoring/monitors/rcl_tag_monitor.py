@@ -1,25 +1,134 @@
 """Monitoring aktów prawnych w RCL na podstawie haseł przedmiotowych (tagów)."""
 
 import json
-import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
-from urllib.parse import urlencode
+from typing import Any, List, Dict, Optional, Callable, Union
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlsplit, urlunsplit
 
-from bs4 import BeautifulSoup
+import requests
 from playwright.sync_api import Page
 
-from ..constants import RCL_BASE_URL, PLAYWRIGHT_TIMEOUT, PLAYWRIGHT_WAIT_TIMEOUT
+from ..constants import (
+    RCL_BASE_URL,
+    DEFAULT_RCL_BROWSER_EXTRACTION,
+    RCL_BROWSER_EXTRACTION_MODES,
+    RCL_NARROW_WINDOW_DAYS,
+    RCL_NARROW_WINDOW_PAGE_SIZE,
+    RCL_PAGE_SIZE_ALL,
+    RCL_PAGE_SIZE_PARAM,
+    RCL_PAGE_SIZE_STEPS,
+    RCL_SEARCH_PAGE_SIZE,
+    POLISH_DATE_FORMAT,
+)
 from ..config import FINANCIAL_RESULTS, DATA_DIR
-from ..exceptions import RCLConnectionError, DataParseError
-from ..utils.date_utils import parse_polish_date
-from ..utils.http_client import get_browser_context
+from ..exceptions import RCLConnectionError, DataParseError, CacheMissError, ConfigurationError, HostUnavailableError
+from ..parsers.rcl_search_results import (
+    SearchRow,
+    aextract_result_count_from_page,
+    aextract_search_rows_from_page,
+    extract_result_count,
+    extract_result_count_from_page,
+    extract_search_rows,
+    extract_search_rows_from_page,
+)
+from ..utils.browser_waits import BrowserWaits
+from ..utils.http_client import HTTPClient, get_default_http_client, retry_request
 from ..utils.logger import get_logger
+from ..utils.rcl_browser_manager import RCLBrowserManager, RCLBrowserPool
 
 logger = get_logger(__name__)
 
 
+def _page_size_url(search_url: str, page_size: str) -> Optional[str]:
+    """
+    Zwraca URL tego samego wyszukiwania z podanym rozmiarem strony wyników (pSize).
+    
+    Returns:
+        URL strony wyników lub None, jeśli URL nie zawiera parametrów wyszukiwania
+        (np. strona po wysłaniu formularza metodą POST)
+    """
+    parts = urlsplit(search_url)
+    params = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != RCL_PAGE_SIZE_PARAM]
+    if not params:
+        return None
+    params.append((RCL_PAGE_SIZE_PARAM, page_size))
+    return urlunsplit(parts._replace(query=urlencode(params), fragment=''))
+
+
+def _next_page_size(search_url: str) -> Optional[str]:
+    """
+    Następny rozmiar strony wyników po rozmiarze z URL (10 -> 50 -> 100 -> 0 = wszystkie).
+    
+    Returns:
+        Wartość pSize lub None, jeśli URL ma już wszystkie wyniki
+    """
+    current = parse_qs(urlsplit(search_url).query).get(RCL_PAGE_SIZE_PARAM, [None])[0]
+    if current == RCL_PAGE_SIZE_ALL:
+        return None
+    try:
+        current_size = int(current)
+    except (TypeError, ValueError):
+        return RCL_PAGE_SIZE_ALL
+    return next((str(size) for size in RCL_PAGE_SIZE_STEPS if size > current_size), RCL_PAGE_SIZE_ALL)
+
+
+def _unique_rows(rows: List[SearchRow]) -> List[SearchRow]:
+    """Usuwa powtórzone wiersze tego samego projektu (zachowuje pierwsze wystąpienie)."""
+    seen = set()
+    unique = []
+    for row in rows:
+        if row.project_id not in seen:
+            seen.add(row.project_id)
+            unique.append(row)
+    return unique
+
+
+def _oldest_update(rows: List[SearchRow]) -> Optional[datetime]:
+    """Najstarsza data modyfikacji wśród wierszy strony."""
+    return min((row.updated for row in rows if row.updated), default=None)
+
+
+def _sorted_by_update_desc(search_url: str, rows: List[SearchRow]) -> bool:
+    """Sprawdza, czy wyniki są posortowane malejąco po dacie modyfikacji (URL i wiersze strony)."""
+    params = parse_qs(urlsplit(search_url).query)
+    if params.get('sKey') != ['modifiedDate'] or params.get('sOrder') != ['desc']:
+        return False
+    dates = [row.updated for row in rows if row.updated]
+    return bool(dates) and all(newer >= older for newer, older in zip(dates, dates[1:]))
+
+
+def _date_window_params(start_date: datetime, end_date: datetime) -> Dict[str, str]:
+    """
+    Parametry wyszukiwania RCL zawężające wyniki do okna monitoringu po stronie serwera.
+    
+    RCL filtruje tylko po dacie utworzenia projektu, a monitory po dacie
+    modyfikacji. Projekt zmodyfikowany do end_date musiał powstać najpóźniej
+    w end_date, więc createDateTo jest bezpieczne (z dniem zapasu na wypadek
+    granicy wyłącznej); createDateFrom zostaje puste, bo stare projekty mogą
+    być modyfikowane w oknie. Wąskie okno kończące się niedawno dostaje małą
+    stronę wyników - przy sortowaniu malejąco po dacie modyfikacji zwykle
+    wystarcza pierwsza, a gdy nie, strona jest powiększana o jeden krok
+    (RCLTagMonitor._larger_page_url_if_needed), nie od razu do wszystkich
+    wyników. Okno w przeszłości zaczyna się daleko od początku listy wyników,
+    więc dostaje zwykły rozmiar strony.
+    
+    Args:
+        start_date: Data początkowa zakresu
+        end_date: Data końcowa zakresu
+        
+    Returns:
+        Słownik parametrów createDateFrom, createDateTo i rozmiaru strony
+    """
+    narrow_window = timedelta(days=RCL_NARROW_WINDOW_DAYS)
+    narrow = end_date - start_date <= narrow_window and datetime.now() - end_date <= narrow_window
+    return {
+        'createDateFrom': '',
+        'createDateTo': (end_date + timedelta(days=1)).strftime(POLISH_DATE_FORMAT),
+        RCL_PAGE_SIZE_PARAM: str(RCL_NARROW_WINDOW_PAGE_SIZE if narrow else RCL_SEARCH_PAGE_SIZE),
+    }
+
+
 class RCLTagMonitor:
     """Klasa do monitorowania aktów prawnych w RCL na podstawie haseł przedmiotowych."""
     
@@ -27,7 +136,10 @@ class RCLTagMonitor:
         self,
         load_tags_fn: Optional[Callable[[], List[Dict]]] = None,
         output_file: Optional[Path] = None,
-        base_url: str = RCL_BASE_URL
+        base_url: str = RCL_BASE_URL,
+        http_client: Optional[HTTPClient] = None,
+        browser_pool: Optional[RCLBrowserPool] = None,
+        browser_extraction: str = DEFAULT_RCL_BROWSER_EXTRACTION
     ):
         """
         Inicjalizuje monitor tagów.
@@ -36,14 +148,44 @@ class RCLTagMonitor:
             load_tags_fn: Funkcja do wczytania tagów (dependency injection)
             output_file: Plik wyjściowy dla wyników
             base_url: Bazowy URL RCL
+            http_client: Klient HTTP do pobierania stron wyników (domyślnie współdzielony)
+            browser_pool: Pula przeglądarek dla wyszukiwań wymagających Playwright
+            browser_extraction: Sposób wyciągania wierszy ze strony w przeglądarce:
+                'js' (skrypt w przeglądarce) lub 'html' (page.content() + BeautifulSoup)
+            
+        Raises:
+            ConfigurationError: Jeśli podano nieznany sposób wyciągania wierszy
         """
         from ..config import load_rcl_subject_tags
         
+        if browser_extraction not in RCL_BROWSER_EXTRACTION_MODES:
+            raise ConfigurationError(
+                f"Nieznany sposób wyciągania wyników: {browser_extraction} "
+                f"(dostępne: {', '.join(RCL_BROWSER_EXTRACTION_MODES)})"
+            )
+        
         self.load_tags = load_tags_fn or load_rcl_subject_tags
         self.output_file = output_file or FINANCIAL_RESULTS
         self.base_url = base_url
+        self.http_client = http_client or get_default_http_client()
+        self.browser_pool = browser_pool or self._create_browser_pool('tab1')
+        self.browser_extraction = browser_extraction
+        # Oczekiwanie na wyniki w przeglądarce, z czasami wspólnymi dla całej puli
+        self.waits = BrowserWaits(self.browser_pool.timings if self.browser_pool is not None else None)
         DATA_DIR.mkdir(exist_ok=True)
     
+    def _create_browser_pool(self, active_tab: str) -> Optional[RCLBrowserPool]:
+        """
+        Tworzy domyślną pulę przeglądarek (gdy nie podano jej w konstruktorze).
+        
+        Args:
+            active_tab: Aktywna zakładka wyszukiwania ('tab1' dla tagów, 'tab2' dla wyszukiwania)
+            
+        Returns:
+            Pula przeglądarek lub None, jeśli monitor zarządza przeglądarką inaczej
+        """
+        return RCLBrowserPool(active_tab=active_tab)
+    
     def monitor(self, start_date: datetime, end_date: datetime) -> List[Dict]:
         """
         Monitoruje akty prawne z tagami w podanym zakresie dat.
@@ -55,6 +197,30 @@ class RCLTagMonitor:
         Returns:
             Lista znalezionych aktów prawnych
         """
+        tags = self._load_and_log_tags(start_date, end_date)
+        
+        # Wyszukaj dla każdego tagu (HTTP), tagi wymagające przeglądarki trafiają do puli
+        results_by_tag = {}
+        browser_tags = []
+        for tag in tags:
+            tag_id = tag['id']
+            try:
+                results = self._search_by_tag_http(tag_id, self._tag_search_url(tag_id, start_date, end_date), start_date, end_date)
+            except (RCLConnectionError, DataParseError) as e:
+                logger.error(f"Błąd podczas wyszukiwania dla tagu {tag_id}: {e}")
+                continue
+            if results is None:
+                browser_tags.append(tag_id)
+            else:
+                results_by_tag[tag_id] = results
+        
+        if browser_tags:
+            results_by_tag.update(self._search_tags_in_browser(browser_tags, start_date, end_date))
+        
+        return self._store_tag_results(tags, results_by_tag, start_date, end_date)
+    
+    def _load_and_log_tags(self, start_date: datetime, end_date: datetime) -> List[Dict]:
+        """Wczytuje tagi z konfiguracji i wypisuje je do logu razem z zakresem dat."""
         tags = self.load_tags()
         
         logger.info("Monitoring aktów prawnych z tagami finansowymi")
@@ -65,17 +231,30 @@ class RCLTagMonitor:
                 logger.debug(f"  - ID: {tag['id']}, Nazwa: {tag['name']}")
             else:
                 logger.debug(f"  - ID: {tag['id']}")
+        return tags
+    
+    def _store_tag_results(
+        self,
+        tags: List[Dict],
+        results_by_tag: Dict[int, List[Dict]],
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """
+        Łączy wyniki w kolejności tagów z konfiguracji i zapisuje je.
         
-        # Wyszukaj dla każdego tagu
+        Args:
+            tags: Tagi z konfiguracji
+            results_by_tag: Słownik ID tagu -> lista znalezionych aktów
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista znalezionych aktów prawnych
+        """
         all_results = []
         for tag in tags:
-            tag_id = tag['id']
-            try:
-                results = self._search_by_tag(tag_id, start_date, end_date)
-                all_results.extend(results)
-            except RCLConnectionError as e:
-                logger.error(f"Błąd podczas wyszukiwania dla tagu {tag_id}: {e}")
-                continue
+            all_results.extend(results_by_tag.get(tag['id'], []))
         
         # Zapisz wyniki
         if all_results:
@@ -94,6 +273,10 @@ class RCLTagMonitor:
         """
         Wykonuje wyszukiwanie dla danego tagu i zwraca listę aktów.
         
+        Strona wyników jest najpierw pobierana zwykłym żądaniem HTTP. Przeglądarka
+        (Playwright) jest uruchamiana tylko wtedy, gdy pobrany HTML nie zawiera
+        tabeli wyników.
+        
         Args:
             tag_id: ID hasła przedmiotowego
             start_date: Data początkowa zakresu
@@ -106,16 +289,31 @@ class RCLTagMonitor:
             RCLConnectionError: Jeśli wystąpi błąd połączenia
         """
         logger.debug(f"Wyszukiwanie dla tagu ID: {tag_id}")
+        search_url = self._tag_search_url(tag_id, start_date, end_date)
+        
+        results = self._search_by_tag_http(tag_id, search_url, start_date, end_date)
+        if results is not None:
+            return results
         
-        # Zbuduj URL bezpośrednio z parametrem wordkeyId
-        base_url = f"{self.base_url}/szukaj"
+        return self._search_tags_in_browser([tag_id], start_date, end_date).get(tag_id, [])
+    
+    def _tag_search_url(self, tag_id: int, start_date: datetime, end_date: datetime) -> str:
+        """
+        Buduje URL wyszukiwania z parametrem wordkeyId i oknem dat po stronie serwera.
+        
+        Args:
+            tag_id: ID hasła przedmiotowego
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            URL strony wyników (bez fragmentu #list)
+        """
         params = {
             '_typeId': '1',
             'progress': '',
             'status': '',
             'tenure': '',
-            'createDateFrom': '',
-            'createDateTo': '',
             'title': '',
             '_keywordId': '1',
             'applicantId': '',
@@ -135,31 +333,291 @@ class RCLTagMonitor:
             '_isNumerSejm': 'on',
             'activeTab': 'tab1',
             'sKey': 'modifiedDate',
-            'sOrder': 'desc'
+            'sOrder': 'desc',
+            **_date_window_params(start_date, end_date)
         }
+        return f"{self.base_url}/szukaj?{urlencode(params)}"
+    
+    def _search_by_tag_http(
+        self,
+        tag_id: int,
+        search_url: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[List[Dict]]:
+        """
+        Pobiera stronę wyników klientem HTTP i parsuje tabelę wyników.
+        
+        Args:
+            tag_id: ID hasła przedmiotowego
+            search_url: URL strony wyników
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista znalezionych aktów lub None jeśli trzeba użyć przeglądarki
+            
+        Raises:
+            RCLConnectionError: Jeśli RCL uznano za niedostępny
+        """
+        return self._search_url_http(search_url, f"tagu {tag_id}", start_date, end_date)
+    
+    def _search_url_http(
+        self,
+        search_url: str,
+        description: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[List[Dict]]:
+        """
+        Pobiera strony wyników wyszukiwania klientem HTTP i parsuje tabele wyników.
         
-        search_url = f"{base_url}?{urlencode(params)}#list"
+        Gdy pierwsza strona nie obejmuje całego zakresu dat, pobierane są coraz
+        większe strony wyników (_complete_rows).
         
-        logger.debug(f"Otwieranie URL z hasłem przedmiotowym ID: {tag_id}")
+        Args:
+            search_url: URL strony wyników (wyszukiwanie jako zwykły GET)
+            description: Opis wyszukiwania do logów (np. "tagu 7")
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista znalezionych aktów lub None jeśli trzeba użyć przeglądarki
+            
+        Raises:
+            RCLConnectionError: Jeśli RCL uznano za niedostępny
+            DataParseError: Jeśli wystąpi błąd podczas parsowania
+        """
+        html = self._fetch_search_html(search_url, description)
+        if html is None:
+            logger.warning(f"Nie udało się pobrać wyników dla {description} przez HTTP, używam przeglądarki")
+            return None
+        
+        rows = self._rows_from_html(html)
+        total = extract_result_count(html)
+        if rows is None:
+            return self._results_without_table(total, description)
+        
+        def fetch_page(url: str) -> Optional[List[SearchRow]]:
+            page_html = self._fetch_search_html(url, description)
+            return self._rows_from_html(page_html) if page_html is not None else None
         
-        browser, context = get_browser_context(headless=False)
-        page = context.new_page()
+        rows = self._complete_rows(search_url, description, rows, total, start_date, fetch_page)
+        return self._filter_search_rows(rows, start_date, end_date)
+    
+    def _fetch_search_html(self, url: str, description: str) -> Optional[bytes]:
+        """
+        Pobiera stronę wyników klientem HTTP (z ponawianiem).
         
+        Args:
+            url: URL strony wyników
+            description: Opis wyszukiwania do logów
+            
+        Returns:
+            Treść strony (bajty - kodowanie rozpoznaje parser HTML) lub None przy błędzie żądania
+            
+        Raises:
+            RCLConnectionError: Jeśli RCL uznano za niedostępny
+        """
         try:
-            logger.debug("Ładowanie strony z wynikami...")
-            page.goto(search_url, wait_until="networkidle", timeout=PLAYWRIGHT_TIMEOUT)
+            response = retry_request(
+                lambda: self.http_client.fetch(url),
+                max_retries=3,
+                retry_delay=1.0,
+                retry_budget=self.http_client.retry_budget
+            )
+        except HostUnavailableError as e:
+            raise RCLConnectionError(f"Błąd podczas wyszukiwania dla {description}: {e}") from e
+        except (requests.RequestException, CacheMissError) as e:
+            logger.warning(f"Błąd pobierania strony wyników dla {description}: {e}")
+            return None
+        return response.content
+    
+    def _rows_from_html(self, html: Union[str, bytes]) -> Optional[List[SearchRow]]:
+        """
+        Wyciąga wiersze z tabeli wyników.
+        
+        Args:
+            html: Treść strony wyników
             
-            logger.debug("Oczekiwanie na załadowanie wyników...")
-            page.wait_for_timeout(PLAYWRIGHT_WAIT_TIMEOUT)
+        Returns:
+            Lista wierszy lub None jeśli strona nie zawiera tabeli wyników
             
-            # Parsuj wyniki
-            results = self._parse_search_results(page, start_date, end_date)
+        Raises:
+            DataParseError: Jeśli wystąpi błąd podczas parsowania
+        """
+        try:
+            return extract_search_rows(html)
+        except Exception as e:
+            raise DataParseError(f"Błąd podczas parsowania wyników: {e}") from e
+    
+    def _results_without_table(self, total: Optional[int], description: str) -> Optional[List[Dict]]:
+        """
+        Rozstrzyga wynik strony otwartej z URL, która nie zawiera tabeli wyników.
+        
+        Args:
+            total: Liczba wyników z nagłówka strony (None jeśli go brak)
+            description: Opis wyszukiwania do logów
             
-            browser.close()
-            return results
+        Returns:
+            Pusta lista dla wyszukiwania bez wyników, None jeśli trzeba użyć przeglądarki
+        """
+        if total == 0:
+            logger.debug(f"Brak wyników dla {description}")
+            return []
+        logger.info(f"Strona wyników dla {description} nie zawiera tabeli wyników, używam przeglądarki")
+        return None
+    
+    def _complete_rows(
+        self,
+        search_url: str,
+        description: str,
+        first_rows: List[SearchRow],
+        total: Optional[int],
+        start_date: datetime,
+        fetch_page: Callable[[str], Optional[List[SearchRow]]]
+    ) -> List[SearchRow]:
+        """
+        Uzupełnia wiersze pierwszej strony o dalsze wyniki, powiększając stronę krok po kroku.
+        
+        Args:
+            search_url: URL pierwszej strony wyników (z parametrami wyszukiwania)
+            description: Opis wyszukiwania do logów
+            first_rows: Wiersze pierwszej strony
+            total: Liczba wyników z nagłówka strony
+            start_date: Data początkowa zakresu
+            fetch_page: Funkcja pobierająca wiersze strony o podanym URL (None przy błędzie)
             
+        Returns:
+            Wiersze wyników bez powtórzeń projektów
+        """
+        rows = _unique_rows(first_rows)
+        page_url = self._larger_page_url_if_needed(search_url, description, rows, total, start_date)
+        while page_url is not None:
+            page_rows = fetch_page(page_url)
+            if page_rows is None:
+                logger.warning(f"Nie udało się pobrać większej strony wyników dla {description}, używam pobranych")
+                break
+            # Większa strona zawiera wiersze poprzedniej - jej kolejność zostaje
+            rows = _unique_rows(page_rows + rows)
+            page_url = self._larger_page_url_if_needed(page_url, description, rows, total, start_date)
+        return rows
+    
+    def _larger_page_url_if_needed(
+        self,
+        search_url: str,
+        description: str,
+        rows: List[SearchRow],
+        total: Optional[int],
+        start_date: datetime
+    ) -> Optional[str]:
+        """
+        Rozstrzyga, czy trzeba pobrać większą stronę wyników, i zwraca jej URL.
+        
+        RCL nie udostępnia w linkach numeru strony wyników - tylko jej rozmiar
+        (pSize 10, 50, 100 albo 0 = wszystkie). Więcej wyników jest potrzebnych,
+        gdy strona nie zawiera wszystkich, a przy sortowaniu malejąco po dacie
+        modyfikacji (sKey=modifiedDate, sOrder=desc, potwierdzonym przez wiersze)
+        nie sięga jeszcze sprzed start_date - wtedy pobierana jest strona o
+        następnym rozmiarze. Przy nieznanej kolejności od razu pobierane są
+        wszystkie wyniki (pSize=0), bo żaden rozmiar strony nie wystarcza na pewno.
+        
+        Args:
+            search_url: URL ostatnio pobranej strony wyników
+            description: Opis wyszukiwania do logów
+            rows: Dotychczas pobrane wiersze
+            total: Liczba wyników z nagłówka strony
+            start_date: Data początkowa zakresu
+            
+        Returns:
+            URL większej strony wyników lub None, jeśli pobrane wiersze wystarczają
+        """
+        if not total or total <= len(rows):
+            return None
+        
+        if _sorted_by_update_desc(search_url, rows):
+            oldest = _oldest_update(rows)
+            if oldest is not None and oldest < start_date:
+                logger.debug(f"Wyniki dla {description}: {len(rows)} wierszy sięga sprzed zakresu dat, pomijam pozostałe")
+                return None
+            page_size = _next_page_size(search_url)
+        else:
+            page_size = RCL_PAGE_SIZE_ALL
+        if page_size is None:
+            return None
+        
+        page_url = _page_size_url(search_url, page_size)
+        if page_url is None:
+            logger.warning(f"Wyniki dla {description}: {len(rows)} z {total}, brak parametrów wyszukiwania w URL")
+        else:
+            logger.debug(f"Wyniki dla {description}: {len(rows)} z {total}, pobieram stronę z pSize={page_size}")
+        return page_url
+    
+    def _search_tags_in_browser(
+        self,
+        tag_ids: List[int],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[int, List[Dict]]:
+        """
+        Wyszukuje tagi w przeglądarce, rozdzielając je między strony z puli.
+        
+        Args:
+            tag_ids: ID haseł przedmiotowych
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Słownik ID tagu -> lista znalezionych aktów (bez tagów zakończonych błędem)
+        """
+        logger.info(f"Wyszukiwanie {len(tag_ids)} tag(ów) w przeglądarce")
+        
+        def search(browser: RCLBrowserManager, tag_id: int) -> Optional[List[Dict]]:
+            try:
+                return self._search_by_tag_browser(
+                    browser.page, tag_id, self._tag_search_url(tag_id, start_date, end_date), start_date, end_date
+                )
+            except RCLConnectionError as e:
+                logger.error(f"Błąd podczas wyszukiwania dla tagu {tag_id}: {e}")
+                return None
+        
+        results = self.browser_pool.map(search, tag_ids)
+        self.browser_pool.log_stats()
+        return {tag_id: result for tag_id, result in zip(tag_ids, results) if result is not None}
+    
+    def _search_by_tag_browser(
+        self,
+        page: Page,
+        tag_id: int,
+        search_url: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """
+        Otwiera stronę wyników w przeglądarce (Playwright) i parsuje tabelę wyników.
+        
+        Args:
+            page: Playwright Page obiekt (strona z puli przeglądarek)
+            tag_id: ID hasła przedmiotowego
+            search_url: URL strony wyników
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista znalezionych aktów
+            
+        Raises:
+            RCLConnectionError: Jeśli wystąpi błąd połączenia
+        """
+        logger.debug(f"Otwieranie URL z hasłem przedmiotowym ID: {tag_id}")
+        
+        try:
+            logger.debug("Ładowanie strony z wynikami...")
+            self.waits.open_results(page, f"{search_url}#list")
+            
+            # Parsuj wyniki
+            return self._parse_search_results(page, start_date, end_date)
         except Exception as e:
-            browser.close()
             raise RCLConnectionError(f"Błąd podczas wyszukiwania dla tagu {tag_id}: {e}") from e
     
     def _parse_search_results(
@@ -169,7 +627,7 @@ class RCLTagMonitor:
         end_date: datetime
     ) -> List[Dict]:
         """
-        Parsuje tabelę wyników z HTML i filtruje według zakresu dat.
+        Parsuje tabelę wyników ze strony w przeglądarce i filtruje według zakresu dat.
         
         Args:
             page: Playwright Page obiekt
@@ -182,105 +640,189 @@ class RCLTagMonitor:
         Raises:
             DataParseError: Jeśli wystąpi błąd podczas parsowania
         """
-        try:
-            html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Znajdź tabelę z wynikami
-            tables = soup.find_all('table')
-            table = None
-            
-            for t in tables:
-                rows = t.find_all('tr')
-                if len(rows) > 1:
-                    first_data_row = rows[1] if len(rows) > 1 else None
-                    if first_data_row and first_data_row.find('a', href=re.compile(r'/projekt/\d+')):
-                        table = t
-                        break
+        rows = self._extract_page_rows(page)
+        if rows is None:
+            logger.warning("Nie znaleziono tabeli z wynikami")
+            return []
+        
+        rows = self._complete_rows_browser(page, rows, start_date)
+        return self._filter_search_rows(rows, start_date, end_date)
+    
+    def _complete_rows_browser(self, page: Page, first_rows: List[SearchRow], start_date: datetime) -> List[SearchRow]:
+        """
+        Uzupełnia wiersze pierwszej strony o pozostałe wyniki w przeglądarce (po URL bieżącej strony).
+        
+        Args:
+            page: Playwright Page obiekt z pierwszą stroną wyników
+            first_rows: Wiersze pierwszej strony
+            start_date: Data początkowa zakresu
             
-            if not table:
-                logger.warning("Nie znaleziono tabeli z wynikami")
-                return []
+        Returns:
+            Wiersze wyników bez powtórzeń
+        """
+        total = self._page_result_count(page)
+        if not total or total <= len(first_rows):
+            return _unique_rows(first_rows)
+        
+        def fetch_page(url: str) -> Optional[List[SearchRow]]:
+            try:
+                self.waits.open_results(page, f"{url}#list")
+                return self._extract_page_rows(page)
+            except Exception as e:
+                logger.debug(f"Błąd podczas ładowania większej strony wyników: {e}")
+                return None
+        
+        return self._complete_rows(
+            page.url.split('#', 1)[0], "wyszukiwania w przeglądarce", first_rows, total, start_date, fetch_page
+        )
+    
+    def _page_result_count(self, page: Page) -> Optional[int]:
+        """Odczytuje liczbę wyników ze strony w przeglądarce."""
+        try:
+            if self.browser_extraction == 'html':
+                return extract_result_count(page.content())
+            return extract_result_count_from_page(page)
+        except Exception as e:
+            logger.debug(f"Nie udało się odczytać liczby wyników: {e}")
+            return None
+    
+    def _extract_page_rows(self, page: Page) -> Optional[List[SearchRow]]:
+        """
+        Wyciąga wiersze tabeli wyników ze strony w przeglądarce.
+        
+        W trybie 'js' wiersze są zbierane skryptem w przeglądarce i do Pythona
+        trafiają tylko ich pola. Tryb 'html' serializuje cały DOM i parsuje go
+        BeautifulSoup.
+        
+        Args:
+            page: Playwright Page obiekt
             
-            results = []
-            rows = table.find_all('tr')[1:]  # Pomijamy nagłówek
+        Returns:
+            Lista wierszy lub None jeśli nie znaleziono tabeli wyników
             
-            logger.debug(f"Znaleziono {len(rows)} wierszy w tabeli")
+        Raises:
+            DataParseError: Jeśli wystąpi błąd podczas parsowania
+        """
+        try:
+            if self.browser_extraction == 'html':
+                return extract_search_rows(page.content())
+            return extract_search_rows_from_page(page)
+        except Exception as e:
+            raise DataParseError(f"Błąd podczas parsowania wyników: {e}") from e
+    
+    # Odpowiedniki dla playwright.async_api (AsyncRCLTagMonitor, AsyncRCLSearchMonitor)
+    
+    async def _asearch_by_tag_browser(
+        self,
+        page: Any,
+        tag_id: int,
+        search_url: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """Asynchroniczny odpowiednik _search_by_tag_browser."""
+        logger.debug(f"Otwieranie URL z hasłem przedmiotowym ID: {tag_id}")
+        
+        try:
+            await self.waits.aopen_results(page, f"{search_url}#list")
+            return await self._aparse_search_results(page, start_date, end_date)
+        except Exception as e:
+            raise RCLConnectionError(f"Błąd podczas wyszukiwania dla tagu {tag_id}: {e}") from e
+    
+    async def _aparse_search_results(self, page: Any, start_date: datetime, end_date: datetime) -> List[Dict]:
+        """Asynchroniczny odpowiednik _parse_search_results."""
+        rows = await self._aextract_page_rows(page)
+        if rows is None:
+            logger.warning("Nie znaleziono tabeli z wynikami")
+            return []
+        
+        rows = await self._acomplete_rows_browser(page, rows, start_date)
+        return self._filter_search_rows(rows, start_date, end_date)
+    
+    async def _acomplete_rows_browser(
+        self,
+        page: Any,
+        first_rows: List[SearchRow],
+        start_date: datetime
+    ) -> List[SearchRow]:
+        """Asynchroniczny odpowiednik _complete_rows_browser."""
+        description = "wyszukiwania w przeglądarce"
+        total = await self._apage_result_count(page)
+        if not total or total <= len(first_rows):
+            return _unique_rows(first_rows)
+        
+        rows = _unique_rows(first_rows)
+        page_url = self._larger_page_url_if_needed(page.url.split('#', 1)[0], description, rows, total, start_date)
+        while page_url is not None:
+            try:
+                await self.waits.aopen_results(page, f"{page_url}#list")
+                page_rows = await self._aextract_page_rows(page)
+            except Exception as e:
+                logger.debug(f"Błąd podczas ładowania większej strony wyników: {e}")
+                page_rows = None
+            if page_rows is None:
+                logger.warning(f"Nie udało się pobrać większej strony wyników dla {description}, używam pobranych")
+                break
+            rows = _unique_rows(page_rows + rows)
+            page_url = self._larger_page_url_if_needed(page_url, description, rows, total, start_date)
+        return rows
+    
+    async def _apage_result_count(self, page: Any) -> Optional[int]:
+        """Asynchroniczny odpowiednik _page_result_count."""
+        try:
+            if self.browser_extraction == 'html':
+                return extract_result_count(await page.content())
+            return await aextract_result_count_from_page(page)
+        except Exception as e:
+            logger.debug(f"Nie udało się odczytać liczby wyników: {e}")
+            return None
+    
+    async def _aextract_page_rows(self, page: Any) -> Optional[List[SearchRow]]:
+        """Asynchroniczny odpowiednik _extract_page_rows."""
+        try:
+            if self.browser_extraction == 'html':
+                return extract_search_rows(await page.content())
+            return await aextract_search_rows_from_page(page)
+        except Exception as e:
+            raise DataParseError(f"Błąd podczas parsowania wyników: {e}") from e
+    
+    def _filter_search_rows(
+        self,
+        rows: List[SearchRow],
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """
+        Wybiera wiersze zmodyfikowane w zakresie dat.
+        
+        Args:
+            rows: Wiersze tabeli wyników
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
             
-            for row_idx, row in enumerate(rows):
-                cells = row.find_all(['td', 'th'])
-                
-                # Sprawdź czy pierwsza kolumna to checkbox
-                has_checkbox = False
-                if len(cells) > 0:
-                    first_cell = cells[0]
-                    if first_cell.find('a', href=re.compile(r'/zapisz/projekt')):
-                        has_checkbox = True
-                
-                # Dostosuj indeksy kolumn
-                if has_checkbox:
-                    if len(cells) < 6:
-                        continue
-                    title_cell_idx = 1
-                    number_cell_idx = 3
-                    updated_date_cell_idx = 5
-                else:
-                    if len(cells) < 5:
-                        continue
-                    title_cell_idx = 0
-                    number_cell_idx = 2
-                    updated_date_cell_idx = 4
-                
-                try:
-                    # Tytuł (z linkiem)
-                    title_cell = cells[title_cell_idx]
-                    title_link = title_cell.find('a', href=re.compile(r'/projekt/\d+'))
-                    if not title_link:
-                        continue
-                    
-                    title = title_link.get_text(strip=True)
-                    href = title_link.get('href', '')
-                    
-                    # Wyciągnij ID z URL
-                    project_id = None
-                    if href:
-                        match = re.search(r'/projekt/(\d+)', href)
-                        if match:
-                            project_id = int(match.group(1))
-                    
-                    # Numer
-                    number = cells[number_cell_idx].get_text(strip=True) if len(cells) > number_cell_idx else ""
-                    
-                    # Data zaktualizowania
-                    updated_date_str = cells[updated_date_cell_idx].get_text(strip=True) if len(cells) > updated_date_cell_idx else ""
-                    
-                    if not updated_date_str:
-                        continue
-                    
-                    # Parsuj datę
-                    updated_date = parse_polish_date(updated_date_str)
-                    if not updated_date:
-                        logger.warning(f"Nie można sparsować daty: {updated_date_str}")
-                        continue
-                    
-                    # Filtruj według zakresu dat
-                    if start_date <= updated_date <= end_date:
-                        results.append({
-                            "title": title,
-                            "id": project_id,
-                            "updated_date": updated_date_str,
-                            "number": number
-                        })
-                        logger.info(f"  ✓ Znaleziono: {title[:50]}... (zaktualizowany: {updated_date_str})")
-                
-                except Exception as e:
-                    logger.warning(f"Błąd parsowania wiersza {row_idx}: {e}")
-                    continue
+        Returns:
+            Lista znalezionych aktów
+        """
+        logger.debug(f"Znaleziono {len(rows)} wierszy w tabeli")
+        
+        results = []
+        for row in rows:
+            if not row.updated_date:
+                continue
             
-            return results
+            if not row.updated:
+                logger.warning(f"Nie można sparsować daty: {row.updated_date}")
+                continue
             
-        except Exception as e:
-            raise DataParseError(f"Błąd podczas parsowania wyników: {e}") from e
+            # Filtruj według zakresu dat
+            if start_date <= row.updated <= end_date:
+                results.append(row.to_dict())
+                logger.info(f"  ✓ Znaleziono: {row.title[:50]}... (zaktualizowany: {row.updated_date})")
+        
+        # Okno dat jest zawężane po stronie serwera - tu tylko kontrola poprawności
+        if len(results) < len(rows):
+            logger.debug(f"Odrzucono {len(rows) - len(results)} wierszy spoza zakresu dat")
+        return results
     
     def _save_results(
         self, 
@@ -1,18 +1,26 @@
 """Monitoring konkretnych projektów ustaw w Sejmie."""
 
-import re
 from datetime import datetime
 from typing import List, Dict, Optional, Callable
 
 import requests
 from bs4 import BeautifulSoup
 
-from ..constants import SEJM_WWW_BASE_URL, SEJM_PROCESS_URL_TEMPLATE, HTTP_TIMEOUT
-from ..exceptions import SejmConnectionError, DataParseError
-from ..utils.project_utils import filter_projects_by_source
-from ..utils.date_utils import parse_polish_date_full
-from ..utils.http_client import get_http_headers, retry_request
+from ..constants import SEJM_WWW_BASE_URL, SEJM_PROCESS_URL_TEMPLATE
+from ..exceptions import (
+    SejmConnectionError,
+    DataParseError,
+    PageNotModified,
+    CacheMissError,
+    HostUnavailableError,
+)
+from ..parsers.html_backend import make_soup
+from ..parsers.sejm_process import ProcessStage, extract_process_stages
+from ..utils.project_utils import filter_projects_by_source, normalize_project_id
+from ..utils.http_client import HTTPClient, get_default_http_client, retry_request
 from ..utils.logger import get_logger
+from ..utils.single_flight import SingleFlight
+from ..utils.validator_cache import ValidatorCache
 
 logger = get_logger(__name__)
 
@@ -24,7 +32,9 @@ class SejmProjectMonitor:
         self,
         load_projects_fn: Optional[Callable[[], List[Dict]]] = None,
         save_projects_fn: Optional[Callable[[List[Dict]], None]] = None,
-        base_url: str = SEJM_WWW_BASE_URL
+        base_url: str = SEJM_WWW_BASE_URL,
+        http_client: Optional[HTTPClient] = None,
+        validator_cache: Optional[ValidatorCache] = None
     ):
         """
         Inicjalizuje monitor projektów Sejm.
@@ -33,12 +43,21 @@ class SejmProjectMonitor:
             load_projects_fn: Funkcja do wczytania projektów (dependency injection)
             save_projects_fn: Funkcja do zapisania projektów (dependency injection)
             base_url: Bazowy URL strony Sejmu
+            http_client: Klient HTTP z pulą połączeń (domyślnie współdzielony klient)
+            validator_cache: Cache walidatorów ETag/Last-Modified dla żądań warunkowych
+                (domyślnie trwały cache w katalogu data/)
         """
         from ..config import load_projects, save_projects
         
         self.load_projects = load_projects_fn or load_projects
         self.save_projects = save_projects_fn or save_projects
         self.base_url = base_url
+        self.http_client = http_client or get_default_http_client()
+        self.validator_cache = validator_cache or ValidatorCache()
+        
+        # ID projektów pominiętych w ostatnim uruchomieniu (host niedostępny)
+        self.skipped_projects: List[str] = []
+        self._single_flight = SingleFlight()
     
     def monitor(self, start_date: datetime, end_date: datetime) -> List[Dict]:
         """
@@ -52,21 +71,12 @@ class SejmProjectMonitor:
             Lista projektów z informacją o zmianach
         """
         all_projects = self.load_projects()
-        sejm_projects = filter_projects_by_source(all_projects, 'sejm')
+        sejm_projects = self._prepare_projects(all_projects, start_date, end_date)
         
         if not sejm_projects:
-            logger.warning("Brak projektów Sejm do monitorowania!")
             return []
         
-        logger.info(f"Monitoring projektów Sejm od {start_date.strftime('%Y-%m-%d')} do {end_date.strftime('%Y-%m-%d')}")
-        logger.info(f"Znaleziono {len(sejm_projects)} projektów do sprawdzenia")
-        
-        # Wyczyść referred_to dla wszystkich projektów Sejm (zaczynamy od nowa dla tego zakresu dat)
-        for project in sejm_projects:
-            project['referred_to'] = []
-        
         updated_projects = []
-        all_projects_dict = {p.get('id'): p for p in all_projects}
         
         for project in sejm_projects:
             project_id = str(project.get('id'))
@@ -75,326 +85,299 @@ class SejmProjectMonitor:
             logger.debug(f"Sprawdzam: {project_title} (ID: {project_id})")
             
             try:
-                soup = self._fetch_process_page(project_id)
-            except SejmConnectionError as e:
-                logger.error(f"Błąd połączenia dla projektu {project_id}: {e}")
+                stages = self._single_flight.do(
+                    self._process_url(project_id),
+                    lambda: self._get_stages(project_id)
+                )
+            except HostUnavailableError:
+                logger.warning(f"  Pominięto projekt {project_id} (host niedostępny)")
+                self.skipped_projects.append(project_id)
                 updated_projects.append(project)
                 continue
-            
-            if not soup:
-                logger.warning(f"Nie udało się pobrać strony dla projektu {project_id}")
+            except SejmConnectionError as e:
+                logger.error(f"Błąd połączenia dla projektu {project_id}: {e}")
                 updated_projects.append(project)
                 continue
-            
-            # Parsuj wszystkie etapy procesu
-            try:
-                all_stages = self._parse_process_stages(soup)
             except DataParseError as e:
                 logger.error(f"Błąd parsowania etapów dla projektu {project_id}: {e}")
                 updated_projects.append(project)
                 continue
             
-            if not all_stages:
-                logger.debug(f"  Brak etapów dla projektu {project_id}")
-                updated_projects.append(project)
-                continue
-            
-            logger.debug(f"  Znaleziono {len(all_stages)} etapów procesu")
-            
-            # Filtruj etapy w zakresie dat
-            stages_in_range = [
-                stage for stage in all_stages
-                if start_date <= stage['date'] <= end_date
-            ]
-            
-            if stages_in_range:
-                # Znajdź najnowszą datę
-                latest_date = max(stage['date'] for stage in stages_in_range)
-                project['last_hit'] = latest_date.strftime('%Y-%m-%d')
-                
-                # Zapisz wszystkie etapy z zakresu
-                project['referred_to'] = [
-                    self._format_stage_for_json(stage)
-                    for stage in stages_in_range
-                ]
-                
-                logger.info(f"  ✓ Projekt {project_id}: Ostatnia zmiana: {latest_date.strftime('%Y-%m-%d')} (znaleziono {len(stages_in_range)} etapów)")
-            else:
-                logger.debug(f"  Brak zmian w okresie dla projektu {project_id}")
-                project['referred_to'] = []
-            
-            # Zaktualizuj projekt w słowniku wszystkich projektów
-            all_projects_dict[project.get('id')] = project
-            updated_projects.append(project)
+            updated_projects.append(self._update_project(project, stages, start_date, end_date))
         
-        # Zapisanie zaktualizowanych danych (wszystkie projekty, nie tylko Sejm)
-        try:
-            all_projects_updated = list(all_projects_dict.values())
-            self.save_projects(all_projects_updated)
-            logger.info("Wyniki zapisane do pliku konfiguracyjnego")
-        except Exception as e:
-            logger.error(f"Błąd podczas zapisywania projektów: {e}")
-            raise
+        self._store_results(all_projects)
+        self.validator_cache.save()
+        self.validator_cache.log_stats()
+        self.http_client.log_stats()
+        self._single_flight.log_stats('stron procesu Sejm')
+        self._report_skipped()
         
         return updated_projects
     
-    def _fetch_process_page(self, print_number: str) -> Optional[BeautifulSoup]:
+    def _prepare_projects(
+        self,
+        all_projects: List[Dict],
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
         """
-        Pobiera stronę HTML przebiegu procesu legislacyjnego.
+        Wybiera projekty Sejm do sprawdzenia i czyści ich poprzednie wyniki.
+        
+        Args:
+            all_projects: Wszystkie projekty z konfiguracji
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
+            
+        Returns:
+            Lista projektów Sejm (te same obiekty co w all_projects)
+        """
+        sejm_projects = filter_projects_by_source(all_projects, 'sejm')
+        
+        if not sejm_projects:
+            logger.warning("Brak projektów Sejm do monitorowania!")
+            return []
+        
+        logger.info(f"Monitoring projektów Sejm od {start_date.strftime('%Y-%m-%d')} do {end_date.strftime('%Y-%m-%d')}")
+        logger.info(f"Znaleziono {len(sejm_projects)} projektów do sprawdzenia")
+        
+        self.skipped_projects = []
+        # Druki o tym samym (znormalizowanym) numerze pobieramy i parsujemy raz na uruchomienie
+        self._single_flight = SingleFlight()
+        
+        # Wyczyść referred_to dla wszystkich projektów Sejm (zaczynamy od nowa dla tego zakresu dat)
+        for project in sejm_projects:
+            project['referred_to'] = []
+        
+        return sejm_projects
+    
+    def _get_stages(self, print_number: str) -> Optional[List[ProcessStage]]:
+        """
+        Pobiera stronę przebiegu procesu i zwraca etapy (z cache walidatorów przy 304).
         
         Args:
             print_number: Numer druku (ID projektu)
             
         Returns:
-            BeautifulSoup obiekt lub None w przypadku błędu
+            Lista etapów procesu lub None jeśli nie udało się pobrać strony
             
         Raises:
             SejmConnectionError: Jeśli nie udało się pobrać strony
+            HostUnavailableError: Jeśli Sejm uznano za niedostępny (bez wysyłania żądania)
+            DataParseError: Jeśli wystąpi błąd podczas parsowania
         """
-        url = f"{self.base_url}{SEJM_PROCESS_URL_TEMPLATE.format(number=print_number)}"
-        headers = get_http_headers()
-        
         try:
-            response = retry_request(
-                lambda: requests.get(url, headers=headers, timeout=HTTP_TIMEOUT),
-                max_retries=3,
-                retry_delay=1.0
-            )
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
-        except requests.RequestException as e:
-            raise SejmConnectionError(f"Błąd przy pobieraniu strony procesu dla druku {print_number}: {e}") from e
+            soup = self._fetch_process_page(print_number)
+        except PageNotModified as e:
+            logger.debug(f"  Strona procesu {print_number} bez zmian (304), używam zapisanych etapów")
+            return self._stages_from_payload(e.payload)
+        
+        return self._stages_from_soup(print_number, soup)
     
-    def _parse_process_stages(self, soup: BeautifulSoup) -> List[Dict]:
+    def _stages_from_soup(self, print_number: str, soup: Optional[BeautifulSoup]) -> Optional[List[ProcessStage]]:
         """
-        Parsuje wszystkie etapy procesu legislacyjnego z HTML.
+        Parsuje etapy procesu z pobranej strony i zapisuje je w cache walidatorów.
         
         Args:
-            soup: BeautifulSoup obiekt strony procesu
+            print_number: Numer druku (ID projektu)
+            soup: BeautifulSoup obiekt strony procesu (None jeśli nie pobrano)
             
         Returns:
-            Lista słowników z etapami procesu
+            Lista etapów procesu lub None jeśli strona nie została pobrana
             
         Raises:
             DataParseError: Jeśli wystąpi błąd podczas parsowania
         """
-        stages = []
+        if not soup:
+            return None
         
-        try:
-            # Znajdź główną listę procesu
-            process_list = soup.find('ul', class_=re.compile(r'proces'))
-            if not process_list:
-                logger.warning("Nie znaleziono listy procesu legislacyjnego")
-                return []
-            
-            # Iteruj przez wszystkie <li> w liście procesu
-            for li in process_list.find_all('li', recursive=False):
-                # Pomiń elementy z klasą "rok"
-                if 'rok' in li.get('class', []):
-                    continue
-                
-                # Główne etapy (class="krok")
-                if 'krok' in li.get('class', []):
-                    stage = self._parse_main_stage(li)
-                    if stage:
-                        stages.append(stage)
-                
-                # Zagnieżdżone listy (praca w komisjach)
-                nested_ul = li.find('ul')
-                if nested_ul:
-                    nested_stages = self._parse_nested_stages(nested_ul)
-                    stages.extend(nested_stages)
+        all_stages = self._parse_process_stages(soup)
         
-        except Exception as e:
-            raise DataParseError(f"Błąd podczas parsowania etapów procesu: {e}") from e
+        # Zapisz etapy dla żądań warunkowych w kolejnych uruchomieniach
+        self.validator_cache.store_payload(
+            self._process_url(print_number),
+            [stage.to_json() for stage in all_stages]
+        )
         
-        return stages
+        return all_stages
     
-    def _parse_main_stage(self, li_element) -> Optional[Dict]:
+    def _update_project(
+        self,
+        project: Dict,
+        all_stages: Optional[List[ProcessStage]],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict:
         """
-        Parsuje główny etap procesu (class="krok").
+        Aktualizuje projekt na podstawie etapów procesu.
         
         Args:
-            li_element: Element <li class="krok">
+            project: Projekt Sejm do zaktualizowania (modyfikowany w miejscu)
+            all_stages: Wszystkie etapy procesu (None jeśli nie pobrano strony)
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
             
         Returns:
-            Słownik z danymi etapu lub None
+            Zaktualizowany projekt
         """
-        # Wyciągnij datę
-        date_span = li_element.find('span')
-        if not date_span:
-            return None
-        
-        date_str = date_span.get_text(strip=True)
-        date = parse_polish_date_full(date_str)
-        if not date:
-            logger.debug(f"Nie udało się sparsować daty: {date_str}")
-            return None
+        if all_stages is None:
+            logger.warning(f"Nie udało się pobrać strony dla projektu {project.get('id')}")
+            return project
         
-        # Wyciągnij typ etapu z <h3>
-        h3 = li_element.find('h3')
-        stage_type = h3.get_text(strip=True) if h3 else ""
-        
-        # Wyciągnij numer druku z linku jeśli jest
-        print_number = None
-        if h3:
-            print_link = h3.find('a', href=re.compile(r'druk\.xsp\?nr='))
-            if print_link:
-                match = re.search(r'nr=(\d+)', print_link.get('href', ''))
-                if match:
-                    print_number = match.group(1)
-        
-        # Wyciągnij szczegóły z <div>
-        details = {}
-        details_div = li_element.find('div')
-        if details_div:
-            # Przejdź przez wszystkie <p> w div
-            for p in details_div.find_all('p'):
-                text = p.get_text(strip=True)
-                if not text:
-                    continue
-                
-                # Nr posiedzenia
-                if 'Nr posiedzenia:' in text:
-                    strong = p.find('strong')
-                    if strong:
-                        details['sitting_number'] = strong.get_text(strip=True)
-                
-                # Głosowanie
-                elif text.startswith('Głosowanie:'):
-                    details['voting'] = text.replace('Głosowanie:', '').strip()
-                
-                # Wynik głosowania
-                elif text.startswith('Wynik:'):
-                    details['voting_result'] = text.replace('Wynik:', '').strip()
-                
-                # Decyzja
-                elif text.startswith('Decyzja:'):
-                    details['decision'] = text.replace('Decyzja:', '').strip()
-                
-                # Komentarz
-                elif text.startswith('Komentarz:'):
-                    details['comment'] = text.replace('Komentarz:', '').strip()
-            
-            # Zbierz wszystkie teksty jako opis
-            all_texts = [p.get_text(strip=True) for p in details_div.find_all('p') if p.get_text(strip=True)]
-            details['description'] = ' | '.join(all_texts) if all_texts else ""
-        
-        return {
-            'date': date,
-            'stage_type': stage_type,
-            'print_number': print_number,
-            **details
-        }
+        return self._apply_stages(project, all_stages, start_date, end_date)
     
-    def _parse_nested_stages(self, ul_element) -> List[Dict]:
+    def _apply_stages(
+        self,
+        project: Dict,
+        all_stages: List[ProcessStage],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict:
         """
-        Parsuje zagnieżdżone etapy (praca w komisjach).
+        Wybiera etapy z zakresu dat i zapisuje je w projekcie.
         
         Args:
-            ul_element: Element <ul> z zagnieżdżonymi etapami
+            project: Projekt Sejm do zaktualizowania (modyfikowany w miejscu)
+            all_stages: Wszystkie etapy procesu
+            start_date: Data początkowa zakresu
+            end_date: Data końcowa zakresu
             
         Returns:
-            Lista słowników z etapami
+            Zaktualizowany projekt
         """
-        stages = []
+        project_id = str(project.get('id'))
         
-        for li in ul_element.find_all('li', recursive=False):
-            # Etapy z datą (class="koniec" lub "poczatek")
-            if 'koniec' in li.get('class', []) or 'poczatek' in li.get('class', []):
-                stage = self._parse_nested_stage(li)
-                if stage:
-                    stages.append(stage)
+        if not all_stages:
+            logger.debug(f"  Brak etapów dla projektu {project_id}")
+            return project
         
-        return stages
+        logger.debug(f"  Znaleziono {len(all_stages)} etapów procesu")
+        
+        # Filtruj etapy w zakresie dat
+        stages_in_range = [
+            stage for stage in all_stages
+            if start_date <= stage.date <= end_date
+        ]
+        
+        if stages_in_range:
+            # Znajdź najnowszą datę
+            latest_date = max(stage.date for stage in stages_in_range)
+            project['last_hit'] = latest_date.strftime('%Y-%m-%d')
+            
+            # Zapisz wszystkie etapy z zakresu
+            project['referred_to'] = [stage.to_json() for stage in stages_in_range]
+            
+            logger.info(f"  ✓ Projekt {project_id}: Ostatnia zmiana: {latest_date.strftime('%Y-%m-%d')} (znaleziono {len(stages_in_range)} etapów)")
+        else:
+            logger.debug(f"  Brak zmian w okresie dla projektu {project_id}")
+            project['referred_to'] = []
+        
+        return project
     
-    def _parse_nested_stage(self, li_element) -> Optional[Dict]:
+    def _store_results(self, all_projects: List[Dict]) -> None:
         """
-        Parsuje zagnieżdżony etap (praca w komisjach).
+        Zapisuje wszystkie projekty (nie tylko Sejm) do pliku konfiguracyjnego.
         
         Args:
-            li_element: Element <li> z zagnieżdżonym etapem
-            
-        Returns:
-            Słownik z danymi etapu lub None
+            all_projects: Wszystkie projekty (projekty Sejm zaktualizowane w miejscu)
         """
-        # Wyciągnij datę jeśli jest
-        date_span = li_element.find('span')
-        date = None
-        if date_span:
-            date_str = date_span.get_text(strip=True)
-            date = parse_polish_date_full(date_str)
-        
-        # Wyciągnij typ etapu z <h3> lub <h4>
-        h3 = li_element.find('h3')
-        h4 = li_element.find('h4')
-        stage_type = ""
-        if h4:
-            stage_type = h4.get_text(strip=True)
-        elif h3:
-            stage_type = h3.get_text(strip=True)
-        
-        # Wyciągnij numer druku z linku jeśli jest
-        print_number = None
-        element_with_link = h4 or h3
-        if element_with_link:
-            print_link = element_with_link.find('a', href=re.compile(r'druk\.xsp\?nr='))
-            if print_link:
-                match = re.search(r'nr=(\d+)', print_link.get('href', ''))
-                if match:
-                    print_number = match.group(1)
-        
-        # Wyciągnij szczegóły z <div>
-        details = {}
-        details_div = li_element.find('div')
-        if details_div:
-            # Zbierz wszystkie teksty jako opis
-            all_texts = [p.get_text(strip=True) for p in details_div.find_all('p') if p.get_text(strip=True)]
-            details['description'] = ' | '.join(all_texts) if all_texts else ""
-        
-        # Jeśli nie ma daty, pomiń etap
-        if not date:
-            return None
+        all_projects_dict = {p.get('id'): p for p in all_projects}
         
-        return {
-            'date': date,
-            'stage_type': stage_type,
-            'print_number': print_number,
-            **details
-        }
+        try:
+            all_projects_updated = list(all_projects_dict.values())
+            self.save_projects(all_projects_updated)
+            logger.info("Wyniki zapisane do pliku konfiguracyjnego")
+        except Exception as e:
+            logger.error(f"Błąd podczas zapisywania projektów: {e}")
+            raise
     
-    def _format_stage_for_json(self, stage: Dict) -> Dict:
+    def _report_skipped(self) -> None:
+        """Loguje podsumowanie projektów pominiętych z powodu niedostępności hosta."""
+        if self.skipped_projects:
+            logger.warning(
+                f"Pominięto {len(self.skipped_projects)} projektów Sejm (host niedostępny): "
+                f"{', '.join(self.skipped_projects)}"
+            )
+    
+    def _stages_from_payload(self, payload: List[Dict]) -> List[ProcessStage]:
         """
-        Formatuje etap do zapisu w JSON (konwertuje datetime na string).
+        Odtwarza etapy procesu z wyniku zapisanego w cache walidatorów.
         
         Args:
-            stage: Słownik z danymi etapu
+            payload: Etapy w formacie ProcessStage.to_json()
             
         Returns:
-            Słownik gotowy do zapisu w JSON
+            Lista etapów procesu
         """
-        formatted = {
-            'date': stage['date'].strftime('%Y-%m-%d'),
-            'stage_type': stage.get('stage_type', ''),
-        }
-        
-        # Dodaj opcjonalne pola
-        if stage.get('print_number'):
-            formatted['print_number'] = stage['print_number']
-        
-        if stage.get('sitting_number'):
-            formatted['sitting_number'] = stage['sitting_number']
+        return [ProcessStage.from_json(stage) for stage in payload]
+    
+    def _process_url(self, print_number: str) -> str:
+        """Zwraca URL strony przebiegu procesu dla numeru druku."""
+        return f"{self.base_url}{SEJM_PROCESS_URL_TEMPLATE.format(number=normalize_project_id(print_number))}"
+    
+    def _fetch_process_page(self, print_number: str) -> Optional[BeautifulSoup]:
+        """
+        Pobiera stronę HTML przebiegu procesu legislacyjnego.
         
-        if stage.get('decision'):
-            formatted['decision'] = stage['decision']
+        Args:
+            print_number: Numer druku (ID projektu)
+            
+        Returns:
+            BeautifulSoup obiekt lub None w przypadku błędu
+            
+        Raises:
+            SejmConnectionError: Jeśli nie udało się pobrać strony
+            HostUnavailableError: Jeśli Sejm uznano za niedostępny (bez wysyłania żądania)
+            PageNotModified: Jeśli strona nie zmieniła się od ostatniego pobrania (HTTP 304)
+        """
+        url = self._process_url(print_number)
+        headers = self.validator_cache.conditional_headers(url)
         
-        if stage.get('voting_result'):
-            formatted['voting_result'] = stage['voting_result']
+        try:
+            response = retry_request(
+                lambda: self.http_client.fetch(url, headers=headers),
+                max_retries=3,
+                retry_delay=1.0,
+                retry_budget=self.http_client.retry_budget
+            )
+            if response.status_code == 304:
+                payload = self.validator_cache.get_payload(url)
+                if payload is not None:
+                    self.validator_cache.record_hit()
+                    raise PageNotModified(url, payload)
+                # Brak zapisanego wyniku - pobierz stronę bez nagłówków warunkowych
+                response = retry_request(
+                    lambda: self.http_client.fetch(url),
+                    max_retries=3,
+                    retry_delay=1.0,
+                    retry_budget=self.http_client.retry_budget
+                )
+            
+            self.validator_cache.record_miss()
+            self.validator_cache.remember_validators(url, response.headers)
+            return make_soup(response.content)
+        except (requests.RequestException, CacheMissError) as e:
+            raise SejmConnectionError(f"Błąd przy pobieraniu strony procesu dla druku {print_number}: {e}") from e
+    
+    def _parse_process_stages(self, soup: BeautifulSoup) -> List[ProcessStage]:
+        """
+        Parsuje wszystkie etapy procesu legislacyjnego z HTML.
         
-        if stage.get('description'):
-            formatted['description'] = stage['description']
+        Args:
+            soup: BeautifulSoup obiekt strony procesu
+            
+        Returns:
+            Lista etapów procesu
+            
+        Raises:
+            DataParseError: Jeśli wystąpi błąd podczas parsowania
+        """
+        try:
+            stages = extract_process_stages(soup)
+        except Exception as e:
+            raise DataParseError(f"Błąd podczas parsowania etapów procesu: {e}") from e
         
-        if stage.get('comment'):
-            formatted['comment'] = stage['comment']
+        if stages is None:
+            logger.warning("Nie znaleziono listy procesu legislacyjnego")
+            return []
         
-        return formatted
+        return stages
@@ -0,0 +1,29 @@
+"""Parsowanie stron HTML (RCL, Sejm)."""
+
+from .html_backend import get_html_parser, make_soup
+from .rcl_project_page import extract_modification_dates
+from .rcl_search_results import (
+    SearchRow,
+    aextract_result_count_from_page,
+    aextract_search_rows_from_page,
+    extract_result_count,
+    extract_result_count_from_page,
+    extract_search_rows,
+    extract_search_rows_from_page,
+)
+from .sejm_process import ProcessStage, extract_process_stages
+
+__all__ = [
+    'get_html_parser',
+    'make_soup',
+    'extract_modification_dates',
+    'SearchRow',
+    'extract_search_rows',
+    'extract_search_rows_from_page',
+    'aextract_search_rows_from_page',
+    'extract_result_count',
+    'extract_result_count_from_page',
+    'aextract_result_count_from_page',
+    'ProcessStage',
+    'extract_process_stages',
+]
@@ -0,0 +1,80 @@
+"""Wybór parsera HTML używanego przez BeautifulSoup."""
+
+import os
+from typing import Dict, Optional, Set, Union
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+from ..constants import DEFAULT_HTML_PARSER, HTML_PARSER_BACKENDS, HTML_PARSER_ENV
+from ..exceptions import ConfigurationError
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Wynik sprawdzenia dostępności parsera (czy biblioteka jest zainstalowana)
+_availability: Dict[str, bool] = {}
+_warned: Set[str] = set()
+
+
+def _is_available(parser: str) -> bool:
+    """Sprawdza (raz na proces), czy BeautifulSoup może użyć danego parsera."""
+    if parser not in _availability:
+        try:
+            BeautifulSoup('', parser)
+            _availability[parser] = True
+        except FeatureNotFound:
+            _availability[parser] = False
+    return _availability[parser]
+
+
+def get_html_parser(parser: Optional[str] = None) -> str:
+    """
+    Zwraca nazwę parsera HTML do użycia.
+    
+    Kolejność: argument, zmienna środowiskowa PL_MONITORING_HTML_PARSER,
+    DEFAULT_HTML_PARSER ('lxml'). Jeśli wybrana biblioteka nie jest
+    zainstalowana, używany jest wbudowany 'html.parser'.
+    
+    Args:
+        parser: Nazwa parsera ('lxml', 'html.parser', 'html5lib')
+        
+    Returns:
+        Nazwa parsera przekazywana do BeautifulSoup
+        
+    Raises:
+        ConfigurationError: Jeśli podano nieznany parser
+    """
+    parser = parser or os.environ.get(HTML_PARSER_ENV) or DEFAULT_HTML_PARSER
+    
+    if parser not in HTML_PARSER_BACKENDS:
+        raise ConfigurationError(
+            f"Nieznany parser HTML: {parser} (dostępne: {', '.join(HTML_PARSER_BACKENDS)})"
+        )
+    
+    if not _is_available(parser):
+        if parser not in _warned:
+            _warned.add(parser)
+            logger.warning(f"Parser HTML '{parser}' nie jest zainstalowany, używam 'html.parser'")
+        return 'html.parser'
+    
+    return parser
+
+
+def make_soup(
+    markup: Union[str, bytes],
+    parser: Optional[str] = None,
+    parse_only: Optional[SoupStrainer] = None
+) -> BeautifulSoup:
+    """
+    Tworzy obiekt BeautifulSoup z wybranym parserem HTML.
+    
+    Args:
+        markup: Treść HTML
+        parser: Nazwa parsera (domyślnie get_html_parser())
+        parse_only: Ogranicza budowane drzewo do pasujących elementów
+            (html5lib ignoruje to ograniczenie i buduje całe drzewo)
+        
+    Returns:
+        BeautifulSoup obiekt
+    """
+    return BeautifulSoup(markup, get_html_parser(parser), parse_only=parse_only)
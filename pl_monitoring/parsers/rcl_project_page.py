@@ -0,0 +1,50 @@
+"""Szybkie wyciąganie dat modyfikacji ze strony projektu RCL bez budowania drzewa DOM."""
+
+import re
+from datetime import datetime
+from typing import List, Optional, Union
+
+from ..utils.date_utils import parse_polish_date
+
+_MODIFICATION_MARKER = b'Data ostatniej modyfikacji'
+
+# <div class="... small2 ...">...Data ostatniej modyfikacji: [tagi/spacje] DD-MM-YYYY
+# Treść diva nie może zawierać zamknięcia </div> przed datą (brak zagnieżdżonych divów).
+_MODIFICATION_DATE_RE = re.compile(
+    rb'<div\b[^>]*?\bclass\s*=\s*["\'](?:[^"\']*\s)?small2(?:\s[^"\']*)?["\'][^>]*>'
+    rb'(?:(?!</div)[^D]|D(?!ata ostatniej modyfikacji))*'
+    rb'Data ostatniej modyfikacji:(?:\s|&nbsp;|&#160;|<[^>]*>)*'
+    rb'(\d{2}-\d{2}-\d{4})',
+    re.IGNORECASE
+)
+
+
+def extract_modification_dates(html: Union[bytes, str]) -> Optional[List[datetime]]:
+    """
+    Wyciąga daty modyfikacji etapów skanując surowy HTML wyrażeniem regularnym.
+    
+    Wynik jest zwracany tylko wtedy, gdy każde wystąpienie tekstu
+    "Data ostatniej modyfikacji" zostało rozpoznane jako div.small2 z poprawną
+    datą. W przeciwnym razie (inny układ strony, brak dat) zwraca None i
+    wywołujący powinien sparsować całą stronę (make_soup).
+    
+    Args:
+        html: Treść strony projektu (bajty lub tekst)
+        
+    Returns:
+        Lista dat modyfikacji lub None jeśli szybka ścieżka nie dała pewnego wyniku
+    """
+    if isinstance(html, str):
+        html = html.encode('utf-8')
+    
+    matches = _MODIFICATION_DATE_RE.findall(html)
+    if not matches or len(matches) != html.count(_MODIFICATION_MARKER):
+        return None
+    
+    dates = []
+    for date_bytes in matches:
+        parsed_date = parse_polish_date(date_bytes.decode('ascii'))
+        if parsed_date is None:
+            return None
+        dates.append(parsed_date)
+    return dates
@@ -0,0 +1,325 @@
+"""Wyciąganie wierszy z tabeli wyników wyszukiwania RCL."""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from bs4 import SoupStrainer
+
+from ..utils.date_utils import parse_polish_date
+from .html_backend import make_soup
+
+_PROJECT_HREF_RE = re.compile(r'/projekt/(\d+)')
+_CHECKBOX_HREF_RE = re.compile(r'/zapisz/projekt')
+_RESULT_COUNT_RE = re.compile(r'Projekty według wybranych kryteriów:\s*(\d+)')
+_RESULT_COUNT_SCRIPT = (
+    "(pattern) => { const m = document.body.innerText.match(new RegExp(pattern)); return m ? m[1] : null; }"
+)
+
+# Drzewo budowane tylko dla tabeli wyników - reszta strony (menu, formularz) jest pomijana
+_RESULTS_TABLE = SoupStrainer('table', id='table')
+
+# Nagłówki kolumn tabeli wyników -> pola SearchRow
+_HEADER_COLUMNS = {
+    'Tytuł': 'title',
+    'Numer': 'number',
+    'Utworzony': 'created_date',
+    'Zmodyfikowany': 'updated_date',
+}
+
+# Układ kolumn, gdy tabela nie ma rozpoznawalnego nagłówka
+_DEFAULT_COLUMNS = {'title': 0, 'number': 2, 'created_date': 3, 'updated_date': 4}
+
+
+@dataclass
+class SearchRow:
+    """Wiersz tabeli wyników wyszukiwania RCL."""
+    
+    __slots__ = ('project_id', 'title', 'number', 'created_date', 'updated_date', 'updated')
+    
+    project_id: int
+    title: str
+    number: str
+    created_date: str
+    updated_date: str
+    updated: Optional[datetime]
+    
+    def to_dict(self) -> Dict:
+        """Zwraca wynik w formacie zapisywanym przez monitory RCL."""
+        return {
+            "title": self.title,
+            "id": self.project_id,
+            "updated_date": self.updated_date,
+            "number": self.number
+        }
+
+
+def _find_results_table(html: Union[str, bytes]):
+    """Zwraca tabelę wyników (table#table lub pierwszą tabelę z linkiem do projektu)."""
+    table = make_soup(html, parse_only=_RESULTS_TABLE).find('table', id='table')
+    if table is not None:
+        return table
+    
+    # Inny układ strony - parsujemy całość i szukamy tabeli z linkami do projektów
+    for link in make_soup(html).find_all('a', href=_PROJECT_HREF_RE):
+        table = link.find_parent('table')
+        if table is not None:
+            return table
+    return None
+
+
+def _resolve_columns(header) -> Tuple[Dict[str, int], int]:
+    """Ustala pozycje kolumn i szerokość nagłówka na podstawie pierwszego wiersza tabeli."""
+    header_cells = header.find_all(['th', 'td'], recursive=False)
+    
+    columns = {}
+    for idx, cell in enumerate(header_cells):
+        field = _HEADER_COLUMNS.get(cell.get_text(strip=True))
+        if field:
+            columns[field] = idx
+    
+    if 'title' not in columns or 'updated_date' not in columns:
+        return dict(_DEFAULT_COLUMNS), 0
+    return columns, len(header_cells)
+
+
+def extract_search_rows(html: Union[str, bytes]) -> Optional[List[SearchRow]]:
+    """
+    Wyciąga wiersze z tabeli wyników wyszukiwania RCL w jednym przejściu.
+    
+    Pozycje kolumn są ustalane z nagłówka tabeli. Jeśli wiersz ma więcej komórek
+    niż nagłówek (np. dodatkowa kolumna z checkboxem na początku), indeksy są
+    przesuwane o różnicę. Tabela bez rozpoznawalnego nagłówka jest czytana
+    według domyślnego układu kolumn RCL.
+    
+    Args:
+        html: Treść strony wyników wyszukiwania
+        
+    Returns:
+        Lista wierszy z linkiem do projektu lub None jeśli nie znaleziono tabeli wyników
+    """
+    table = _find_results_table(html)
+    if table is None:
+        return None
+    
+    table_rows = table.find_all('tr')
+    if len(table_rows) < 2:
+        return []
+    
+    columns, header_width = _resolve_columns(table_rows[0])
+    title_idx = columns['title']
+    updated_idx = columns['updated_date']
+    number_idx = columns.get('number')
+    created_idx = columns.get('created_date')
+    
+    rows = []
+    for row in table_rows[1:]:
+        cells = row.find_all(['td', 'th'], recursive=False)
+        if header_width:
+            offset = max(0, len(cells) - header_width)
+        else:
+            # Bez nagłówka: pierwsza kolumna może zawierać checkbox zapisu projektu
+            offset = 1 if cells and cells[0].find('a', href=_CHECKBOX_HREF_RE) else 0
+        if updated_idx + offset >= len(cells):
+            continue
+        
+        title_link = cells[title_idx + offset].find('a', href=_PROJECT_HREF_RE)
+        if title_link is None:
+            continue
+        
+        updated_date = cells[updated_idx + offset].get_text(strip=True)
+        rows.append(SearchRow(
+            project_id=int(_PROJECT_HREF_RE.search(title_link['href']).group(1)),
+            title=title_link.get_text(strip=True),
+            number=cells[number_idx + offset].get_text(strip=True) if number_idx is not None else "",
+            created_date=cells[created_idx + offset].get_text(strip=True) if created_idx is not None else "",
+            updated_date=updated_date,
+            updated=parse_polish_date(updated_date)
+        ))
+    
+    return rows
+
+
+# Wyciąganie wierszy w przeglądarce (page.evaluate) - ta sama logika co extract_search_rows,
+# ale zamiast serializować cały DOM (page.content()) zwraca tylko wiersze jako krotki
+# [id, tytuł, numer, utworzony, zmodyfikowany] albo null, gdy strona nie ma tabeli wyników
+_SEARCH_ROWS_SCRIPT = r"""
+({headers, defaults}) => {
+    const projectHref = /\/projekt\/(\d+)/;
+    const checkboxHref = /\/zapisz\/projekt/;
+    
+    // Odpowiednik get_text(strip=True): przycięte fragmenty tekstu sklejone bez separatora
+    const text = (node) => {
+        let out = '';
+        const walk = (parent) => {
+            for (const child of parent.childNodes) {
+                if (child.nodeType === 3) {
+                    out += child.nodeValue.trim();
+                } else if (child.nodeType === 1 && child.tagName !== 'SCRIPT' && child.tagName !== 'STYLE') {
+                    walk(child);
+                }
+            }
+        };
+        walk(node);
+        return out;
+    };
+    const cellsOf = (row) => Array.from(row.children).filter((c) => c.tagName === 'TD' || c.tagName === 'TH');
+    const projectLink = (root) => Array.from(root.querySelectorAll('a'))
+        .find((a) => projectHref.test(a.getAttribute('href') || ''));
+    
+    let table = document.querySelector('table#table');
+    if (!table) {
+        const link = projectLink(document);
+        table = link ? link.closest('table') : null;
+    }
+    if (!table) {
+        return null;
+    }
+    
+    const rows = Array.from(table.querySelectorAll('tr'));
+    if (rows.length < 2) {
+        return [];
+    }
+    
+    const headerCells = cellsOf(rows[0]);
+    let columns = {};
+    headerCells.forEach((cell, idx) => {
+        const field = headers[text(cell)];
+        if (field) {
+            columns[field] = idx;
+        }
+    });
+    let headerWidth = headerCells.length;
+    if (columns.title === undefined || columns.updated_date === undefined) {
+        columns = defaults;
+        headerWidth = 0;
+    }
+    
+    const result = [];
+    for (const row of rows.slice(1)) {
+        const cells = cellsOf(row);
+        let offset;
+        if (headerWidth) {
+            offset = Math.max(0, cells.length - headerWidth);
+        } else {
+            const first = cells.length ? Array.from(cells[0].querySelectorAll('a')) : [];
+            offset = first.some((a) => checkboxHref.test(a.getAttribute('href') || '')) ? 1 : 0;
+        }
+        if (columns.updated_date + offset >= cells.length) {
+            continue;
+        }
+        
+        const link = projectLink(cells[columns.title + offset]);
+        if (!link) {
+            continue;
+        }
+        const cellText = (field) => columns[field] === undefined ? '' : text(cells[columns[field] + offset]);
+        result.push([
+            Number(projectHref.exec(link.getAttribute('href'))[1]),
+            text(link),
+            cellText('number'),
+            cellText('created_date'),
+            cellText('updated_date')
+        ]);
+    }
+    return result;
+}
+"""
+
+
+def extract_search_rows_from_page(page: Any) -> Optional[List[SearchRow]]:
+    """
+    Wyciąga wiersze tabeli wyników skryptem wykonywanym w przeglądarce.
+    
+    Do Pythona trafiają tylko pola wierszy zamiast całego zserializowanego DOM,
+    który dla dużych wyszukiwań ma ponad 1 MB. Wynik jest taki sam jak
+    extract_search_rows(page.content()).
+    
+    Args:
+        page: Playwright Page obiekt ze stroną wyników wyszukiwania
+        
+    Returns:
+        Lista wierszy z linkiem do projektu lub None jeśli nie znaleziono tabeli wyników
+    """
+    return _rows_from_script(page.evaluate(_SEARCH_ROWS_SCRIPT, _script_arg()))
+
+
+async def aextract_search_rows_from_page(page: Any) -> Optional[List[SearchRow]]:
+    """
+    Asynchroniczny odpowiednik extract_search_rows_from_page (playwright.async_api).
+    
+    Args:
+        page: Asynchroniczny Playwright Page obiekt ze stroną wyników wyszukiwania
+        
+    Returns:
+        Lista wierszy z linkiem do projektu lub None jeśli nie znaleziono tabeli wyników
+    """
+    return _rows_from_script(await page.evaluate(_SEARCH_ROWS_SCRIPT, _script_arg()))
+
+
+def _script_arg() -> Dict[str, Dict]:
+    """Argument skryptu _SEARCH_ROWS_SCRIPT: nagłówki kolumn i domyślny układ tabeli."""
+    return {'headers': _HEADER_COLUMNS, 'defaults': _DEFAULT_COLUMNS}
+
+
+def _rows_from_script(data: Optional[List[List]]) -> Optional[List[SearchRow]]:
+    """Zamienia krotki zwrócone przez _SEARCH_ROWS_SCRIPT na SearchRow."""
+    if data is None:
+        return None
+    
+    return [
+        SearchRow(
+            project_id=int(project_id),
+            title=title,
+            number=number,
+            created_date=created_date,
+            updated_date=updated_date,
+            updated=parse_polish_date(updated_date)
+        )
+        for project_id, title, number, created_date, updated_date in data
+    ]
+
+
+def extract_result_count(html: Union[str, bytes]) -> Optional[int]:
+    """
+    Odczytuje liczbę wyników z nagłówka "Projekty według wybranych kryteriów: N".
+    
+    Args:
+        html: Treść strony wyników wyszukiwania (bajty w UTF-8 lub tekst)
+        
+    Returns:
+        Liczba znalezionych projektów lub None jeśli strona nie zawiera nagłówka wyników
+    """
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+    match = _RESULT_COUNT_RE.search(html)
+    return int(match.group(1)) if match else None
+
+
+def extract_result_count_from_page(page: Any) -> Optional[int]:
+    """
+    Odczytuje liczbę wyników ze strony w przeglądarce (bez serializacji całego DOM).
+    
+    Args:
+        page: Playwright Page obiekt ze stroną wyników wyszukiwania
+        
+    Returns:
+        Liczba znalezionych projektów lub None jeśli strona nie zawiera nagłówka wyników
+    """
+    count = page.evaluate(_RESULT_COUNT_SCRIPT, _RESULT_COUNT_RE.pattern)
+    return int(count) if count is not None else None
+
+
+async def aextract_result_count_from_page(page: Any) -> Optional[int]:
+    """
+    Asynchroniczny odpowiednik extract_result_count_from_page (playwright.async_api).
+    
+    Args:
+        page: Asynchroniczny Playwright Page obiekt ze stroną wyników wyszukiwania
+        
+    Returns:
+        Liczba znalezionych projektów lub None jeśli strona nie zawiera nagłówka wyników
+    """
+    count = await page.evaluate(_RESULT_COUNT_SCRIPT, _RESULT_COUNT_RE.pattern)
+    return int(count) if count is not None else None
@@ -0,0 +1,243 @@
+"""Wyciąganie etapów procesu legislacyjnego ze strony przebiegu procesu w Sejmie."""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional
+
+from bs4 import BeautifulSoup, Tag
+
+from ..constants import DEFAULT_DATE_FORMAT
+from ..utils.date_utils import parse_polish_date_full
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_PROCESS_LIST_CLASS_RE = re.compile(r'proces')
+_PRINT_HREF_RE = re.compile(r'druk\.xsp\?nr=')
+_PRINT_NUMBER_RE = re.compile(r'nr=(\d+)')
+
+_MAIN_STAGE_TAGS = frozenset(('span', 'h3', 'div', 'ul'))
+_NESTED_STAGE_TAGS = frozenset(('span', 'h3', 'h4', 'div'))
+
+# Prefiksy akapitów ze szczegółami etapu -> pola ProcessStage
+_DETAIL_PREFIXES = (
+    ('Głosowanie:', 'voting'),
+    ('Wynik:', 'voting_result'),
+    ('Decyzja:', 'decision'),
+    ('Komentarz:', 'comment'),
+)
+
+# Pola opcjonalne zapisywane w JSON (w tej kolejności), jeśli są niepuste
+_JSON_OPTIONAL_FIELDS = ('print_number', 'sitting_number', 'decision', 'voting_result', 'description', 'comment')
+
+
+@dataclass
+class ProcessStage:
+    """Etap procesu legislacyjnego (data jest od razu zapisana także jako tekst do JSON)."""
+    
+    __slots__ = (
+        'date', 'date_str', 'stage_type', 'print_number', 'sitting_number',
+        'voting', 'voting_result', 'decision', 'comment', 'description'
+    )
+    
+    date: datetime
+    date_str: str
+    stage_type: str
+    print_number: Optional[str]
+    sitting_number: Optional[str]
+    voting: Optional[str]
+    voting_result: Optional[str]
+    decision: Optional[str]
+    comment: Optional[str]
+    description: Optional[str]
+    
+    def to_json(self) -> Dict:
+        """
+        Zwraca etap w formacie zapisywanym w projects.json i cache walidatorów.
+        
+        Returns:
+            Słownik z datą YYYY-MM-DD, typem etapu i niepustymi polami opcjonalnymi
+        """
+        formatted = {'date': self.date_str, 'stage_type': self.stage_type}
+        for field in _JSON_OPTIONAL_FIELDS:
+            value = getattr(self, field)
+            if value:
+                formatted[field] = value
+        return formatted
+    
+    @classmethod
+    def from_json(cls, data: Dict) -> 'ProcessStage':
+        """
+        Odtwarza etap z formatu zwracanego przez to_json().
+        
+        Args:
+            data: Słownik z danymi etapu
+            
+        Returns:
+            Etap procesu
+        """
+        return cls(
+            date=datetime.strptime(data['date'], DEFAULT_DATE_FORMAT),
+            date_str=data['date'],
+            stage_type=data.get('stage_type', ''),
+            print_number=data.get('print_number'),
+            sitting_number=data.get('sitting_number'),
+            voting=data.get('voting'),
+            voting_result=data.get('voting_result'),
+            decision=data.get('decision'),
+            comment=data.get('comment'),
+            description=data.get('description')
+        )
+
+
+def _first_tags(element: Tag, names: FrozenSet[str]) -> Dict[str, Tag]:
+    """Zwraca pierwsze wystąpienie każdego z tagów w jednym przejściu po potomkach elementu."""
+    found = {}
+    for node in element.descendants:
+        name = node.name
+        if name in names and name not in found:
+            found[name] = node
+            if len(found) == len(names):
+                break
+    return found
+
+
+def _named(nodes: Iterable, name: str) -> Iterator[Tag]:
+    """Filtruje węzły po nazwie tagu (tańsze niż find_all, które za każdym razem buduje filtr)."""
+    return (node for node in nodes if node.name == name)
+
+
+def _print_number(heading: Optional[Tag]) -> Optional[str]:
+    """Wyciąga numer druku z linku w nagłówku etapu."""
+    if heading is None:
+        return None
+    for link in _named(heading.descendants, 'a'):
+        href = link.get('href')
+        if href and _PRINT_HREF_RE.search(href):
+            match = _PRINT_NUMBER_RE.search(href)
+            return match.group(1) if match else None
+    return None
+
+
+def _stage_date(span: Optional[Tag]) -> Optional[datetime]:
+    """Parsuje datę etapu ze <span>."""
+    return parse_polish_date_full(span.get_text(strip=True)) if span is not None else None
+
+
+def _parse_main_stage(tags: Dict[str, Tag]) -> Optional[ProcessStage]:
+    """Parsuje główny etap procesu (<li class="krok">) z jego pierwszych tagów span/h3/div."""
+    span = tags.get('span')
+    if span is None:
+        return None
+    
+    date = _stage_date(span)
+    if not date:
+        logger.debug(f"Nie udało się sparsować daty: {span.get_text(strip=True)}")
+        return None
+    
+    h3 = tags.get('h3')
+    details = {}
+    description = None
+    details_div = tags.get('div')
+    if details_div is not None:
+        texts = []
+        for p in _named(details_div.descendants, 'p'):
+            text = p.get_text(strip=True)
+            if not text:
+                continue
+            texts.append(text)
+            
+            if 'Nr posiedzenia:' in text:
+                strong = next(_named(p.descendants, 'strong'), None)
+                if strong:
+                    details['sitting_number'] = strong.get_text(strip=True)
+                continue
+            
+            for prefix, field in _DETAIL_PREFIXES:
+                if text.startswith(prefix):
+                    details[field] = text.replace(prefix, '').strip()
+                    break
+        description = ' | '.join(texts)
+    
+    return ProcessStage(
+        date=date,
+        date_str=date.strftime(DEFAULT_DATE_FORMAT),
+        stage_type=h3.get_text(strip=True) if h3 is not None else "",
+        print_number=_print_number(h3),
+        sitting_number=details.get('sitting_number'),
+        voting=details.get('voting'),
+        voting_result=details.get('voting_result'),
+        decision=details.get('decision'),
+        comment=details.get('comment'),
+        description=description
+    )
+
+
+def _parse_nested_stage(li: Tag) -> Optional[ProcessStage]:
+    """Parsuje zagnieżdżony etap (praca w komisjach)."""
+    tags = _first_tags(li, _NESTED_STAGE_TAGS)
+    date = _stage_date(tags.get('span'))
+    if not date:
+        return None
+    
+    heading = tags.get('h4') or tags.get('h3')
+    description = None
+    details_div = tags.get('div')
+    if details_div is not None:
+        texts = [text for text in (p.get_text(strip=True) for p in _named(details_div.descendants, 'p')) if text]
+        description = ' | '.join(texts)
+    
+    return ProcessStage(
+        date=date,
+        date_str=date.strftime(DEFAULT_DATE_FORMAT),
+        stage_type=heading.get_text(strip=True) if heading is not None else "",
+        print_number=_print_number(heading),
+        sitting_number=None,
+        voting=None,
+        voting_result=None,
+        decision=None,
+        comment=None,
+        description=description
+    )
+
+
+def extract_process_stages(soup: BeautifulSoup) -> Optional[List[ProcessStage]]:
+    """
+    Wyciąga etapy procesu w jednym przejściu po liście ul.proces.
+    
+    Główne etapy to <li class="krok">, a etapy pracy w komisjach to
+    <li class="poczatek|koniec"> w zagnieżdżonej liście.
+    
+    Args:
+        soup: BeautifulSoup obiekt strony procesu
+        
+    Returns:
+        Lista etapów w kolejności ze strony lub None jeśli nie znaleziono listy procesu
+    """
+    process_list = soup.find('ul', class_=_PROCESS_LIST_CLASS_RE)
+    if process_list is None:
+        return None
+    
+    stages = []
+    for li in _named(process_list.children, 'li'):
+        classes = li.get('class', [])
+        if 'rok' in classes:
+            continue
+        
+        tags = _first_tags(li, _MAIN_STAGE_TAGS)
+        if 'krok' in classes:
+            stage = _parse_main_stage(tags)
+            if stage:
+                stages.append(stage)
+        
+        nested_ul = tags.get('ul')
+        if nested_ul is not None:
+            for nested_li in _named(nested_ul.children, 'li'):
+                nested_classes = nested_li.get('class', [])
+                if 'koniec' in nested_classes or 'poczatek' in nested_classes:
+                    stage = _parse_nested_stage(nested_li)
+                    if stage:
+                        stages.append(stage)
+    
+    return stages
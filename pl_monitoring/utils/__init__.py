@@ -1,17 +1,33 @@
 """Moduł z narzędziami pomocniczymi."""
 
+from .async_rcl_browser_manager import AsyncRCLBrowserManager
+from .browser_launcher import BrowserLauncher
+from .browser_waits import BrowserWaits, WaitTimings
 from .date_utils import parse_polish_date, parse_date
-from .http_client import get_browser_context, get_http_headers
+from .http_client import HTTPClient, get_browser_context, get_default_http_client, get_http_headers
 from .logger import setup_logger, get_logger
-from .rcl_browser_manager import RCLBrowserManager
+from .rcl_browser_manager import RCLBrowserManager, RCLBrowserPool
+from .resource_blocking import ResourceBlockingProfile
+from .response_cache import ResponseCache
+from .validator_cache import ValidatorCache
 
 __all__ = [
+    'AsyncRCLBrowserManager',
+    'BrowserLauncher',
+    'BrowserWaits',
+    'WaitTimings',
     'parse_polish_date',
     'parse_date',
     'get_browser_context',
     'get_http_headers',
+    'HTTPClient',
+    'get_default_http_client',
     'setup_logger',
     'get_logger',
     'RCLBrowserManager',
+    'RCLBrowserPool',
+    'ResourceBlockingProfile',
+    'ResponseCache',
+    'ValidatorCache',
 ]
 
@@ -0,0 +1,295 @@
+"""Asynchroniczne zarządzanie przeglądarką dla monitorów RCL (playwright.async_api)."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from playwright.async_api import async_playwright
+
+from ..constants import (
+    RCL_ASYNC_BROWSER_PAGES,
+    RCL_BASE_URL,
+    RCL_BROWSER_CRASH_RETRIES,
+    RCL_BROWSER_MAX_JS_HEAP_MB,
+    RCL_BROWSER_MAX_NAVIGATIONS,
+    RCL_RESULT_COUNT_TEXT,
+    RCL_SEARCH_FORM_SELECTOR,
+)
+from ..utils.browser_launcher import BrowserLauncher
+from ..utils.browser_waits import BrowserWaits, WaitTimings
+from ..utils.logger import get_logger
+from ..utils.rcl_browser_manager import _RESET_SEARCH_FORM_SCRIPT
+from ..utils.resource_blocking import ResourceBlockingProfile
+
+logger = get_logger(__name__)
+
+R = TypeVar('R')
+
+
+class AsyncRCLBrowserManager:
+    """
+    Jedna przeglądarka z wieloma stronami sterowanymi równolegle w jednej pętli zdarzeń.
+    
+    Asynchroniczne API Playwright nie jest związane z wątkiem, więc zamiast
+    puli wątków (RCLBrowserPool) wystarcza jeden kontekst i semafor
+    ograniczający liczbę jednocześnie używanych stron. Wolne strony są
+    używane ponownie; strona po awarii renderera, zamknięta, po limicie
+    nawigacji lub pamięci jest odrzucana i przy następnym użyciu otwierana od nowa.
+    """
+    
+    def __init__(
+        self,
+        active_tab: str = 'tab1',
+        max_pages: int = RCL_ASYNC_BROWSER_PAGES,
+        headless: bool = True,
+        waits: Optional[BrowserWaits] = None,
+        launcher: Optional[BrowserLauncher] = None,
+        resource_blocking: Optional[ResourceBlockingProfile] = None,
+        max_navigations: int = RCL_BROWSER_MAX_NAVIGATIONS,
+        max_js_heap_mb: Optional[int] = RCL_BROWSER_MAX_JS_HEAP_MB
+    ):
+        """
+        Inicjalizuje manager przeglądarki.
+        
+        Args:
+            active_tab: Aktywna zakładka ('tab1' dla tagów, 'tab2' dla wyszukiwania)
+            max_pages: Maksymalna liczba stron używanych jednocześnie
+            headless: Czy przeglądarka ma działać w trybie headless (gdy nie podano launchera)
+            waits: Strategia oczekiwania na stronę i formularz (dependency injection)
+            launcher: Launcher przeglądarki, np. z trwałym profilem (dependency injection)
+            resource_blocking: Profil blokowania zbędnych zasobów (gdy nie podano launchera)
+            max_navigations: Liczba nawigacji, po której strona jest zamykana
+            max_js_heap_mb: Limit sterty JS strony w MB, po którego przekroczeniu strona
+                jest zamykana (None - bez limitu)
+        """
+        self.active_tab = active_tab
+        self.max_pages = max(1, max_pages)
+        self.max_navigations = max_navigations
+        self.max_js_heap_mb = max_js_heap_mb
+        self.timings = waits.timings if waits is not None else WaitTimings()
+        self.waits = waits or BrowserWaits(self.timings)
+        self.launcher = launcher or BrowserLauncher(headless=headless, resource_blocking=resource_blocking)
+        self.resource_blocking = self.launcher.resource_blocking
+        self.playwright = None
+        self.context = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._idle_pages: List[Any] = []
+        self._navigations: Dict[int, int] = {}
+        self._crashed: Dict[int, bool] = {}
+    
+    async def __aenter__(self):
+        """Async context manager entry - otwiera przeglądarkę."""
+        await self.start_browser()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - zamyka przeglądarkę."""
+        await self.close_browser()
+    
+    @property
+    def started(self) -> bool:
+        """Czy przeglądarka jest uruchomiona."""
+        return self.context is not None
+    
+    async def start_browser(self) -> None:
+        """
+        Uruchamia Playwright i przeglądarkę (strony są otwierane przy pierwszym użyciu).
+        
+        Przy błędzie uruchomienia zwalnia już utworzone zasoby.
+        """
+        logger.debug(f"Otwieranie przeglądarki (async) z activeTab={self.active_tab}, stron: {self.max_pages}")
+        try:
+            self.playwright = await async_playwright().start()
+            with self.waits.timed('start przeglądarki'):
+                self.context = await self.launcher.alaunch(self.playwright)
+        except Exception:
+            await self.close_browser()
+            raise
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+        # Kontekst trwały ma już otwartą pustą stronę - zostanie użyta jako pierwsza
+        self._idle_pages = list(self.context.pages)
+        for page in self._idle_pages:
+            self._watch(page)
+    
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """
+        Wypożycza stronę z załadowanym formularzem wyszukiwania.
+        
+        Czeka, jeśli wszystkie max_pages stron są w użyciu.
+        
+        Yields:
+            Asynchroniczny Playwright Page obiekt
+        """
+        if not self.started:
+            raise RuntimeError("Przeglądarka nie jest otwarta. Wywołaj start_browser() najpierw.")
+        
+        async with self._semaphore:
+            page = await self._take_page()
+            try:
+                yield page
+            finally:
+                await self._return_page(page)
+    
+    async def run(self, fn: Callable[[Any], Awaitable[R]]) -> Optional[R]:
+        """
+        Wykonuje fn(page) na wypożyczonej stronie, a po awarii strony powtarza je na nowej.
+        
+        Wynik zadania, w trakcie którego strona uległa awarii, jest odrzucany -
+        monitory zamieniają błędy strony na puste wyniki. Wyjątek z fn po
+        awarii strony również oznacza powtórzenie na nowej stronie.
+        
+        Args:
+            fn: Korutyna wykonująca wyszukiwanie na stronie
+            
+        Returns:
+            Wynik fn lub None, jeśli strona ulegała awarii przy każdej próbie
+            
+        Raises:
+            Exception: Wyjątek z fn, jeśli strona nie uległa awarii
+        """
+        for attempt in range(RCL_BROWSER_CRASH_RETRIES + 1):
+            async with self.page() as page:
+                try:
+                    result = await fn(page)
+                except Exception as e:
+                    if self.healthy(page):
+                        raise
+                    logger.debug(f"Błąd zadania po awarii strony: {e}")
+                    result = None
+                if self.healthy(page):
+                    return result
+            if attempt < RCL_BROWSER_CRASH_RETRIES:
+                logger.warning("Awaria strony podczas wyszukiwania - powtórzenie na nowej stronie")
+        logger.error("Wyszukiwanie przerwane awarią strony przeglądarki")
+        return None
+    
+    def healthy(self, page: Any) -> bool:
+        """Czy strona jest otwarta i jej renderer działa."""
+        return not self._crashed.get(id(page)) and not page.is_closed()
+    
+    async def clear_search_form(self, page: Any) -> None:
+        """
+        Czyści formularz wyszukiwania na stronie (w DOM, a jeśli to się nie uda - nawigacją).
+        
+        Args:
+            page: Strona wypożyczona przez page()
+        """
+        try:
+            with self.waits.timed('czyszczenie formularza'):
+                clean = await page.evaluate(
+                    _RESET_SEARCH_FORM_SCRIPT,
+                    {'formSelector': RCL_SEARCH_FORM_SELECTOR, 'countText': RCL_RESULT_COUNT_TEXT}
+                )
+        except Exception as e:
+            logger.debug(f"Nie udało się wyczyścić formularza w miejscu: {e}")
+            clean = False
+        
+        if not clean:
+            await self.waits.aopen_search_form(page, self._search_url())
+    
+    async def close_browser(self) -> None:
+        """Zamyka przeglądarkę i zwalnia zasoby."""
+        if self.context is not None:
+            logger.debug("Zamykanie przeglądarki (async)...")
+            try:
+                await self.launcher.aclose(self.context)
+            except Exception as e:
+                logger.warning(f"Błąd podczas zamykania przeglądarki: {e}")
+            finally:
+                self.context = None
+                self._idle_pages = []
+                self._navigations.clear()
+                self._crashed.clear()
+        
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+    
+    def log_stats(self) -> None:
+        """Wypisuje do logu czasy oczekiwania i liczbę zablokowanych zasobów."""
+        self.timings.log_summary()
+        self.resource_blocking.log_summary()
+    
+    async def _take_page(self) -> Any:
+        """Zwraca wolną stronę lub otwiera nową z formularzem wyszukiwania."""
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not self.healthy(page):
+                await self._discard(page)
+                continue
+            if not page.url.startswith(RCL_BASE_URL):
+                # Pusta strona kontekstu trwałego - wystarczy załadować formularz
+                await self.waits.aopen_search_form(page, self._search_url())
+            return page
+        
+        page = await self.context.new_page()
+        self._watch(page)
+        try:
+            await self.waits.aopen_search_form(page, self._search_url())
+        except Exception:
+            await self._discard(page)
+            raise
+        return page
+    
+    async def _return_page(self, page: Any) -> None:
+        """Oddaje stronę do ponownego użycia albo ją zamyka (awaria, limit nawigacji)."""
+        if not self.healthy(page):
+            logger.warning("Strona przeglądarki uległa awarii lub została zamknięta - zostanie otwarta nowa")
+            await self._discard(page)
+        elif self._navigations.get(id(page), 0) >= self.max_navigations:
+            logger.debug(f"Strona po {self._navigations[id(page)]} nawigacjach - zamykam, by zwolnić pamięć")
+            await self._discard(page)
+        elif await self._over_heap_limit(page):
+            await self._discard(page)
+        else:
+            self._idle_pages.append(page)
+    
+    async def _over_heap_limit(self, page: Any) -> bool:
+        """
+        Czy sterta JS strony przekracza max_js_heap_mb (performance.memory w Chromium).
+        
+        Playwright nie udostępnia RSS procesu renderera - sterta JS jest
+        najbliższą miarą dostępną ze strony.
+        """
+        if self.max_js_heap_mb is None:
+            return False
+        try:
+            used = await page.evaluate("() => performance.memory ? performance.memory.usedJSHeapSize : null")
+        except Exception as e:
+            logger.debug(f"Nie udało się odczytać pamięci strony: {e}")
+            return False
+        if used is None or used / (1024 * 1024) <= self.max_js_heap_mb:
+            return False
+        logger.debug(f"Sterta JS strony {used / (1024 * 1024):.0f} MB - zamykam, by zwolnić pamięć")
+        return True
+    
+    async def _discard(self, page: Any) -> None:
+        """Zamyka stronę i usuwa jej liczniki."""
+        self._navigations.pop(id(page), None)
+        self._crashed.pop(id(page), None)
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            logger.debug(f"Błąd podczas zamykania strony: {e}")
+    
+    def _watch(self, page: Any) -> None:
+        """Włącza zliczanie nawigacji i wykrywanie awarii renderera strony."""
+        self._navigations[id(page)] = 0
+        self._crashed[id(page)] = False
+        page.on('crash', self._on_crash)
+        page.on('domcontentloaded', self._on_navigation)
+    
+    def _on_crash(self, page: Any) -> None:
+        """Oznacza stronę jako niesprawną po awarii renderera."""
+        logger.warning("Awaria renderera strony przeglądarki")
+        self._crashed[id(page)] = True
+    
+    def _on_navigation(self, page: Any) -> None:
+        """Zlicza nawigacje strony."""
+        self._navigations[id(page)] = self._navigations.get(id(page), 0) + 1
+    
+    def _search_url(self) -> str:
+        """URL strony wyszukiwania z czystym formularzem i aktywną zakładką."""
+        return f"{RCL_BASE_URL}/szukaj?activeTab={self.active_tab}#list"
@@ -0,0 +1,301 @@
+"""Uruchamianie Chromium (Playwright) z trwałym profilem lub zapisanym stanem sesji."""
+
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from playwright.sync_api import BrowserContext, Playwright, sync_playwright
+
+from ..constants import DEFAULT_USER_AGENT
+from ..utils.http_client import get_http_headers
+from ..utils.logger import get_logger
+from ..utils.resource_blocking import ResourceBlockingProfile
+
+logger = get_logger(__name__)
+
+
+def _try_lock_file(path: Path) -> Optional[IO]:
+    """
+    Próbuje zająć plik blokadą systemową bez czekania.
+    
+    Blokada obowiązuje także między procesami i jest zwalniana przez system,
+    gdy proces się zakończy (również po awarii).
+    
+    Args:
+        path: Ścieżka pliku blokady (tworzony, jeśli nie istnieje)
+        
+    Returns:
+        Otwarty plik trzymający blokadę lub None, jeśli plik jest już zablokowany
+    """
+    lock_file = open(path, 'a+')
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def _unlock_file(lock_file: IO) -> None:
+    """Zwalnia blokadę założoną przez _try_lock_file i zamyka plik."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError as e:
+        logger.debug(f"Nie udało się zwolnić blokady {lock_file.name}: {e}")
+    finally:
+        lock_file.close()
+
+
+class BrowserLauncher:
+    """
+    Uruchamia kontekst przeglądarki Chromium dla monitorów i fetcherów.
+    
+    Domyślnie przeglądarka działa w trybie headless (nie wymaga ekranu na
+    serwerze). Przy podanym user_data_dir kontekst jest trwały - cache HTTP,
+    ciasteczka i localStorage przechodzą między uruchomieniami, więc statyczne
+    zasoby RCL nie są pobierane za każdym razem od nowa. Chromium nie pozwala
+    dwóm procesom na jeden katalog profilu, dlatego równoległe przeglądarki
+    (pula) dostają kolejne podkatalogi profile-0, profile-1, ... Numer profilu
+    jest rezerwowany blokadą pliku profile-N.lock, więc także dwa równolegle
+    uruchomione skrypty (np. z crona) nie dostaną tego samego katalogu.
+    
+    Przy podanym storage_state ciasteczka i localStorage są wczytywane z pliku
+    przy starcie i zapisywane przy zamknięciu (bez cache HTTP).
+    """
+    
+    def __init__(
+        self,
+        headless: bool = True,
+        user_data_dir: Optional[Path] = None,
+        storage_state: Optional[Path] = None,
+        resource_blocking: Optional[ResourceBlockingProfile] = None
+    ):
+        """
+        Inicjalizuje launcher.
+        
+        Args:
+            headless: Czy przeglądarka ma działać w trybie headless
+            user_data_dir: Katalog trwałych profili przeglądarki (None - profil tymczasowy)
+            storage_state: Plik JSON ze stanem sesji (ciasteczka, localStorage) do wczytania i zapisania
+            resource_blocking: Profil blokowania zbędnych zasobów (domyślnie obrazy, czcionki, analityka)
+        """
+        self.headless = headless
+        self.user_data_dir = Path(user_data_dir) if user_data_dir is not None else None
+        self.storage_state = Path(storage_state) if storage_state is not None else None
+        self.resource_blocking = resource_blocking or ResourceBlockingProfile()
+        self._lock = threading.Lock()
+        # Numer profilu -> otwarty plik blokady profile-N.lock
+        self._profile_locks: Dict[int, IO] = {}
+        self._context_profiles: Dict[int, int] = {}
+    
+    def launch(self, playwright: Playwright) -> BrowserContext:
+        """
+        Uruchamia przeglądarkę i zwraca jej kontekst (z włączonym blokowaniem zasobów).
+        
+        Args:
+            playwright: Uruchomiona instancja Playwright (w wątku wywołującym)
+            
+        Returns:
+            Kontekst przeglądarki; zamykany przez close()
+        """
+        started = time.monotonic()
+        options = self._context_options()
+        
+        if self.user_data_dir is not None:
+            slot = self._acquire_profile()
+            profile_dir = self._profile_dir(slot)
+            try:
+                context = playwright.chromium.launch_persistent_context(
+                    str(profile_dir), headless=self.headless, **options
+                )
+            except Exception:
+                self._release_profile(slot)
+                raise
+            with self._lock:
+                self._context_profiles[id(context)] = slot
+            logger.debug(f"Uruchomiono przeglądarkę z profilem {profile_dir}")
+        else:
+            if self.storage_state is not None and self.storage_state.exists():
+                options['storage_state'] = str(self.storage_state)
+            browser = playwright.chromium.launch(headless=self.headless)
+            try:
+                context = browser.new_context(**options)
+            except Exception:
+                browser.close()
+                raise
+        
+        self.resource_blocking.install(context)
+        logger.debug(f"Start przeglądarki trwał {time.monotonic() - started:.2f}s")
+        return context
+    
+    async def alaunch(self, playwright: Any) -> Any:
+        """
+        Asynchroniczny odpowiednik launch (playwright.async_api).
+        
+        Args:
+            playwright: Uruchomiona instancja asynchronicznego Playwright
+            
+        Returns:
+            Asynchroniczny kontekst przeglądarki; zamykany przez aclose()
+        """
+        started = time.monotonic()
+        options = self._context_options()
+        
+        if self.user_data_dir is not None:
+            slot = self._acquire_profile()
+            profile_dir = self._profile_dir(slot)
+            try:
+                context = await playwright.chromium.launch_persistent_context(
+                    str(profile_dir), headless=self.headless, **options
+                )
+            except Exception:
+                self._release_profile(slot)
+                raise
+            with self._lock:
+                self._context_profiles[id(context)] = slot
+            logger.debug(f"Uruchomiono przeglądarkę z profilem {profile_dir}")
+        else:
+            if self.storage_state is not None and self.storage_state.exists():
+                options['storage_state'] = str(self.storage_state)
+            browser = await playwright.chromium.launch(headless=self.headless)
+            try:
+                context = await browser.new_context(**options)
+            except Exception:
+                await browser.close()
+                raise
+        
+        await self.resource_blocking.ainstall(context)
+        logger.debug(f"Start przeglądarki trwał {time.monotonic() - started:.2f}s")
+        return context
+    
+    def close(self, context: BrowserContext) -> None:
+        """
+        Zapisuje stan sesji (jeśli skonfigurowano storage_state) i zamyka kontekst oraz przeglądarkę.
+        
+        Args:
+            context: Kontekst zwrócony przez launch()
+        """
+        browser = context.browser
+        try:
+            if self.storage_state is not None:
+                self._save_storage_state(context)
+            context.close()
+            if browser is not None:
+                browser.close()
+        finally:
+            with self._lock:
+                slot = self._context_profiles.pop(id(context), None)
+            if slot is not None:
+                self._release_profile(slot)
+    
+    async def aclose(self, context: Any) -> None:
+        """
+        Asynchroniczny odpowiednik close.
+        
+        Args:
+            context: Kontekst zwrócony przez alaunch()
+        """
+        browser = context.browser
+        try:
+            if self.storage_state is not None:
+                try:
+                    self.storage_state.parent.mkdir(parents=True, exist_ok=True)
+                    await context.storage_state(path=str(self.storage_state))
+                except Exception as e:
+                    logger.warning(f"Nie udało się zapisać stanu sesji przeglądarki: {e}")
+            await context.close()
+            if browser is not None:
+                await browser.close()
+        finally:
+            with self._lock:
+                slot = self._context_profiles.pop(id(context), None)
+            if slot is not None:
+                self._release_profile(slot)
+    
+    @contextmanager
+    def session(self) -> Iterator[BrowserContext]:
+        """
+        Uruchamia Playwright i przeglądarkę na czas bloku, a potem wszystko zamyka.
+        
+        Loguje czas startu przeglądarki - przydatne dla jednorazowych pobrań
+        (np. rejestru KPRM), gdzie start to duża część całego czasu działania.
+        
+        Yields:
+            Kontekst przeglądarki
+        """
+        started = time.monotonic()
+        playwright = sync_playwright().start()
+        try:
+            context = self.launch(playwright)
+            logger.info(f"Przeglądarka uruchomiona w {time.monotonic() - started:.2f}s")
+            try:
+                yield context
+            finally:
+                self.close(context)
+        finally:
+            playwright.stop()
+    
+    def _save_storage_state(self, context: BrowserContext) -> None:
+        """Zapisuje ciasteczka i localStorage kontekstu do pliku storage_state."""
+        try:
+            self.storage_state.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                context.storage_state(path=str(self.storage_state))
+        except Exception as e:
+            logger.warning(f"Nie udało się zapisać stanu sesji przeglądarki: {e}")
+    
+    def _context_options(self) -> Dict[str, Any]:
+        """Ustawienia kontekstu wspólne dla wszystkich przeglądarek (User-Agent, viewport, nagłówki)."""
+        return {
+            'user_agent': DEFAULT_USER_AGENT,
+            'viewport': {'width': 1280, 'height': 720},
+            'extra_http_headers': get_http_headers(),
+        }
+    
+    def _profile_dir(self, slot: int) -> Path:
+        """Zwraca (i tworzy) katalog profilu o podanym numerze."""
+        profile_dir = self.user_data_dir / f"profile-{slot}"
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        return profile_dir
+    
+    def _acquire_profile(self) -> int:
+        """
+        Rezerwuje najniższy numer katalogu profilu, którego nie używa żaden proces.
+        
+        Numery zajęte w tym procesie są pomijane bez sięgania do plików, a
+        pozostałe rezerwowane blokadą pliku profile-N.lock w user_data_dir.
+        """
+        self.user_data_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            slot = 0
+            while True:
+                if slot not in self._profile_locks:
+                    lock_file = _try_lock_file(self.user_data_dir / f"profile-{slot}.lock")
+                    if lock_file is not None:
+                        self._profile_locks[slot] = lock_file
+                        return slot
+                    logger.debug(f"Profil profile-{slot} jest używany przez inny proces")
+                slot += 1
+    
+    def _release_profile(self, slot: int) -> None:
+        """Zwalnia numer katalogu profilu (i blokadę jego pliku)."""
+        with self._lock:
+            lock_file = self._profile_locks.pop(slot, None)
+        if lock_file is not None:
+            _unlock_file(lock_file)
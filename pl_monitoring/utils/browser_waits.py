@@ -0,0 +1,228 @@
+"""Oczekiwanie na konkretne zdarzenia na stronach RCL (zamiast stałych pauz) wraz z pomiarem czasu."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+
+from ..constants import (
+    PLAYWRIGHT_TIMEOUT,
+    RCL_RESULTS_WAIT_TIMEOUT,
+    RCL_SEARCH_FORM_SELECTOR,
+    RCL_SEARCH_RESULTS_SELECTOR,
+)
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class WaitTimings:
+    """Statystyki czasów oczekiwania (liczba, suma, maksimum) per rodzaj oczekiwania, bezpieczne wątkowo."""
+    
+    def __init__(self):
+        """Inicjalizuje puste statystyki."""
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Tuple[int, float, float]] = {}
+    
+    def record(self, label: str, seconds: float) -> None:
+        """
+        Zapisuje czas jednego oczekiwania.
+        
+        Args:
+            label: Rodzaj oczekiwania (np. 'wyniki', 'formularz')
+            seconds: Czas oczekiwania w sekundach
+        """
+        with self._lock:
+            count, total, longest = self._stats.get(label, (0, 0.0, 0.0))
+            self._stats[label] = (count + 1, total + seconds, max(longest, seconds))
+    
+    def summary(self) -> Dict[str, Tuple[int, float, float]]:
+        """
+        Zwraca kopię statystyk.
+        
+        Returns:
+            Słownik rodzaj oczekiwania -> (liczba, suma sekund, maksimum sekund)
+        """
+        with self._lock:
+            return dict(self._stats)
+    
+    def log_summary(self) -> None:
+        """Wypisuje do logu średni i maksymalny czas każdego rodzaju oczekiwania."""
+        for label, (count, total, longest) in sorted(self.summary().items()):
+            logger.info(
+                f"Oczekiwanie '{label}': {count}x, średnio {total / count:.2f}s, maks. {longest:.2f}s"
+            )
+
+
+class BrowserWaits:
+    """
+    Oczekiwanie na stronach RCL na konkretne warunki: gotowość pola formularza,
+    odpowiedź serwera na wyszukiwanie i pojawienie się tabeli wyników.
+    
+    Każde oczekiwanie trwa tyle, ile faktycznie potrzebuje serwer (a nie stałą
+    pauzę), a jego czas trafia do WaitTimings.
+    """
+    
+    def __init__(
+        self,
+        timings: Optional[WaitTimings] = None,
+        timeout: int = PLAYWRIGHT_TIMEOUT,
+        results_timeout: int = RCL_RESULTS_WAIT_TIMEOUT
+    ):
+        """
+        Inicjalizuje strategię oczekiwania.
+        
+        Args:
+            timings: Statystyki czasów oczekiwania (domyślnie nowe)
+            timeout: Limit czasu (ms) na załadowanie strony i odpowiedź na wyszukiwanie
+            results_timeout: Limit czasu (ms) na pojawienie się wyników po załadowaniu strony
+        """
+        self.timings = timings or WaitTimings()
+        self.timeout = timeout
+        self.results_timeout = results_timeout
+    
+    @contextmanager
+    def timed(self, label: str) -> Iterator[None]:
+        """Mierzy czas bloku i zapisuje go w statystykach pod podaną etykietą."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            self.timings.record(label, elapsed)
+            logger.debug(f"Oczekiwanie '{label}' trwało {elapsed:.2f}s")
+    
+    def open_search_form(self, page: Page, url: str) -> None:
+        """
+        Ładuje stronę wyszukiwania i czeka na formularz (bez czekania na bezczynność sieci).
+        
+        Args:
+            page: Playwright Page obiekt
+            url: URL strony wyszukiwania
+        """
+        with self.timed('formularz'):
+            page.goto(url, wait_until="domcontentloaded", timeout=self.timeout)
+            page.wait_for_selector(RCL_SEARCH_FORM_SELECTOR, state='attached', timeout=self.timeout)
+    
+    def open_results(self, page: Page, url: str) -> None:
+        """
+        Ładuje stronę wyników (np. wyszukiwanie po tagu) i czeka na wyniki.
+        
+        Args:
+            page: Playwright Page obiekt
+            url: URL strony wyników
+        """
+        with self.timed('strona wyników'):
+            page.goto(url, wait_until="domcontentloaded", timeout=self.timeout)
+        self.wait_for_results(page)
+    
+    def input_ready(self, page: Page, selector: str, visible: bool = True) -> None:
+        """
+        Czeka, aż pole formularza będzie dostępne do wypełnienia.
+        
+        Args:
+            page: Playwright Page obiekt
+            selector: Selektor pola (np. 'input#UEActValue')
+            visible: Czy pole ma być widoczne (False dla pól w zwiniętych sekcjach)
+        """
+        with self.timed('pole formularza'):
+            page.wait_for_selector(
+                f"{selector}:enabled",
+                state='visible' if visible else 'attached',
+                timeout=self.timeout
+            )
+    
+    def submit_search(self, page: Page, submit: Callable[[], None]) -> None:
+        """
+        Wysyła formularz wyszukiwania i czeka na odpowiedź serwera oraz wyniki.
+        
+        Formularz RCL jest wysyłany metodą GET na /szukaj - czekamy na tę
+        odpowiedź (dokument lub XHR), a potem na tabelę wyników.
+        
+        Args:
+            page: Playwright Page obiekt
+            submit: Funkcja wysyłająca formularz (kliknięcie przycisku, Enter)
+        """
+        with self.timed('odpowiedź wyszukiwania'):
+            try:
+                with page.expect_response(_is_search_response, timeout=self.timeout):
+                    submit()
+            except PlaywrightTimeoutError:
+                logger.debug("Nie zaobserwowano odpowiedzi na wyszukiwanie, czekam na wyniki na stronie")
+        self.wait_for_results(page)
+    
+    def wait_for_results(self, page: Page) -> None:
+        """
+        Czeka na tabelę wyników lub nagłówek z liczbą wyników.
+        
+        Brak wyników w limicie czasu nie jest błędem - strona jest parsowana
+        w obecnym stanie (np. wyszukiwanie bez wyników).
+        
+        Args:
+            page: Playwright Page obiekt
+        """
+        with self.timed('wyniki'):
+            try:
+                page.wait_for_selector(RCL_SEARCH_RESULTS_SELECTOR, state='attached', timeout=self.results_timeout)
+            except PlaywrightTimeoutError:
+                logger.debug("Nie znaleziono tabeli wyników w limicie czasu, parsuję obecny stan strony")
+    
+    # Odpowiedniki dla playwright.async_api - te same warunki i etykiety czasów
+    
+    async def aopen_search_form(self, page: Any, url: str) -> None:
+        """Asynchroniczny odpowiednik open_search_form."""
+        with self.timed('formularz'):
+            await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout)
+            await page.wait_for_selector(RCL_SEARCH_FORM_SELECTOR, state='attached', timeout=self.timeout)
+    
+    async def aopen_results(self, page: Any, url: str) -> None:
+        """Asynchroniczny odpowiednik open_results."""
+        with self.timed('strona wyników'):
+            await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout)
+        await self.await_for_results(page)
+    
+    async def ainput_ready(self, page: Any, selector: str, visible: bool = True) -> None:
+        """Asynchroniczny odpowiednik input_ready."""
+        with self.timed('pole formularza'):
+            await page.wait_for_selector(
+                f"{selector}:enabled",
+                state='visible' if visible else 'attached',
+                timeout=self.timeout
+            )
+    
+    async def asubmit_search(self, page: Any, submit: Callable[[], Awaitable[None]]) -> None:
+        """
+        Asynchroniczny odpowiednik submit_search.
+        
+        Args:
+            page: Asynchroniczny Playwright Page obiekt
+            submit: Korutyna wysyłająca formularz (kliknięcie przycisku, Enter)
+        """
+        with self.timed('odpowiedź wyszukiwania'):
+            try:
+                async with page.expect_response(_is_search_response, timeout=self.timeout):
+                    await submit()
+            except PlaywrightTimeoutError:
+                logger.debug("Nie zaobserwowano odpowiedzi na wyszukiwanie, czekam na wyniki na stronie")
+        await self.await_for_results(page)
+    
+    async def await_for_results(self, page: Any) -> None:
+        """Asynchroniczny odpowiednik wait_for_results."""
+        with self.timed('wyniki'):
+            try:
+                await page.wait_for_selector(
+                    RCL_SEARCH_RESULTS_SELECTOR, state='attached', timeout=self.results_timeout
+                )
+            except PlaywrightTimeoutError:
+                logger.debug("Nie znaleziono tabeli wyników w limicie czasu, parsuję obecny stan strony")
+
+
+def _is_search_response(response) -> bool:
+    """Sprawdza, czy odpowiedź to wynik wysłania formularza wyszukiwania RCL."""
+    return (
+        urlsplit(response.url).path.rstrip('/').endswith('/szukaj')
+        and response.request.resource_type in ('document', 'xhr', 'fetch')
+    )
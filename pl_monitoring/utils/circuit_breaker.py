@@ -0,0 +1,173 @@
+"""Bezpiecznik (circuit breaker) per host i budżet ponowień żądań na jedno uruchomienie."""
+
+import threading
+import time
+from typing import Dict
+
+from ..constants import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_PROBE_INTERVAL,
+    RUN_RETRY_BUDGET,
+)
+from ..exceptions import HostUnavailableError
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Stany bezpiecznika
+STATE_CLOSED = 'closed'        # Żądania przechodzą normalnie
+STATE_OPEN = 'open'            # Host niedostępny - żądania kończą się od razu błędem
+STATE_HALF_OPEN = 'half_open'  # Trwa pojedyncze żądanie próbne
+
+
+class _HostState:
+    """Stan bezpiecznika dla jednego hosta."""
+    
+    __slots__ = ('state', 'failures', 'opened_at', 'rejected')
+    
+    def __init__(self):
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """
+    Bezpiecznik per host.
+    
+    Po failure_threshold kolejnych błędach (połączenie, timeout, 5xx) host jest
+    uznawany za niedostępny i kolejne żądania kończą się od razu wyjątkiem
+    HostUnavailableError. Co probe_interval sekund przepuszczane jest jedno żądanie
+    próbne - jeśli się powiedzie, bezpiecznik się zamyka.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        probe_interval: float = CIRCUIT_BREAKER_PROBE_INTERVAL
+    ):
+        """
+        Inicjalizuje bezpiecznik.
+        
+        Args:
+            failure_threshold: Liczba kolejnych błędów otwierająca bezpiecznik
+            probe_interval: Odstęp (s) między żądaniami próbnymi do niedostępnego hosta
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.probe_interval = probe_interval
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, _HostState] = {}
+    
+    def _host(self, host: str) -> _HostState:
+        """Zwraca stan hosta (wymaga blokady)."""
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState()
+        return state
+    
+    def before_request(self, host: str) -> None:
+        """
+        Sprawdza, czy można wysłać żądanie do hosta.
+        
+        Args:
+            host: Nazwa hosta
+            
+        Raises:
+            HostUnavailableError: Jeśli bezpiecznik jest otwarty (lub trwa żądanie próbne)
+        """
+        with self._lock:
+            state = self._host(host)
+            if state.state == STATE_CLOSED:
+                return
+            if state.state == STATE_OPEN and time.monotonic() - state.opened_at >= self.probe_interval:
+                state.state = STATE_HALF_OPEN
+                logger.info(f"{host}: żądanie próbne po {self.probe_interval:.0f}s przerwy")
+                return
+            state.rejected += 1
+        
+        raise HostUnavailableError(host)
+    
+    def record_success(self, host: str) -> None:
+        """
+        Zapisuje udane żądanie (zamyka bezpiecznik).
+        
+        Args:
+            host: Nazwa hosta
+        """
+        with self._lock:
+            state = self._host(host)
+            if state.state != STATE_CLOSED:
+                logger.info(f"{host}: host znów dostępny, wznawiam żądania")
+            state.state = STATE_CLOSED
+            state.failures = 0
+    
+    def record_failure(self, host: str) -> None:
+        """
+        Zapisuje nieudane żądanie (może otworzyć bezpiecznik).
+        
+        Args:
+            host: Nazwa hosta
+        """
+        with self._lock:
+            state = self._host(host)
+            state.failures += 1
+            if state.state == STATE_HALF_OPEN or (
+                state.state == STATE_CLOSED and state.failures >= self.failure_threshold
+            ):
+                if state.state == STATE_CLOSED:
+                    logger.error(
+                        f"{host}: {state.failures} kolejnych błędów - host uznany za niedostępny, "
+                        f"kolejna próba za {self.probe_interval:.0f}s"
+                    )
+                state.state = STATE_OPEN
+                state.opened_at = time.monotonic()
+    
+    def is_open(self, host: str) -> bool:
+        """Czy bezpiecznik hosta jest otwarty (host niedostępny)."""
+        with self._lock:
+            return self._host(host).state != STATE_CLOSED
+    
+    def log_stats(self) -> None:
+        """Loguje hosty, dla których bezpiecznik odrzucał żądania."""
+        with self._lock:
+            rejected = {host: state.rejected for host, state in self._hosts.items() if state.rejected}
+        
+        for host, count in rejected.items():
+            logger.warning(f"{host}: {count} żądań odrzuconych bez łączenia (host niedostępny)")
+
+
+class RetryBudget:
+    """
+    Łączny limit ponowień żądań na jedno uruchomienie.
+    
+    Gdy budżet się wyczerpie, retry_request zgłasza błąd od razu zamiast
+    czekać i ponawiać - awaria serwera nie wydłuża wtedy uruchomienia o
+    kolejne minuty oczekiwania.
+    """
+    
+    def __init__(self, max_retries: int = RUN_RETRY_BUDGET):
+        """
+        Inicjalizuje budżet ponowień.
+        
+        Args:
+            max_retries: Maksymalna łączna liczba ponowień w uruchomieniu
+        """
+        self.max_retries = max_retries
+        self.used = 0
+        self._lock = threading.Lock()
+    
+    def try_spend(self) -> bool:
+        """
+        Zużywa jedno ponowienie z budżetu.
+        
+        Returns:
+            True jeśli można ponowić żądanie, False jeśli budżet się wyczerpał
+        """
+        with self._lock:
+            if self.used >= self.max_retries:
+                return False
+            self.used += 1
+            if self.used == self.max_retries:
+                logger.warning(f"Wyczerpano budżet {self.max_retries} ponowień żądań - kolejne błędy nie będą ponawiane")
+            return True
@@ -1,17 +1,43 @@
 """Narzędzia do obsługi żądań HTTP i przeglądarki."""
 
+import asyncio
+import random
+import threading
 import time
-from typing import Dict, Tuple, Optional, Callable, TypeVar
+from typing import Awaitable, Dict, Tuple, Optional, Callable, TypeVar
+from urllib.parse import urlsplit
 from playwright.sync_api import BrowserContext, sync_playwright, Browser
 import requests
+from requests.adapters import HTTPAdapter
 
-from ..constants import DEFAULT_USER_AGENT, HTTP_TIMEOUT
+try:
+    import aiohttp
+except ImportError:  # aiohttp jest zależnością opcjonalną: pip install "pl-monitoring[async]"
+    aiohttp = None
+
+from ..constants import (
+    DEFAULT_USER_AGENT,
+    HTTP_TIMEOUT,
+    HTTP_POOL_SIZE,
+    HTTP_POOL_HOSTS,
+    RETRYABLE_STATUS_CODES,
+)
+from ..exceptions import CacheMissError
+from ..utils.circuit_breaker import CircuitBreaker, RetryBudget
 from ..utils.logger import get_logger
+from ..utils.rate_control import RateController, get_default_rate_controller, parse_retry_after
+from ..utils.resource_blocking import ResourceBlockingProfile
+from ..utils.response_cache import ResponseCache
 
 logger = get_logger(__name__)
 
 T = TypeVar('T')
 
+# Błędy sieciowe ponawiane domyślnie przez async_retry_request (jak requests.RequestException w retry_request)
+_ASYNC_RETRYABLE_EXCEPTIONS = (
+    (aiohttp.ClientError, asyncio.TimeoutError) if aiohttp is not None else (ConnectionError, asyncio.TimeoutError)
+)
+
 
 def get_http_headers() -> Dict[str, str]:
     """
@@ -30,24 +56,291 @@ def get_http_headers() -> Dict[str, str]:
     }
 
 
-def get_browser_context(headless: bool = False) -> Tuple[Browser, BrowserContext]:
+class HTTPClient:
+    """
+    Współdzielona sesja HTTP z pulą połączeń keep-alive.
+    
+    Kolejne żądania do tego samego hosta (legislacja.rcl.gov.pl, sejm.gov.pl)
+    korzystają z już otwartych połączeń TCP/TLS zamiast nawiązywać nowe.
+    Instancję można przekazać do monitorów (dependency injection), żeby
+    kilka monitorów dzieliło tę samą pulę.
+    
+    Opcjonalny ResponseCache pozwala obsługiwać powtarzane żądania z dysku
+    (np. kolejne uruchomienia z innym zakresem dat) bez odpytywania serwera.
+    
+    Każde żądanie sieciowe przechodzi przez RateController, który pilnuje tempa
+    i liczby jednoczesnych żądań do hosta oraz zwalnia po odpowiedziach 429/503.
+    CircuitBreaker odrzuca żądania do hosta, który przestał odpowiadać, a
+    RetryBudget ogranicza łączną liczbę ponowień w czasie życia klienta.
+    """
+    
+    def __init__(
+        self,
+        pool_size: int = HTTP_POOL_SIZE,
+        timeout: float = HTTP_TIMEOUT,
+        headers: Optional[Dict[str, str]] = None,
+        response_cache: Optional[ResponseCache] = None,
+        rate_controller: Optional[RateController] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None
+    ):
+        """
+        Inicjalizuje klienta HTTP.
+        
+        Args:
+            pool_size: Maksymalna liczba połączeń utrzymywanych dla jednego hosta
+            timeout: Domyślny timeout żądań w sekundach
+            headers: Nagłówki HTTP (domyślnie get_http_headers())
+            response_cache: Dyskowy cache odpowiedzi (domyślnie brak cache)
+            rate_controller: Kontroler tempa żądań per host (domyślnie współdzielony)
+            circuit_breaker: Bezpiecznik per host (domyślnie nowy dla klienta)
+            retry_budget: Budżet ponowień żądań (domyślnie nowy dla klienta)
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.response_cache = response_cache
+        self.rate_controller = rate_controller or get_default_rate_controller()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.session = requests.Session()
+        self.session.headers.update(headers or get_http_headers())
+        
+        self._adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=pool_size)
+        self.session.mount('https://', self._adapter)
+        self.session.mount('http://', self._adapter)
+        
+        self._stats_lock = threading.Lock()
+        self._host_stats: Dict[str, int] = {}
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - zamyka sesję."""
+        self.close()
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Wykonuje żądanie GET przez współdzieloną sesję.
+        
+        Jeśli klient ma cache odpowiedzi, świeży wpis jest zwracany bez żądania
+        sieciowego, a pobrane odpowiedzi 200 trafiają do cache.
+        
+        Args:
+            url: Adres URL
+            **kwargs: Dodatkowe argumenty przekazywane do requests.Session.get
+        
+        Returns:
+            Odpowiedź HTTP
+            
+        Raises:
+            CacheMissError: Jeśli cache działa w trybie offline i nie ma w nim strony
+            HostUnavailableError: Jeśli bezpiecznik uznał host za niedostępny
+        """
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = requests.Request('GET', url, params=kwargs.get('params')).prepare().url
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            if self.response_cache.offline:
+                raise CacheMissError(f"Brak strony w cache (tryb offline): {cache_key}")
+        
+        host = urlsplit(url).netloc
+        self.circuit_breaker.before_request(host)
+        
+        kwargs.setdefault('timeout', self.timeout)
+        controller = self.rate_controller.for_host(host)
+        controller.acquire()
+        started = time.monotonic()
+        response = None
+        try:
+            response = self.session.get(url, **kwargs)
+        except requests.RequestException:
+            self.circuit_breaker.record_failure(host)
+            raise
+        finally:
+            controller.release(
+                response.status_code if response is not None else None,
+                time.monotonic() - started,
+                parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+            )
+        self._record_request(url)
+        
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure(host)
+        else:
+            self.circuit_breaker.record_success(host)
+        
+        if cache_key is not None:
+            self.response_cache.store(cache_key, response)
+        return response
+    
+    def fetch(self, url: str, **kwargs) -> requests.Response:
+        """
+        Wykonuje żądanie GET i zgłasza wyjątek dla kodów błędów HTTP.
+        
+        Przeznaczone do wywołania wewnątrz retry_request - dzięki temu odpowiedzi
+        429/5xx są ponawiane, a np. 404 kończy próby od razu.
+        
+        Args:
+            url: Adres URL
+            **kwargs: Dodatkowe argumenty przekazywane do get()
+        
+        Returns:
+            Odpowiedź HTTP (2xx lub 304)
+            
+        Raises:
+            requests.HTTPError: Jeśli serwer zwrócił kod błędu
+        """
+        response = self.get(url, **kwargs)
+        response.raise_for_status()
+        return response
+    
+    def _record_request(self, url: str) -> None:
+        """Zlicza żądanie wykonane do hosta z URL."""
+        host = urlsplit(url).netloc
+        with self._stats_lock:
+            self._host_stats[host] = self._host_stats.get(host, 0) + 1
+    
+    def _count_connections(self) -> Dict[str, int]:
+        """Zwraca liczbę połączeń otwartych przez pule urllib3 dla każdego hosta."""
+        connections: Dict[str, int] = {}
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = pool.host if pool.port in (None, 80, 443) else f"{pool.host}:{pool.port}"
+            connections[host] = connections.get(host, 0) + pool.num_connections
+        return connections
+    
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Zwraca statystyki wykorzystania połączeń per host.
+        
+        Returns:
+            Słownik {host: {'requests', 'connections', 'reused'}}
+        """
+        connections = self._count_connections()
+        with self._stats_lock:
+            host_requests = dict(self._host_stats)
+        
+        stats = {}
+        for host, requests_count in host_requests.items():
+            connections_count = connections.get(host, 0)
+            stats[host] = {
+                'requests': requests_count,
+                'connections': connections_count,
+                'reused': max(requests_count - connections_count, 0),
+            }
+        return stats
+    
+    def log_stats(self) -> None:
+        """Loguje podsumowanie wykorzystania puli połączeń i cache odpowiedzi."""
+        for host, stats in self.get_stats().items():
+            logger.info(
+                f"HTTP {host}: {stats['requests']} żądań, "
+                f"{stats['connections']} połączeń ({stats['reused']} ponownie użytych)"
+            )
+        self.rate_controller.log_stats()
+        self.circuit_breaker.log_stats()
+        if self.response_cache is not None:
+            self.response_cache.log_stats()
+    
+    def close(self) -> None:
+        """Zamyka sesję i wszystkie połączenia z puli (zapisuje indeks cache odpowiedzi)."""
+        if self.response_cache is not None:
+            self.response_cache.save()
+        self.session.close()
+
+
+_default_http_client: Optional[HTTPClient] = None
+_default_http_client_lock = threading.Lock()
+
+
+def get_default_http_client() -> HTTPClient:
+    """
+    Zwraca współdzielonego klienta HTTP (tworzy go przy pierwszym użyciu).
+    
+    Returns:
+        Instancja HTTPClient wspólna dla wszystkich monitorów
+    """
+    global _default_http_client
+    
+    with _default_http_client_lock:
+        if _default_http_client is None:
+            _default_http_client = HTTPClient()
+        return _default_http_client
+
+
+def get_browser_context(
+    headless: bool = True,
+    resource_blocking: Optional[ResourceBlockingProfile] = None
+) -> Tuple[Browser, BrowserContext]:
     """
     Tworzy kontekst przeglądarki Playwright z domyślnymi ustawieniami.
     
     Args:
         headless: Czy przeglądarka ma działać w trybie headless
+        resource_blocking: Profil blokowania zbędnych zasobów (domyślnie obrazy, czcionki, analityka)
         
     Returns:
         Tuple (browser, context)
     """
+    from .browser_launcher import BrowserLauncher
+    
     playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=headless)
-    context = browser.new_context(
-        user_agent=DEFAULT_USER_AGENT,
-        viewport={'width': 1280, 'height': 720},
-        extra_http_headers=get_http_headers()
-    )
-    return browser, context
+    context = BrowserLauncher(headless=headless, resource_blocking=resource_blocking).launch(playwright)
+    return context.browser, context
+
+
+def _error_status(error: BaseException) -> Tuple[Optional[int], Dict[str, str]]:
+    """
+    Zwraca kod HTTP i nagłówki odpowiedzi zapisane w wyjątku.
+    
+    Obsługuje requests.HTTPError (error.response) i aiohttp.ClientResponseError
+    (error.status, error.headers).
+    
+    Args:
+        error: Wyjątek zgłoszony przez żądanie
+        
+    Returns:
+        Tuple (kod HTTP lub None, nagłówki odpowiedzi)
+    """
+    response = getattr(error, 'response', None)
+    if response is not None and isinstance(getattr(response, 'status_code', None), int):
+        return response.status_code, response.headers
+    
+    status = getattr(error, 'status', None)
+    if isinstance(status, int):
+        return status, getattr(error, 'headers', None) or {}
+    
+    return None, {}
+
+
+def _retry_wait(error: BaseException, delay: float) -> Optional[float]:
+    """
+    Wyznacza czas oczekiwania przed ponowieniem żądania.
+    
+    Args:
+        error: Wyjątek zgłoszony przez żądanie
+        delay: Bieżące opóźnienie wykładnicze w sekundach
+        
+    Returns:
+        Czas oczekiwania w sekundach lub None, jeśli kodu HTTP nie warto ponawiać (np. 404)
+    """
+    status, headers = _error_status(error)
+    if status is not None and status not in RETRYABLE_STATUS_CODES:
+        return None
+    
+    retry_after = parse_retry_after(headers.get('Retry-After'))
+    if retry_after is not None:
+        return retry_after
+    
+    # Losowe rozrzucenie opóźnienia, żeby równoległe wątki nie ponawiały żądań jednocześnie
+    return delay / 2 + random.uniform(0, delay / 2)
 
 
 def retry_request(
@@ -55,17 +348,24 @@ def retry_request(
     max_retries: int = 3,
     retry_delay: float = 1.0,
     backoff_factor: float = 2.0,
-    retryable_exceptions: tuple = (requests.RequestException,)
+    retryable_exceptions: tuple = (requests.RequestException,),
+    retry_budget: Optional[RetryBudget] = None
 ) -> T:
     """
     Wykonuje żądanie HTTP z automatycznym ponawianiem przy błędach.
     
+    Błędy HTTP (requests.HTTPError z raise_for_status) są ponawiane tylko dla kodów
+    z RETRYABLE_STATUS_CODES. Jeśli serwer wysłał Retry-After, czekamy tyle, ile
+    wskazał; w przeciwnym razie opóźnienie rośnie wykładniczo z losowym rozrzutem.
+    
     Args:
         request_fn: Funkcja wykonująca żądanie HTTP (np. lambda: requests.get(url))
         max_retries: Maksymalna liczba ponownych prób (domyślnie 3)
         retry_delay: Początkowe opóźnienie między próbami w sekundach (domyślnie 1.0)
         backoff_factor: Mnożnik opóźnienia przy każdej kolejnej próbie (domyślnie 2.0)
         retryable_exceptions: Krotka wyjątków, które powinny być ponawiane
+        retry_budget: Wspólny budżet ponowień (np. HTTPClient.retry_budget); po jego
+            wyczerpaniu błąd jest zgłaszany bez ponawiania
         
     Returns:
         Wynik funkcji request_fn
@@ -81,12 +381,66 @@ def retry_request(
             return request_fn()
         except retryable_exceptions as e:
             last_exception = e
-            if attempt < max_retries:
-                logger.warning(f"Błąd żądania HTTP (próba {attempt + 1}/{max_retries + 1}): {e}. Ponawianie za {delay:.1f}s...")
-                time.sleep(delay)
+            wait = _retry_wait(e, delay)
+            if wait is None:
+                raise
+            if attempt < max_retries and (retry_budget is None or retry_budget.try_spend()):
+                logger.warning(f"Błąd żądania HTTP (próba {attempt + 1}/{max_retries + 1}): {e}. Ponawianie za {wait:.1f}s...")
+                time.sleep(wait)
                 delay *= backoff_factor
             else:
-                logger.error(f"Wszystkie próby żądania HTTP nie powiodły się po {max_retries + 1} próbach")
+                logger.error(f"Żądanie HTTP nie powiodło się po {attempt + 1} próbach")
+                break
     
     raise last_exception
 
+
+async def async_retry_request(
+    request_fn: Callable[[], Awaitable[T]],
+    max_retries: int = 3,
+    retry_delay: float = 1.0,
+    backoff_factor: float = 2.0,
+    retryable_exceptions: tuple = _ASYNC_RETRYABLE_EXCEPTIONS,
+    retry_budget: Optional[RetryBudget] = None
+) -> T:
+    """
+    Asynchroniczny odpowiednik retry_request - czeka przez asyncio.sleep, nie blokując pętli zdarzeń.
+    
+    Domyślnie ponawiane są tylko błędy sieciowe (aiohttp.ClientError i
+    asyncio.TimeoutError) - błędy programu nie zużywają budżetu ponowień.
+    
+    Args:
+        request_fn: Funkcja zwracająca korutynę wykonującą żądanie
+        max_retries: Maksymalna liczba ponownych prób (domyślnie 3)
+        retry_delay: Początkowe opóźnienie między próbami w sekundach (domyślnie 1.0)
+        backoff_factor: Mnożnik opóźnienia przy każdej kolejnej próbie (domyślnie 2.0)
+        retryable_exceptions: Krotka wyjątków, które powinny być ponawiane
+        retry_budget: Wspólny budżet ponowień (np. HTTPClient.retry_budget); po jego
+            wyczerpaniu błąd jest zgłaszany bez ponawiania
+        
+    Returns:
+        Wynik korutyny zwróconej przez request_fn
+        
+    Raises:
+        Ostatni wyjątek jeśli wszystkie próby się nie powiodły
+    """
+    last_exception = None
+    delay = retry_delay
+    
+    for attempt in range(max_retries + 1):
+        try:
+            return await request_fn()
+        except retryable_exceptions as e:
+            last_exception = e
+            wait = _retry_wait(e, delay)
+            if wait is None:
+                raise
+            if attempt < max_retries and (retry_budget is None or retry_budget.try_spend()):
+                logger.warning(f"Błąd żądania HTTP (próba {attempt + 1}/{max_retries + 1}): {e}. Ponawianie za {wait:.1f}s...")
+                await asyncio.sleep(wait)
+                delay *= backoff_factor
+            else:
+                logger.error(f"Żądanie HTTP nie powiodło się po {attempt + 1} próbach")
+                break
+    
+    raise last_exception
@@ -38,11 +38,17 @@ def normalize_project_id(project_id: Any) -> str:
     """
     Normalizuje ID projektu do stringa dla porównań.
     
+    Usuwa białe znaki oraz zera wiodące z ID liczbowych, więc 1234, "1234"
+    i " 01234" dają to samo ID (i ten sam URL strony projektu).
+    
     Args:
         project_id: ID projektu (może być int lub str)
         
     Returns:
         ID jako string
     """
-    return str(project_id)
+    normalized = str(project_id).strip()
+    if normalized.isdigit():
+        normalized = str(int(normalized))
+    return normalized
 
@@ -0,0 +1,251 @@
+"""Sterowanie tempem i współbieżnością żądań HTTP per host (token bucket + AIMD)."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from ..constants import (
+    DEFAULT_HOST_RATE_LIMIT,
+    HOST_INITIAL_CONCURRENCY,
+    HOST_LATENCY_TARGET,
+    HOST_MAX_CONCURRENCY,
+    HOST_RATE_BURST,
+    HOST_RATE_LIMITS,
+    MAX_RETRY_AFTER,
+)
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Kody odpowiedzi oznaczające przeciążenie serwera - sygnał do zmniejszenia współbieżności
+THROTTLE_STATUS_CODES = (429, 503)
+
+# Minimalny odstęp między kolejnymi zmniejszeniami limitu (jedna fala odpowiedzi 429 = jedno zmniejszenie)
+_DECREASE_INTERVAL = 1.0
+
+# Czas oczekiwania na zwolnienie miejsca przy wyczerpanym limicie współbieżności
+_SLOT_POLL_INTERVAL = 0.05
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parsuje nagłówek Retry-After (liczba sekund lub data HTTP).
+    
+    Args:
+        value: Wartość nagłówka Retry-After
+        
+    Returns:
+        Liczba sekund oczekiwania (ograniczona do MAX_RETRY_AFTER) lub None
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class HostController:
+    """
+    Limit tempa (token bucket) i adaptacyjny limit współbieżności (AIMD) dla jednego hosta.
+    
+    Każde żądanie pobiera token i miejsce w limicie współbieżności. Odpowiedzi
+    429/503 oraz błędy połączenia zmniejszają limit o połowę, a szybkie udane
+    odpowiedzi zwiększają go o ok. 1 na każde "okno" żądań. Retry-After wstrzymuje
+    wszystkie żądania do hosta na wskazany czas.
+    
+    Ten sam obiekt obsługuje wątki (acquire) i asyncio (aacquire).
+    """
+    
+    def __init__(
+        self,
+        host: str,
+        rate: float = DEFAULT_HOST_RATE_LIMIT,
+        burst: int = HOST_RATE_BURST,
+        initial_concurrency: int = HOST_INITIAL_CONCURRENCY,
+        max_concurrency: int = HOST_MAX_CONCURRENCY,
+        latency_target: float = HOST_LATENCY_TARGET
+    ):
+        """
+        Inicjalizuje kontroler hosta.
+        
+        Args:
+            host: Nazwa hosta (do logów)
+            rate: Maksymalna liczba żądań na sekundę
+            burst: Pojemność kubełka tokenów
+            initial_concurrency: Początkowy limit jednoczesnych żądań
+            max_concurrency: Górna granica limitu jednoczesnych żądań
+            latency_target: Czas odpowiedzi (s), poniżej którego limit jest zwiększany
+        """
+        self.host = host
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max(1, max_concurrency)
+        self.latency_target = latency_target
+        self.limit = float(min(max(1, initial_concurrency), self.max_concurrency))
+        
+        self.in_flight = 0
+        self.throttled = 0
+        
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+    
+    def _try_acquire(self) -> float:
+        """
+        Próbuje zająć token i miejsce w limicie współbieżności.
+        
+        Returns:
+            0 jeśli się udało, w przeciwnym razie sugerowany czas oczekiwania (s)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now < self._paused_until:
+                return self._paused_until - now
+            
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            
+            if self.in_flight >= int(self.limit):
+                return _SLOT_POLL_INTERVAL
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+            
+            self._tokens -= 1
+            self.in_flight += 1
+            return 0.0
+    
+    def acquire(self) -> None:
+        """Czeka (blokując wątek) na możliwość wysłania żądania."""
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            time.sleep(wait)
+    
+    async def aacquire(self) -> None:
+        """Czeka (bez blokowania pętli zdarzeń) na możliwość wysłania żądania."""
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+    
+    def release(
+        self,
+        status_code: Optional[int],
+        latency: float,
+        retry_after: Optional[float] = None
+    ) -> None:
+        """
+        Zwalnia miejsce i dostosowuje limit współbieżności do wyniku żądania.
+        
+        Args:
+            status_code: Kod odpowiedzi HTTP (None przy błędzie połączenia)
+            latency: Czas trwania żądania w sekundach
+            retry_after: Czas z nagłówka Retry-After w sekundach
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            
+            if status_code is None or status_code in THROTTLE_STATUS_CODES:
+                if status_code is not None:
+                    self.throttled += 1
+                if now - self._last_decrease >= _DECREASE_INTERVAL:
+                    self._last_decrease = now
+                    previous = self.limit
+                    self.limit = max(1.0, self.limit / 2)
+                    if int(self.limit) < int(previous):
+                        logger.warning(
+                            f"{self.host}: przeciążenie serwera ({status_code or 'błąd połączenia'}), "
+                            f"limit współbieżności {int(previous)} -> {int(self.limit)}"
+                        )
+            elif status_code < 500 and latency <= self.latency_target:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+
+
+class RateController:
+    """Rejestr kontrolerów HostController współdzielony przez wszystkie ścieżki pobierania."""
+    
+    def __init__(
+        self,
+        rate_limits: Optional[Dict[str, float]] = None,
+        default_rate: float = DEFAULT_HOST_RATE_LIMIT
+    ):
+        """
+        Inicjalizuje rejestr kontrolerów.
+        
+        Args:
+            rate_limits: Limity żądań na sekundę dla poszczególnych hostów
+            default_rate: Limit żądań na sekundę dla pozostałych hostów
+        """
+        self.rate_limits = HOST_RATE_LIMITS if rate_limits is None else rate_limits
+        self.default_rate = default_rate
+        self._lock = threading.Lock()
+        self._controllers: Dict[str, HostController] = {}
+    
+    def for_host(self, host: str) -> HostController:
+        """
+        Zwraca kontroler dla hosta (tworzy go przy pierwszym użyciu).
+        
+        Args:
+            host: Nazwa hosta (netloc z URL)
+            
+        Returns:
+            HostController dla hosta
+        """
+        with self._lock:
+            controller = self._controllers.get(host)
+            if controller is None:
+                controller = HostController(host, rate=self.rate_limits.get(host, self.default_rate))
+                self._controllers[host] = controller
+            return controller
+    
+    def log_stats(self) -> None:
+        """Loguje aktualny limit współbieżności i liczbę odpowiedzi 429/503 per host."""
+        with self._lock:
+            controllers = list(self._controllers.values())
+        
+        for controller in controllers:
+            logger.info(
+                f"Tempo {controller.host}: limit współbieżności {int(controller.limit)}, "
+                f"{controller.throttled} odpowiedzi 429/503"
+            )
+
+
+_default_rate_controller: Optional[RateController] = None
+_default_rate_controller_lock = threading.Lock()
+
+
+def get_default_rate_controller() -> RateController:
+    """
+    Zwraca współdzielony rejestr kontrolerów (tworzy go przy pierwszym użyciu).
+    
+    Returns:
+        Instancja RateController wspólna dla wszystkich klientów HTTP
+    """
+    global _default_rate_controller
+    
+    with _default_rate_controller_lock:
+        if _default_rate_controller is None:
+            _default_rate_controller = RateController()
+        return _default_rate_controller
@@ -1,31 +1,112 @@
-"""Zarządzanie przeglądarką dla monitorów RCL."""
+"""Zarządzanie przeglądarką (i pulą przeglądarek) dla monitorów RCL."""
 
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
+import queue
+import threading
+from typing import Callable, Iterable, List, Optional, TypeVar
 
-from ..constants import RCL_BASE_URL, PLAYWRIGHT_TIMEOUT, PLAYWRIGHT_WAIT_TIMEOUT, DEFAULT_USER_AGENT
-from ..utils.http_client import get_http_headers
+from playwright.sync_api import sync_playwright, BrowserContext, Page
+
+from ..constants import (
+    RCL_BASE_URL,
+    RCL_BROWSER_CRASH_RETRIES,
+    RCL_BROWSER_MAX_JS_HEAP_MB,
+    RCL_BROWSER_MAX_NAVIGATIONS,
+    RCL_BROWSER_POOL_SIZE,
+    RCL_RESULT_COUNT_TEXT,
+    RCL_SEARCH_FORM_SELECTOR,
+)
+from ..config import BROWSER_PROFILE_DIR
+from ..utils.browser_launcher import BrowserLauncher
+from ..utils.browser_waits import BrowserWaits, WaitTimings
 from ..utils.logger import get_logger
+from ..utils.resource_blocking import ResourceBlockingProfile
 
 logger = get_logger(__name__)
 
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Czyszczenie formularza wyszukiwania w miejscu (bez przeładowania strony). Strona RCL ma
+# osobny form#searchForm dla każdej zakładki, więc czyszczone są wszystkie formularze: pola
+# wpisywane (każde poza ukrytymi, checkboxami i przyciskami - RCL używa np. type="datea"
+# dla dat) i listy wyboru z pustą opcją dostają pustą wartość, a tabela i nagłówek z liczbą
+# wyników są usuwane, żeby oczekiwanie na wyniki nie zakończyło się na poprzedniej tabeli.
+# Zwraca true tylko wtedy, gdy wszystkie formularze są czyste.
+_RESET_SEARCH_FORM_SCRIPT = r"""
+({formSelector, countText}) => {
+    const forms = Array.from(document.querySelectorAll(formSelector));
+    if (!forms.length) {
+        return false;
+    }
+    const keptTypes = ['hidden', 'checkbox', 'radio', 'submit', 'button', 'reset', 'image', 'file'];
+    const fieldsOf = (selector) => forms.flatMap((form) => Array.from(form.querySelectorAll(selector)));
+    const textFields = fieldsOf('input, textarea').filter((el) => {
+        const type = (el.getAttribute('type') || 'text').toLowerCase();
+        return el.tagName === 'TEXTAREA' || !keptTypes.includes(type);
+    });
+    const selects = fieldsOf('select')
+        .filter((el) => Array.from(el.options).some((option) => option.value === ''));
+    
+    textFields.forEach((el) => { el.value = ''; });
+    selects.forEach((el) => { el.value = ''; });
+    
+    document.querySelectorAll('table#table').forEach((table) => table.remove());
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    const countNodes = [];
+    while (walker.nextNode()) {
+        if (walker.currentNode.nodeValue.includes(countText)) {
+            countNodes.push(walker.currentNode);
+        }
+    }
+    countNodes.forEach((node) => node.parentNode && node.parentNode.removeChild(node));
+    
+    return textFields.every((el) => el.value === '')
+        && selects.every((el) => el.value === '')
+        && !document.querySelector('table#table')
+        && !document.body.innerText.includes(countText);
+}
+"""
+
 
 class RCLBrowserManager:
     """Klasa do zarządzania jedną przeglądarką dla wszystkich wyszukiwań RCL."""
     
-    def __init__(self, active_tab: str = 'tab1', headless: bool = False):
+    def __init__(
+        self,
+        active_tab: str = 'tab1',
+        headless: bool = True,
+        waits: Optional[BrowserWaits] = None,
+        resource_blocking: Optional[ResourceBlockingProfile] = None,
+        launcher: Optional[BrowserLauncher] = None,
+        max_navigations: int = RCL_BROWSER_MAX_NAVIGATIONS,
+        max_js_heap_mb: Optional[int] = RCL_BROWSER_MAX_JS_HEAP_MB
+    ):
         """
         Inicjalizuje manager przeglądarki.
         
         Args:
             active_tab: Aktywna zakładka ('tab1' dla tagów, 'tab2' dla wyszukiwania)
-            headless: Czy przeglądarka ma działać w trybie headless
+            headless: Czy przeglądarka ma działać w trybie headless (gdy nie podano launchera)
+            waits: Strategia oczekiwania na stronę i formularz (dependency injection)
+            resource_blocking: Profil blokowania zbędnych zasobów (gdy nie podano launchera)
+            launcher: Launcher przeglądarki, np. z trwałym profilem (dependency injection)
+            max_navigations: Liczba nawigacji, po której strona jest otwierana od nowa
+            max_js_heap_mb: Limit sterty JS strony w MB (None - bez limitu)
         """
         self.active_tab = active_tab
-        self.headless = headless
+        self.max_navigations = max_navigations
+        self.max_js_heap_mb = max_js_heap_mb
+        self.waits = waits or BrowserWaits()
+        self.launcher = launcher or BrowserLauncher(headless=headless, resource_blocking=resource_blocking)
+        self.headless = self.launcher.headless
+        self.resource_blocking = self.launcher.resource_blocking
         self.playwright = None
-        self.browser = None
         self.context = None
         self.page = None
+        # Stan bieżącej strony: liczba nawigacji i awaria renderera
+        self.navigations = 0
+        self.crashed = False
+        self.recycles = 0
     
     def __enter__(self):
         """Context manager entry - otwiera przeglądarkę."""
@@ -37,30 +118,125 @@ class RCLBrowserManager:
         self.close_browser()
     
     def start_browser(self):
-        """Otwiera przeglądarkę i ładuje stronę wyszukiwania."""
+        """
+        Otwiera przeglądarkę i ładuje stronę wyszukiwania.
+        
+        Czas startu przeglądarki i pierwszej nawigacji trafia do statystyk
+        oczekiwania. Przy błędzie uruchomienia zwalnia już utworzone zasoby
+        (przeglądarkę, Playwright).
+        """
         logger.debug(f"Otwieranie przeglądarki z activeTab={self.active_tab}")
         
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=self.headless)
-        self.context = self.browser.new_context(
-            user_agent=DEFAULT_USER_AGENT,
-            viewport={'width': 1280, 'height': 720},
-            extra_http_headers=get_http_headers()
-        )
-        self.page = self.context.new_page()
+        try:
+            self.playwright = sync_playwright().start()
+            with self.waits.timed('start przeglądarki'):
+                self.context = self.launcher.launch(self.playwright)
+            with self.waits.timed('pierwsza nawigacja'):
+                self._open_page()
+        except Exception:
+            self.close_browser()
+            raise
+    
+    @property
+    def healthy(self) -> bool:
+        """Czy strona jest otwarta i jej renderer działa."""
+        return self.page is not None and not self.crashed and not self.page.is_closed()
+    
+    def recycle_if_needed(self) -> bool:
+        """
+        Otwiera stronę od nowa, jeśli uległa awarii, przekroczyła limit nawigacji lub pamięci.
+        
+        Wywoływane między zadaniami, żeby pamięć renderera nie rosła przez
+        cały długi przebieg monitora.
+        
+        Returns:
+            True jeśli strona została odświeżona
+        """
+        reason = self._recycle_reason()
+        if reason is None:
+            return False
+        logger.info(f"Otwieranie nowej strony przeglądarki ({reason})")
+        self.recycle_page()
+        return True
+    
+    def recycle_page(self) -> None:
+        """
+        Zamyka bieżącą stronę i otwiera nową w tym samym kontekście.
+        
+        Jeśli kontekst lub przeglądarka nie działa (np. awaria procesu
+        przeglądarki), uruchamia przeglądarkę od nowa.
+        """
+        self.recycles += 1
+        try:
+            if self.page is not None and not self.page.is_closed():
+                self.page.close()
+            self._open_page()
+        except Exception as e:
+            logger.warning(f"Nie udało się otworzyć nowej strony ({e}), ponowne uruchomienie przeglądarki")
+            self.restart()
+    
+    def restart(self) -> None:
+        """Zamyka przeglądarkę i uruchamia ją od nowa."""
+        self.close_browser()
+        self.start_browser()
+    
+    def _open_page(self) -> None:
+        """Otwiera stronę (z obserwacją nawigacji i awarii) i ładuje formularz wyszukiwania."""
+        # Kontekst trwały ma już otwartą pustą stronę
+        self.page = self.context.pages[0] if self.context.pages else self.context.new_page()
+        self.page.on('crash', self._on_crash)
+        self.page.on('domcontentloaded', self._on_navigation)
+        self.crashed = False
+        self.navigations = 0
         
         # Załaduj stronę wyszukiwania z odpowiednią zakładką
         search_url = f"{RCL_BASE_URL}/szukaj?activeTab={self.active_tab}"
         logger.debug(f"Ładowanie strony wyszukiwania: {search_url}")
-        self.page.goto(search_url, wait_until="networkidle", timeout=PLAYWRIGHT_TIMEOUT)
+        self.waits.open_search_form(self.page, search_url)
+    
+    def _on_crash(self, page: Page) -> None:
+        """Oznacza stronę jako niesprawną po awarii renderera."""
+        logger.warning("Awaria renderera strony przeglądarki")
+        self.crashed = True
+    
+    def _on_navigation(self, page: Page) -> None:
+        """Zlicza nawigacje strony."""
+        self.navigations += 1
+    
+    def _recycle_reason(self) -> Optional[str]:
+        """Zwraca powód odświeżenia strony lub None, jeśli strona może dalej pracować."""
+        if not self.healthy:
+            return "awaria strony"
+        if self.navigations >= self.max_navigations:
+            return f"{self.navigations} nawigacji"
+        if self.max_js_heap_mb is not None:
+            heap_mb = self._js_heap_mb()
+            if heap_mb is not None and heap_mb > self.max_js_heap_mb:
+                return f"sterta JS {heap_mb:.0f} MB"
+        return None
+    
+    def _js_heap_mb(self) -> Optional[float]:
+        """
+        Rozmiar używanej sterty JS strony w MB (performance.memory w Chromium).
         
-        # Poczekaj na załadowanie formularza
-        logger.debug("Oczekiwanie na załadowanie formularza...")
-        self.page.wait_for_timeout(PLAYWRIGHT_WAIT_TIMEOUT)
+        Playwright nie udostępnia RSS procesu renderera - sterta JS jest
+        najbliższą miarą dostępną ze strony.
+        """
+        try:
+            used = self.page.evaluate("() => performance.memory ? performance.memory.usedJSHeapSize : null")
+        except Exception as e:
+            logger.debug(f"Nie udało się odczytać pamięci strony: {e}")
+            return None
+        return used / (1024 * 1024) if used is not None else None
     
     def clear_search_form(self):
         """
-        Czyści formularz wyszukiwania przechodząc do URL z czystym formularzem.
+        Czyści formularz wyszukiwania i obszar wyników.
+        
+        Najpierw czyści pola i usuwa poprzednie wyniki bezpośrednio w DOM
+        (bez ładowania strony). Przejście do URL z czystym formularzem jest
+        wykonywane tylko wtedy, gdy nie udało się potwierdzić, że formularz
+        jest czysty.
         
         Raises:
             Exception: Jeśli nie udało się wyczyścić formularza
@@ -70,23 +246,200 @@ class RCLBrowserManager:
         
         logger.debug("Czyszczenie formularza wyszukiwania...")
         
+        if self._reset_form_in_page():
+            logger.debug("Formularz wyczyszczony bez przeładowania strony")
+            return
+        
         # Zawsze przejdź do URL z czystym formularzem - to jest bardziej niezawodne
         # niż próba kliknięcia linku "Wyczyść", który może być niewidoczny
         search_url = f"{RCL_BASE_URL}/szukaj?activeTab={self.active_tab}#list"
         logger.debug(f"Przechodzenie do czystego formularza: {search_url}")
-        self.page.goto(search_url, wait_until="networkidle", timeout=PLAYWRIGHT_TIMEOUT)
-        self.page.wait_for_timeout(PLAYWRIGHT_WAIT_TIMEOUT)
+        self.waits.open_search_form(self.page, search_url)
         logger.debug("Formularz wyczyszczony")
     
+    def _reset_form_in_page(self) -> bool:
+        """
+        Czyści formularz w DOM i sprawdza, czy jest czysty.
+        
+        Returns:
+            True jeśli formularz jest czysty, False jeśli trzeba przeładować stronę
+        """
+        try:
+            with self.waits.timed('czyszczenie formularza'):
+                clean = self.page.evaluate(
+                    _RESET_SEARCH_FORM_SCRIPT,
+                    {'formSelector': RCL_SEARCH_FORM_SELECTOR, 'countText': RCL_RESULT_COUNT_TEXT}
+                )
+        except Exception as e:
+            logger.debug(f"Nie udało się wyczyścić formularza w miejscu: {e}")
+            return False
+        if not clean:
+            logger.debug("Formularz po czyszczeniu w miejscu nie jest czysty, przeładowanie strony")
+        return bool(clean)
+    
     def close_browser(self):
         """Zamyka przeglądarkę i zwalnia zasoby."""
-        if self.browser:
+        if self.context:
             logger.debug("Zamykanie przeglądarki...")
-            self.browser.close()
-            self.browser = None
-            self.context = None
-            self.page = None
+            try:
+                self.launcher.close(self.context)
+            except Exception as e:
+                # Po awarii przeglądarki zamknięcie może się nie udać - zasoby i tak są zwalniane
+                logger.warning(f"Błąd podczas zamykania przeglądarki: {e}")
+            finally:
+                self.context = None
+                self.page = None
         
         if self.playwright:
             self.playwright.stop()
             self.playwright = None
+
+
+class RCLBrowserPool:
+    """
+    Pula przeglądarek rozdzielająca wyszukiwania RCL między równoległe strony.
+    
+    Synchroniczne API Playwright jest związane z wątkiem, który je uruchomił,
+    dlatego każdy wątek roboczy ma własny RCLBrowserManager (Playwright,
+    przeglądarkę, kontekst i stronę - bez współdzielonych ciasteczek ani stanu
+    formularza). Wątki pobierają zadania ze wspólnej kolejki, a przeglądarka
+    jest uruchamiana raz na wątek, nie na zadanie.
+    
+    Między zadaniami strona jest odświeżana po limicie nawigacji lub pamięci,
+    a zadanie przerwane awarią strony jest powtarzane na nowej stronie.
+    """
+    
+    def __init__(
+        self,
+        size: int = RCL_BROWSER_POOL_SIZE,
+        active_tab: str = 'tab1',
+        headless: bool = True,
+        manager_factory: Optional[Callable[[], RCLBrowserManager]] = None,
+        resource_blocking: Optional[ResourceBlockingProfile] = None,
+        launcher: Optional[BrowserLauncher] = None
+    ):
+        """
+        Inicjalizuje pulę przeglądarek.
+        
+        Args:
+            size: Maksymalna liczba równolegle pracujących przeglądarek
+            active_tab: Aktywna zakładka wyszukiwania ('tab1' dla tagów, 'tab2' dla wyszukiwania)
+            headless: Czy przeglądarki mają działać w trybie headless
+            manager_factory: Funkcja tworząca RCLBrowserManager dla wątku (dependency injection)
+            resource_blocking: Profil blokowania zasobów współdzielony przez przeglądarki z puli
+            launcher: Launcher współdzielony przez przeglądarki z puli (domyślnie trwałe
+                profile w BROWSER_PROFILE_DIR, po jednym katalogu na przeglądarkę)
+        """
+        self.size = max(1, size)
+        # Czasy oczekiwania i liczniki zablokowanych zasobów wspólne dla wszystkich przeglądarek z puli
+        self.timings = WaitTimings()
+        self.launcher = launcher or BrowserLauncher(
+            headless=headless,
+            user_data_dir=BROWSER_PROFILE_DIR,
+            resource_blocking=resource_blocking
+        )
+        self.resource_blocking = self.launcher.resource_blocking
+        self.manager_factory = manager_factory or (
+            lambda: RCLBrowserManager(
+                active_tab=active_tab,
+                waits=BrowserWaits(self.timings),
+                launcher=self.launcher
+            )
+        )
+    
+    def map(self, fn: Callable[[RCLBrowserManager, T], R], items: Iterable[T]) -> List[Optional[R]]:
+        """
+        Wykonuje fn(manager, item) dla każdego elementu na wolnej stronie z puli.
+        
+        Args:
+            fn: Funkcja wykonująca wyszukiwanie na stronie managera
+            items: Elementy do przetworzenia (np. ID tagów, zapytania)
+            
+        Returns:
+            Wyniki w kolejności elementów (None dla elementów zakończonych błędem
+            lub nieprzetworzonych, bo żadna przeglądarka się nie uruchomiła)
+        """
+        items = list(items)
+        results: List[Optional[R]] = [None] * len(items)
+        if not items:
+            return results
+        
+        work: "queue.Queue" = queue.Queue()
+        for idx, item in enumerate(items):
+            work.put((idx, item))
+        
+        workers = [
+            threading.Thread(target=self._worker, args=(fn, work, results), name=f"rcl-browser-{n}", daemon=True)
+            for n in range(min(self.size, len(items)))
+        ]
+        logger.debug(f"Uruchamianie {len(workers)} przeglądarek dla {len(items)} zadań")
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        if not work.empty():
+            logger.error(f"Nie przetworzono {work.qsize()} zadań - nie udało się uruchomić żadnej przeglądarki")
+        
+        return results
+    
+    def log_stats(self) -> None:
+        """Wypisuje do logu czasy oczekiwania i liczbę zablokowanych zasobów ze wszystkich przeglądarek."""
+        self.timings.log_summary()
+        self.resource_blocking.log_summary()
+    
+    def _worker(self, fn: Callable[[RCLBrowserManager, T], R], work: "queue.Queue", results: List[Optional[R]]) -> None:
+        """Wątek roboczy: uruchamia własną przeglądarkę i przetwarza zadania z kolejki."""
+        manager = self.manager_factory()
+        try:
+            manager.start_browser()
+        except Exception as e:
+            logger.error(f"Nie udało się uruchomić przeglądarki: {e}")
+            return
+        
+        try:
+            while True:
+                try:
+                    idx, item = work.get_nowait()
+                except queue.Empty:
+                    return
+                
+                try:
+                    results[idx] = self._run_task(fn, manager, idx, item)
+                    manager.recycle_if_needed()
+                except Exception as e:
+                    logger.error(f"Nie udało się przywrócić przeglądarki po zadaniu {idx + 1}: {e}")
+                    return
+        finally:
+            manager.close_browser()
+    
+    def _run_task(
+        self,
+        fn: Callable[[RCLBrowserManager, T], R],
+        manager: RCLBrowserManager,
+        idx: int,
+        item: T
+    ) -> Optional[R]:
+        """
+        Wykonuje zadanie, a po awarii strony otwiera nową i powtarza je.
+        
+        Wynik zadania, w trakcie którego strona uległa awarii, jest odrzucany -
+        monitory zamieniają błędy strony na puste wyniki.
+        
+        Raises:
+            Exception: Jeśli nie udało się otworzyć nowej strony ani uruchomić przeglądarki
+        """
+        for attempt in range(RCL_BROWSER_CRASH_RETRIES + 1):
+            try:
+                result = fn(manager, item)
+            except Exception as e:
+                logger.error(f"Błąd podczas przetwarzania zadania {idx + 1} w przeglądarce: {e}")
+                result = None
+            
+            if manager.healthy:
+                return result
+            if attempt == RCL_BROWSER_CRASH_RETRIES:
+                logger.error(f"Zadanie {idx + 1} przerwane awarią strony przeglądarki")
+                return None
+            logger.warning(f"Awaria strony podczas zadania {idx + 1} - otwieranie nowej strony i powtórzenie")
+            manager.recycle_page()
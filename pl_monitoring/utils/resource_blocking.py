@@ -0,0 +1,126 @@
+"""Blokowanie zbędnych zasobów (obrazy, media, czcionki, analityka) w sesjach Playwright; style nie są blokowane."""
+
+import threading
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Request, Response, Route
+
+from ..constants import BROWSER_BLOCKED_HOSTS, BROWSER_BLOCKED_RESOURCE_TYPES
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResourceBlockingProfile:
+    """
+    Profil przechwytywania żądań: przerywa pobieranie typów zasobów i hostów,
+    których parsery nie używają, i zlicza zablokowane oraz przepuszczone żądania.
+    
+    Jeden profil może być współdzielony przez kilka kontekstów (np. pulę
+    przeglądarek) - liczniki są bezpieczne wątkowo.
+    """
+    
+    def __init__(
+        self,
+        blocked_types: Optional[Iterable[str]] = None,
+        blocked_hosts: Optional[Iterable[str]] = None
+    ):
+        """
+        Inicjalizuje profil.
+        
+        Args:
+            blocked_types: Typy zasobów Playwright do zablokowania (domyślnie BROWSER_BLOCKED_RESOURCE_TYPES)
+            blocked_hosts: Hosty (wraz z subdomenami) do zablokowania (domyślnie BROWSER_BLOCKED_HOSTS)
+        """
+        self.blocked_types = frozenset(BROWSER_BLOCKED_RESOURCE_TYPES if blocked_types is None else blocked_types)
+        self.blocked_hosts = tuple(BROWSER_BLOCKED_HOSTS if blocked_hosts is None else blocked_hosts)
+        self._lock = threading.Lock()
+        self.blocked_requests: Dict[str, int] = {}
+        self.allowed_requests = 0
+        self.allowed_bytes = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """Czy profil cokolwiek blokuje."""
+        return bool(self.blocked_types or self.blocked_hosts)
+    
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """
+        Sprawdza, czy żądanie ma zostać przerwane.
+        
+        Args:
+            resource_type: Typ zasobu Playwright (np. 'image', 'script')
+            url: Adres żądania
+            
+        Returns:
+            True jeśli zasób jest zbędny dla parserów
+        """
+        if resource_type in self.blocked_types:
+            return True
+        host = urlsplit(url).hostname or ''
+        return any(host == blocked or host.endswith(f".{blocked}") for blocked in self.blocked_hosts)
+    
+    def install(self, context: BrowserContext) -> None:
+        """
+        Włącza przechwytywanie żądań w kontekście przeglądarki.
+        
+        Args:
+            context: Kontekst Playwright (dotyczy wszystkich jego stron)
+        """
+        if not self.enabled:
+            return
+        context.route('**/*', self._handle_route)
+        context.on('response', self._count_response)
+    
+    async def ainstall(self, context: Any) -> None:
+        """
+        Asynchroniczny odpowiednik install (kontekst z playwright.async_api).
+        
+        Args:
+            context: Asynchroniczny kontekst Playwright
+        """
+        if not self.enabled:
+            return
+        await context.route('**/*', self._ahandle_route)
+        context.on('response', self._count_response)
+    
+    def _handle_route(self, route: Route, request: Request) -> None:
+        """Przerywa zbędne żądania, pozostałe przepuszcza."""
+        if self._count_blocked(request):
+            route.abort('blockedbyclient')
+        else:
+            route.continue_()
+    
+    async def _ahandle_route(self, route: Any, request: Any) -> None:
+        """Asynchroniczny odpowiednik _handle_route."""
+        if self._count_blocked(request):
+            await route.abort('blockedbyclient')
+        else:
+            await route.continue_()
+    
+    def _count_blocked(self, request: Any) -> bool:
+        """Sprawdza, czy żądanie ma zostać przerwane, i zlicza je jako zablokowane."""
+        if not self.should_block(request.resource_type, request.url):
+            return False
+        with self._lock:
+            self.blocked_requests[request.resource_type] = self.blocked_requests.get(request.resource_type, 0) + 1
+        return True
+    
+    def _count_response(self, response: Response) -> None:
+        """Zlicza przepuszczone odpowiedzi i ich rozmiar (wg Content-Length)."""
+        length = response.headers.get('content-length', '')
+        with self._lock:
+            self.allowed_requests += 1
+            self.allowed_bytes += int(length) if length.isdigit() else 0
+    
+    def log_summary(self) -> None:
+        """Wypisuje do logu liczbę zablokowanych (per typ zasobu) i przepuszczonych żądań."""
+        if not self.enabled:
+            return
+        with self._lock:
+            blocked = dict(self.blocked_requests)
+            allowed_requests, allowed_bytes = self.allowed_requests, self.allowed_bytes
+        details = ', '.join(f"{kind}: {count}" for kind, count in sorted(blocked.items()))
+        logger.info(f"Zablokowane zasoby: {sum(blocked.values())} ({details or 'brak'})")
+        logger.info(f"Przepuszczone zasoby: {allowed_requests} ({allowed_bytes / 1024:.0f} KB)")
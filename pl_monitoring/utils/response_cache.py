@@ -0,0 +1,250 @@
+"""Dyskowy cache treści stron HTML z TTL per źródło i limitem rozmiaru (LRU)."""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..constants import (
+    RESPONSE_CACHE_DEFAULT_TTL,
+    RESPONSE_CACHE_MAX_BYTES,
+    RESPONSE_CACHE_TTL_BY_HOST,
+)
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Tryby pracy cache
+CACHE_MODE_NORMAL = 'normal'    # Czytaj świeże wpisy, zapisuj nowe odpowiedzi
+CACHE_MODE_REFRESH = 'refresh'  # Zawsze pobieraj z sieci, ale aktualizuj cache
+CACHE_MODE_OFFLINE = 'offline'  # Tylko cache (bez względu na TTL), bez żądań sieciowych
+CACHE_MODES = (CACHE_MODE_NORMAL, CACHE_MODE_REFRESH, CACHE_MODE_OFFLINE)
+
+
+def _valid_entry(entry) -> bool:
+    """Sprawdza, czy wpis indeksu ma wszystkie pola używane przez cache (z poprawnymi typami)."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get('file'), str)
+        and all(isinstance(entry.get(key), (int, float)) for key in ('size', 'stored_at', 'accessed_at'))
+        and isinstance(entry.get('headers', {}), dict)
+    )
+
+# Nagłówki odpowiedzi zachowywane razem z treścią
+_STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+class ResponseCache:
+    """
+    Cache odpowiedzi HTTP 200 zapisywany na dysku jako pliki gzip.
+    
+    Każdy URL ma osobny plik w katalogu cache, a indeks (index.json) przechowuje
+    czas zapisu, czas ostatniego użycia i rozmiar. Wpis jest świeży przez TTL
+    zależny od hosta. Gdy łączny rozmiar przekroczy limit, usuwane są najdawniej
+    używane wpisy.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_size_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+        ttl_by_host: Optional[Dict[str, int]] = None,
+        default_ttl: int = RESPONSE_CACHE_DEFAULT_TTL,
+        mode: str = CACHE_MODE_NORMAL
+    ):
+        """
+        Inicjalizuje cache odpowiedzi.
+        
+        Args:
+            cache_dir: Katalog cache (domyślnie z config.py)
+            max_size_bytes: Maksymalny łączny rozmiar skompresowanych wpisów
+            ttl_by_host: TTL w sekundach dla poszczególnych hostów
+            default_ttl: TTL w sekundach dla pozostałych hostów
+            mode: Tryb pracy: 'normal', 'refresh' lub 'offline'
+            
+        Raises:
+            ValueError: Jeśli podano nieznany tryb
+        """
+        from ..config import RESPONSE_CACHE_DIR
+        
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Nieznany tryb cache: {mode} (dostępne: {', '.join(CACHE_MODES)})")
+        
+        self.cache_dir = cache_dir or RESPONSE_CACHE_DIR
+        self.max_size_bytes = max_size_bytes
+        self.ttl_by_host = RESPONSE_CACHE_TTL_BY_HOST if ttl_by_host is None else ttl_by_host
+        self.default_ttl = default_ttl
+        self.mode = mode
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        self._lock = threading.Lock()
+        self._index_file = self.cache_dir / 'index.json'
+        self._index: Dict[str, Dict] = self._load_index()
+    
+    @property
+    def offline(self) -> bool:
+        """Czy cache działa w trybie offline (bez żądań sieciowych)."""
+        return self.mode == CACHE_MODE_OFFLINE
+    
+    def _load_index(self) -> Dict[str, Dict]:
+        """Wczytuje indeks i pomija wpisy uszkodzone oraz te, których plików już nie ma."""
+        if not self._index_file.exists():
+            return {}
+        
+        try:
+            with open(self._index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Nie można wczytać indeksu cache {self._index_file}: {e}")
+            return {}
+        if not isinstance(index, dict):
+            logger.warning(f"Nieprawidłowy format indeksu cache {self._index_file}")
+            return {}
+        
+        invalid = [url for url, entry in index.items() if not _valid_entry(entry)]
+        if invalid:
+            logger.warning(f"Pominięto {len(invalid)} uszkodzony(ch) wpis(ów) indeksu cache {self._index_file}")
+            for url in invalid:
+                logger.debug(f"  Uszkodzony wpis cache: {url}")
+        
+        return {
+            url: entry for url, entry in index.items()
+            if url not in invalid and (self.cache_dir / entry['file']).exists()
+        }
+    
+    def _ttl_for(self, url: str) -> int:
+        """Zwraca TTL dla hosta z URL."""
+        return self.ttl_by_host.get(urlsplit(url).netloc, self.default_ttl)
+    
+    def get(self, url: str) -> Optional[requests.Response]:
+        """
+        Zwraca odpowiedź z cache, jeśli wpis istnieje i jest świeży.
+        
+        W trybie 'refresh' zawsze zwraca None, w trybie 'offline' ignoruje TTL.
+        
+        Args:
+            url: Adres URL
+            
+        Returns:
+            Odpowiedź odtworzona z cache lub None
+        """
+        if self.mode == CACHE_MODE_REFRESH:
+            return None
+        
+        with self._lock:
+            entry = self._index.get(url)
+            fresh = entry is not None and (
+                self.offline or time.time() - entry['stored_at'] <= self._ttl_for(url)
+            )
+            if not fresh:
+                self.misses += 1
+                return None
+            entry['accessed_at'] = time.time()
+        
+        try:
+            with gzip.open(self.cache_dir / entry['file'], 'rb') as f:
+                content = f.read()
+        except OSError as e:
+            logger.warning(f"Nie można odczytać wpisu cache dla {url}: {e}")
+            with self._lock:
+                self._index.pop(url, None)
+                self.misses += 1
+            return None
+        
+        with self._lock:
+            self.hits += 1
+        
+        return self._build_response(url, content, entry.get('headers', {}))
+    
+    def _build_response(self, url: str, content: bytes, headers: Dict[str, str]) -> requests.Response:
+        """Tworzy obiekt requests.Response z treści zapisanej w cache."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = url
+        response._content = content
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+    
+    def store(self, url: str, response: requests.Response) -> None:
+        """
+        Zapisuje odpowiedź 200 w cache i w razie potrzeby usuwa najdawniej używane wpisy.
+        
+        Args:
+            url: Adres URL
+            response: Odpowiedź HTTP
+        """
+        if response.status_code != 200:
+            return
+        
+        file_name = hashlib.sha1(url.encode('utf-8')).hexdigest() + '.html.gz'
+        path = self.cache_dir / file_name
+        tmp_path = path.with_suffix(f'.tmp{threading.get_ident()}')
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+                f.write(response.content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Nie można zapisać wpisu cache dla {url}: {e}")
+            return
+        
+        now = time.time()
+        with self._lock:
+            self._index[url] = {
+                'file': file_name,
+                'size': path.stat().st_size,
+                'stored_at': now,
+                'accessed_at': now,
+                'headers': {h: response.headers[h] for h in _STORED_HEADERS if h in response.headers},
+            }
+            self._evict()
+    
+    def _evict(self) -> None:
+        """Usuwa najdawniej używane wpisy, aż rozmiar cache zmieści się w limicie (wymaga blokady)."""
+        total = sum(entry['size'] for entry in self._index.values())
+        if total <= self.max_size_bytes:
+            return
+        
+        for url, entry in sorted(self._index.items(), key=lambda item: item[1]['accessed_at']):
+            if total <= self.max_size_bytes:
+                break
+            try:
+                (self.cache_dir / entry['file']).unlink()
+            except OSError:
+                pass
+            total -= entry['size']
+            del self._index[url]
+            self.evictions += 1
+    
+    def save(self) -> None:
+        """Zapisuje indeks cache na dysk."""
+        with self._lock:
+            index = dict(self._index)
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._index_file, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+        except OSError as e:
+            logger.warning(f"Nie można zapisać indeksu cache {self._index_file}: {e}")
+    
+    def log_stats(self) -> None:
+        """Loguje trafienia, chybienia i usunięcia wpisów."""
+        logger.info(
+            f"Cache odpowiedzi HTTP ({self.mode}): {self.hits} trafień, "
+            f"{self.misses} chybień, {self.evictions} usuniętych wpisów"
+        )
@@ -0,0 +1,96 @@
+"""Łączenie powtórzonych żądań (single-flight) w obrębie jednego uruchomienia."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, TypeVar
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Wykonuje pobranie i parsowanie zasobu tylko raz dla danego klucza (np. URL).
+    
+    Pierwsze wywołanie dla klucza wykonuje funkcję, a równoległe i późniejsze
+    wywołania z tym samym kluczem dostają ten sam wynik (lub ten sam wyjątek).
+    Wyniki są pamiętane przez cały czas życia obiektu - monitor tworzy nowy
+    obiekt na każde uruchomienie.
+    """
+    
+    def __init__(self):
+        """Inicjalizuje pustą mapę wyników."""
+        self.executed = 0
+        self.deduplicated = 0
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+        self._tasks: Dict[str, "asyncio.Future"] = {}
+    
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Zwraca wynik fn() współdzielony przez wszystkie wywołania z tym samym kluczem.
+        
+        Args:
+            key: Klucz zasobu (znormalizowany URL)
+            fn: Funkcja pobierająca i parsująca zasób
+            
+        Returns:
+            Wynik fn() (z pierwszego wywołania dla klucza)
+            
+        Raises:
+            Wyjątek zgłoszony przez fn() w pierwszym wywołaniu dla klucza
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = self._futures[key] = Future()
+                self.executed += 1
+            else:
+                self.deduplicated += 1
+        
+        if owner:
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+        
+        return future.result()
+    
+    async def ado(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Asynchroniczny odpowiednik do() - współdzieli korutynę między wywołaniami.
+        
+        Args:
+            key: Klucz zasobu (znormalizowany URL)
+            fn: Funkcja zwracająca korutynę pobierającą i parsującą zasób
+            
+        Returns:
+            Wynik korutyny (z pierwszego wywołania dla klucza)
+        """
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = asyncio.ensure_future(fn())
+                self.executed += 1
+            else:
+                self.deduplicated += 1
+        
+        return await asyncio.shield(task)
+    
+    def log_stats(self, label: str = 'zasobów') -> None:
+        """
+        Loguje liczbę wykonanych pobrań i połączonych duplikatów.
+        
+        Args:
+            label: Nazwa rodzaju zasobu w komunikacie
+        """
+        if self.deduplicated:
+            logger.info(
+                f"Pobrano {self.executed} unikalnych {label}, "
+                f"{self.deduplicated} duplikatów obsłużono bez ponownego pobrania"
+            )
@@ -0,0 +1,178 @@
+"""Trwały cache walidatorów HTTP (ETag / Last-Modified) dla żądań warunkowych."""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ValidatorCache:
+    """
+    Przechowuje ETag/Last-Modified oraz wynik parsowania dla każdego URL.
+    
+    Przy kolejnym uruchomieniu monitor wysyła If-None-Match/If-Modified-Since,
+    a gdy serwer odpowie 304 Not Modified, używa zapisanego wyniku parsowania
+    zamiast ponownie pobierać i parsować stronę.
+    
+    Walidatory z odpowiedzi są najpierw zapamiętywane tymczasowo i trafiają do
+    cache dopiero razem z wynikiem parsowania (store_payload) - dzięki temu nie
+    wysyłamy żądań warunkowych dla stron, których wyniku nie znamy.
+    
+    Z jednego pliku korzystają monitory RCL i Sejmu, więc save() łączy zmiany
+    tej instancji z aktualną zawartością pliku zamiast go nadpisywać.
+    """
+    
+    def __init__(self, cache_file: Optional[Path] = None):
+        """
+        Inicjalizuje cache walidatorów.
+        
+        Args:
+            cache_file: Ścieżka do pliku JSON z cache (domyślnie z config.py)
+        """
+        from ..config import HTTP_VALIDATORS_CACHE
+        
+        self.cache_file = cache_file or HTTP_VALIDATORS_CACHE
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, str]] = {}
+        # URL wpisów dodanych lub usuniętych przez tę instancję (do połączenia z plikiem w save)
+        self._changed: Set[str] = set()
+        self._removed: Set[str] = set()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Wczytuje cache z pliku (pusty cache jeśli plik nie istnieje lub jest uszkodzony)."""
+        if not self.cache_file.exists():
+            return {}
+        
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Nie można wczytać cache walidatorów {self.cache_file}: {e}")
+            return {}
+        
+        return data.get('entries', {}) if isinstance(data, dict) else {}
+    
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Zwraca nagłówki żądania warunkowego dla URL.
+        
+        Args:
+            url: Adres URL strony
+            
+        Returns:
+            Słownik z If-None-Match/If-Modified-Since (pusty jeśli brak wpisu)
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        
+        if not entry or 'payload' not in entry:
+            return {}
+        
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def get_payload(self, url: str) -> Optional[Any]:
+        """
+        Zwraca zapisany wynik parsowania dla URL.
+        
+        Args:
+            url: Adres URL strony
+            
+        Returns:
+            Zapisany wynik parsowania lub None
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        return entry.get('payload') if entry else None
+    
+    def remember_validators(self, url: str, response_headers) -> None:
+        """
+        Zapamiętuje walidatory z odpowiedzi 200 (do zatwierdzenia przez store_payload).
+        
+        Args:
+            url: Adres URL strony
+            response_headers: Nagłówki odpowiedzi HTTP
+        """
+        validators = {
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+        }
+        
+        with self._lock:
+            if validators['etag'] or validators['last_modified']:
+                self._pending[url] = validators
+            else:
+                self._pending.pop(url, None)
+                # Serwer przestał wysyłać walidatory - stary wpis jest bezużyteczny
+                if self._entries.pop(url, None) is not None:
+                    self._changed.discard(url)
+                    self._removed.add(url)
+    
+    def store_payload(self, url: str, payload: Any) -> None:
+        """
+        Zapisuje wynik parsowania razem z zapamiętanymi walidatorami.
+        
+        Args:
+            url: Adres URL strony
+            payload: Wynik parsowania (musi być serializowalny do JSON)
+        """
+        with self._lock:
+            validators = self._pending.pop(url, None)
+            if validators is None:
+                return
+            self._entries[url] = {**validators, 'payload': payload}
+            self._changed.add(url)
+            self._removed.discard(url)
+    
+    def record_hit(self) -> None:
+        """Zlicza odpowiedź 304 obsłużoną z cache."""
+        with self._lock:
+            self.hits += 1
+    
+    def record_miss(self) -> None:
+        """Zlicza pełne pobranie strony."""
+        with self._lock:
+            self.misses += 1
+    
+    def save(self) -> None:
+        """
+        Zapisuje zmiany do pliku (tylko jeśli jakieś były).
+        
+        Wpisy zapisane w międzyczasie przez inne monitory (np. Sejm przy
+        monitoringu RCL) są zachowywane - plik jest wczytywany ponownie,
+        a zmiany tej instancji nakładane na jego zawartość.
+        """
+        with self._lock:
+            if not self._changed and not self._removed:
+                return
+            entries = self._load()
+            for url in self._removed:
+                entries.pop(url, None)
+            for url in self._changed:
+                entries[url] = self._entries[url]
+            self._entries = entries
+            self._changed.clear()
+            self._removed.clear()
+            data = {'entries': dict(entries)}
+        
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"Nie można zapisać cache walidatorów {self.cache_file}: {e}")
+    
+    def log_stats(self) -> None:
+        """Loguje liczbę trafień (304) i pełnych pobrań."""
+        logger.info(f"Cache walidatorów HTTP: {self.hits} bez zmian (304), {self.misses} pełnych pobrań")
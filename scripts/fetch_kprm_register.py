@@ -20,7 +20,9 @@ def main():
     fetcher = KPRMRegisterFetcher()
     success = fetcher.download()
     
-    if success:
+    if success and fetcher.unchanged:
+        print(f"\nRejestr bez zmian, plik: {fetcher.output_file}")
+    elif success:
         print(f"\nPlik zapisany w: {fetcher.output_file}")
     else:
         print("\nNie udało się pobrać pliku")
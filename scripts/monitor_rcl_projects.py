@@ -3,14 +3,17 @@
 Entry point do monitoringu konkretnych projektów RCL.
 
 Użycie:
-    python scripts/monitor_rcl_projects.py <data_początkowa> <data_końcowa>
-
+    python scripts/monitor_rcl_projects.py <data_początkowa> <data_końcowa> [--max-workers N] [--refresh | --offline]
+    
 Format dat: YYYY-MM-DD
 
 Przykład:
     python scripts/monitor_rcl_projects.py 2025-01-01 2025-12-31
+    python scripts/monitor_rcl_projects.py 2025-01-01 2025-12-31 --max-workers 8
+    python scripts/monitor_rcl_projects.py 2025-03-01 2025-03-31 --offline
 """
 
+import argparse
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -18,25 +21,60 @@ from pathlib import Path
 # Dodaj główny katalog projektu do ścieżki
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from pl_monitoring.constants import DEFAULT_MAX_WORKERS
 from pl_monitoring.monitors.rcl_project_monitor import RCLProjectMonitor
+from pl_monitoring.utils.http_client import HTTPClient
 from pl_monitoring.utils.logger import get_logger
+from pl_monitoring.utils.response_cache import (
+    CACHE_MODE_NORMAL,
+    CACHE_MODE_OFFLINE,
+    CACHE_MODE_REFRESH,
+    ResponseCache,
+)
 
 logger = get_logger(__name__)
 
 
+def parse_args():
+    """Parsuje argumenty wiersza poleceń."""
+    parser = argparse.ArgumentParser(
+        description="Monitoring konkretnych projektów RCL",
+        epilog="Przykład: python scripts/monitor_rcl_projects.py 2025-01-01 2025-12-31"
+    )
+    parser.add_argument('start_date', help="Data początkowa (YYYY-MM-DD)")
+    parser.add_argument('end_date', help="Data końcowa (YYYY-MM-DD)")
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Liczba równoległych pobrań stron projektów (domyślnie {DEFAULT_MAX_WORKERS}, 1 = sekwencyjnie)"
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        '--refresh',
+        action='store_true',
+        help="Pobierz strony z serwera z pominięciem cache odpowiedzi (cache zostanie odświeżony)"
+    )
+    cache_group.add_argument(
+        '--offline',
+        action='store_true',
+        help="Korzystaj wyłącznie ze stron zapisanych w cache odpowiedzi, bez żądań do serwera"
+    )
+    return parser.parse_args()
+
+
 def main():
     """Główna funkcja."""
-    if len(sys.argv) != 3:
-        print("Użycie: python scripts/monitor_rcl_projects.py <data_początkowa> <data_końcowa>")
-        print("Format dat: YYYY-MM-DD")
-        print("\nPrzykład:")
-        print("  python scripts/monitor_rcl_projects.py 2025-01-01 2025-12-31")
+    args = parse_args()
+    
+    if args.max_workers < 1:
+        print("Błąd: --max-workers musi być liczbą dodatnią")
         sys.exit(1)
     
     # Parsowanie dat
     try:
-        start_date = datetime.strptime(sys.argv[1], "%Y-%m-%d")
-        end_date = datetime.strptime(sys.argv[2], "%Y-%m-%d")
+        start_date = datetime.strptime(args.start_date, "%Y-%m-%d")
+        end_date = datetime.strptime(args.end_date, "%Y-%m-%d")
     except ValueError as e:
         logger.error(f"Błąd parsowania dat: {e}")
         print(f"Błąd parsowania dat: {e}")
@@ -49,10 +87,20 @@ def main():
         print(f"Błąd: Data początkowa nie może być późniejsza niż data końcowa")
         sys.exit(1)
     
+    if args.refresh:
+        cache_mode = CACHE_MODE_REFRESH
+    elif args.offline:
+        cache_mode = CACHE_MODE_OFFLINE
+    else:
+        cache_mode = CACHE_MODE_NORMAL
+    
     # Monitoring
     try:
-        monitor = RCLProjectMonitor()
-        monitor.monitor(start_date, end_date)
+        response_cache = ResponseCache(mode=cache_mode)
+        # Pula połączeń musi pomieścić wszystkie równoległe pobrania
+        with HTTPClient(pool_size=args.max_workers, response_cache=response_cache) as http_client:
+            monitor = RCLProjectMonitor(http_client=http_client, max_workers=args.max_workers)
+            monitor.monitor(start_date, end_date)
     except Exception as e:
         logger.exception("Błąd podczas monitoringu projektów RCL")
         print(f"Błąd: {e}")
@@ -3,14 +3,19 @@
 Entry point do monitoringu konkretnych projektów Sejm.
 
 Użycie:
-    python scripts/monitor_sejm_projects.py <data_początkowa> <data_końcowa>
-
+    python scripts/monitor_sejm_projects.py <data_początkowa> <data_końcowa> [--async] [--concurrency N]
+                                            [--refresh | --offline]
+                                            
 Format dat: YYYY-MM-DD
 
 Przykład:
     python scripts/monitor_sejm_projects.py 2025-01-01 2025-12-31
+    python scripts/monitor_sejm_projects.py 2025-01-01 2025-12-31 --async --concurrency 20
+    python scripts/monitor_sejm_projects.py 2025-03-01 2025-03-31 --offline
 """
 
+import argparse
+import asyncio
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -18,22 +23,59 @@ from pathlib import Path
 # Dodaj główny katalog projektu do ścieżki
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from pl_monitoring.constants import DEFAULT_ASYNC_CONCURRENCY
 from pl_monitoring.monitors.sejm_project_monitor import SejmProjectMonitor
+from pl_monitoring.utils.http_client import HTTPClient
+from pl_monitoring.utils.response_cache import (
+    CACHE_MODE_NORMAL,
+    CACHE_MODE_OFFLINE,
+    CACHE_MODE_REFRESH,
+    ResponseCache,
+)
+
+
+def parse_args():
+    """Parsuje argumenty wiersza poleceń."""
+    parser = argparse.ArgumentParser(
+        description="Monitoring konkretnych projektów Sejm",
+        epilog="Przykład: python scripts/monitor_sejm_projects.py 2025-01-01 2025-12-31"
+    )
+    parser.add_argument('start_date', help="Data początkowa (YYYY-MM-DD)")
+    parser.add_argument('end_date', help="Data końcowa (YYYY-MM-DD)")
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help="Pobieraj strony procesu równolegle przez asyncio (wymaga aiohttp)"
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_ASYNC_CONCURRENCY,
+        help=f"Limit jednoczesnych żądań w trybie --async (domyślnie {DEFAULT_ASYNC_CONCURRENCY})"
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        '--refresh',
+        action='store_true',
+        help="Pobierz strony z serwera z pominięciem cache odpowiedzi (cache zostanie odświeżony)"
+    )
+    cache_group.add_argument(
+        '--offline',
+        action='store_true',
+        help="Korzystaj wyłącznie ze stron zapisanych w cache odpowiedzi, bez żądań do serwera"
+    )
+    return parser.parse_args()
 
 
 def main():
     """Główna funkcja."""
-    if len(sys.argv) != 3:
-        print("Użycie: python scripts/monitor_sejm_projects.py <data_początkowa> <data_końcowa>")
-        print("Format dat: YYYY-MM-DD")
-        print("\nPrzykład:")
-        print("  python scripts/monitor_sejm_projects.py 2025-01-01 2025-12-31")
-        sys.exit(1)
+    args = parse_args()
     
     # Parsowanie dat
     try:
-        start_date = datetime.strptime(sys.argv[1], "%Y-%m-%d")
-        end_date = datetime.strptime(sys.argv[2], "%Y-%m-%d")
+        start_date = datetime.strptime(args.start_date, "%Y-%m-%d")
+        end_date = datetime.strptime(args.end_date, "%Y-%m-%d")
     except ValueError as e:
         print(f"Błąd parsowania dat: {e}")
         print("Użyj formatu: YYYY-MM-DD")
@@ -44,11 +86,29 @@ def main():
         print(f"Błąd: Data początkowa ({start_date.strftime('%Y-%m-%d')}) nie może być późniejsza niż data końcowa ({end_date.strftime('%Y-%m-%d')})")
         sys.exit(1)
     
+    # Cache odpowiedzi obsługuje tylko synchroniczny klient HTTP
+    if args.use_async and (args.refresh or args.offline):
+        print("Błąd: --refresh i --offline nie są dostępne w trybie --async")
+        sys.exit(1)
+    
+    if args.refresh:
+        cache_mode = CACHE_MODE_REFRESH
+    elif args.offline:
+        cache_mode = CACHE_MODE_OFFLINE
+    else:
+        cache_mode = CACHE_MODE_NORMAL
+    
     # Monitoring
-    monitor = SejmProjectMonitor()
-    monitor.monitor(start_date, end_date)
+    if args.use_async:
+        from pl_monitoring.monitors.async_sejm_project_monitor import AsyncSejmProjectMonitor
+        
+        monitor = AsyncSejmProjectMonitor(max_concurrency=args.concurrency)
+        asyncio.run(monitor.amonitor(start_date, end_date))
+    else:
+        with HTTPClient(response_cache=ResponseCache(mode=cache_mode)) as http_client:
+            monitor = SejmProjectMonitor(http_client=http_client)
+            monitor.monitor(start_date, end_date)
 
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,264 @@
+"""Testy dla modułu async_rcl_browser_manager i asynchronicznych monitorów RCL."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from pl_monitoring.monitors.async_rcl_search_monitor import AsyncRCLSearchMonitor
+from pl_monitoring.exceptions import RCLConnectionError
+from pl_monitoring.monitors.async_rcl_tag_monitor import AsyncRCLTagMonitor
+from pl_monitoring.utils.async_rcl_browser_manager import AsyncRCLBrowserManager
+from pl_monitoring.utils.browser_waits import BrowserWaits
+
+
+class _AsyncPage:
+    """Asynchroniczna strona Playwright bez przeglądarki."""
+    
+    def __init__(self):
+        self.url = 'about:blank'
+        self.closed = False
+        self.handlers = {}
+        self.clean = True
+        self.heap_bytes = 0
+        self.visited = []
+    
+    def on(self, event, handler):
+        self.handlers[event] = handler
+    
+    def emit(self, event):
+        if event in self.handlers:
+            self.handlers[event](self)
+    
+    def is_closed(self):
+        return self.closed
+    
+    async def close(self):
+        self.closed = True
+    
+    async def goto(self, url, wait_until=None, timeout=None):
+        self.url = url
+        self.visited.append(url)
+        self.emit('domcontentloaded')
+    
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        pass
+    
+    async def evaluate(self, script, arg=None):
+        if 'performance.memory' in script:
+            return self.heap_bytes
+        return self.clean
+
+
+class _AsyncContext:
+    """Asynchroniczny kontekst przeglądarki tworzący _AsyncPage."""
+    
+    def __init__(self):
+        self.pages = []
+        self.opened = []
+    
+    async def new_page(self):
+        page = _AsyncPage()
+        self.opened.append(page)
+        return page
+
+
+def _manager(max_pages=2, max_navigations=50, max_js_heap_mb=None):
+    """Manager z kontekstem _AsyncContext zamiast uruchomionej przeglądarki (w pętli zdarzeń)."""
+    manager = AsyncRCLBrowserManager(
+        active_tab='tab2', max_pages=max_pages, waits=BrowserWaits(),
+        max_navigations=max_navigations, max_js_heap_mb=max_js_heap_mb
+    )
+    manager.context = _AsyncContext()
+    manager._semaphore = asyncio.Semaphore(manager.max_pages)
+    return manager
+
+
+class TestAsyncRCLBrowserManager:
+    """Testy dla klasy AsyncRCLBrowserManager."""
+    
+    def test_pages_limited_and_reused(self):
+        """Test że równoległe zadania używają najwyżej max_pages stron, a wolne strony są używane ponownie."""
+        async def scenario():
+            manager = _manager(max_pages=2)
+            active = []
+            peak = []
+            
+            async def search(page):
+                active.append(page)
+                peak.append(len(active))
+                await asyncio.sleep(0.01)
+                active.remove(page)
+                return page
+            
+            pages = await asyncio.gather(*(manager.run(search) for _ in range(6)))
+            return manager, pages, max(peak)
+        
+        manager, pages, peak = asyncio.run(scenario())
+        
+        assert peak == 2
+        assert len(manager.context.opened) == 2
+        assert {id(page) for page in pages} == {id(page) for page in manager.context.opened}
+    
+    def test_task_retried_on_new_page_after_crash(self):
+        """Test że zadanie przerwane awarią renderera jest powtarzane na nowej stronie."""
+        async def scenario():
+            manager = _manager(max_pages=1)
+            calls = []
+            
+            async def search(page):
+                calls.append(page)
+                if len(calls) == 1:
+                    page.emit('crash')
+                return 'wynik'
+            
+            return manager, calls, await manager.run(search)
+        
+        manager, calls, result = asyncio.run(scenario())
+        
+        assert result == 'wynik'
+        assert calls[0] is not calls[1]
+        assert calls[0].closed
+    
+    def test_task_retried_when_crash_raises(self):
+        """Test że wyjątek zadania po awarii renderera powoduje powtórzenie na nowej stronie."""
+        async def scenario():
+            manager = _manager(max_pages=1)
+            calls = []
+            
+            async def search(page):
+                calls.append(page)
+                if len(calls) == 1:
+                    page.emit('crash')
+                    raise RCLConnectionError("Target crashed")
+                return 'wynik'
+            
+            return calls, await manager.run(search)
+        
+        calls, result = asyncio.run(scenario())
+        
+        assert result == 'wynik'
+        assert len(calls) == 2 and calls[0].closed
+    
+    def test_error_without_crash_raised(self):
+        """Test że wyjątek zadania na sprawnej stronie nie jest powtarzany, a strona wraca do puli."""
+        async def scenario():
+            manager = _manager(max_pages=1)
+            calls = []
+            
+            async def search(page):
+                calls.append(page)
+                raise RCLConnectionError("brak wyników")
+            
+            with pytest.raises(RCLConnectionError):
+                await manager.run(search)
+            return manager, calls
+        
+        manager, calls = asyncio.run(scenario())
+        
+        assert len(calls) == 1
+        assert manager._idle_pages == calls
+    
+    def test_page_closed_after_heap_limit(self):
+        """Test że strona z przekroczonym limitem sterty JS jest zamykana zamiast wracać do puli."""
+        async def scenario():
+            manager = _manager(max_pages=1, max_js_heap_mb=100)
+            
+            async def search(page):
+                page.heap_bytes = 150 * 1024 * 1024
+                return page
+            
+            return manager, await manager.run(search)
+        
+        manager, page = asyncio.run(scenario())
+        
+        assert page.closed
+        assert manager._idle_pages == []
+    
+    def test_page_closed_after_navigation_limit(self):
+        """Test że strona po limicie nawigacji jest zamykana zamiast wracać do puli."""
+        async def scenario():
+            manager = _manager(max_pages=1, max_navigations=2)
+            
+            async def search(page):
+                await page.goto('https://legislacja.rcl.gov.pl/szukaj?wynik')
+                return page
+            
+            first = await manager.run(search)
+            second = await manager.run(search)
+            return first, second
+        
+        first, second = asyncio.run(scenario())
+        
+        assert first.closed
+        assert second is not first
+    
+    def test_form_reset_falls_back_to_navigation(self):
+        """Test że nieudane czyszczenie formularza w DOM ładuje stronę wyszukiwania od nowa."""
+        page = _AsyncPage()
+        page.clean = False
+        
+        asyncio.run(_manager().clear_search_form(page))
+        
+        assert page.visited == ['https://legislacja.rcl.gov.pl/szukaj?activeTab=tab2#list']
+
+
+class TestAsyncRCLMonitors:
+    """Testy asynchronicznych monitorów RCL (wyszukiwanie na wielu stronach jednej przeglądarki)."""
+    
+    def test_tag_results_in_tag_order(self, tmp_path):
+        """Test że tagi wyszukane równolegle w przeglądarce zachowują kolejność z konfiguracji."""
+        monitor = AsyncRCLTagMonitor(
+            load_tags_fn=lambda: [{"id": tag_id, "name": ""} for tag_id in [5, 3, 9, 1]],
+            output_file=tmp_path / 'results.json',
+            browser_manager=_manager(max_pages=3)
+        )
+        
+        async def browser_search(page, tag_id, search_url, start_date, end_date):
+            await asyncio.sleep(0.001 * tag_id)
+            return [{"id": tag_id, "title": "", "updated_date": "", "number": ""}]
+        
+        with patch.object(monitor, '_search_by_tag_http', return_value=None), \
+                patch.object(monitor, '_asearch_by_tag_browser', side_effect=browser_search):
+            result = asyncio.run(monitor.amonitor(datetime(2025, 3, 1), datetime(2025, 3, 31)))
+        
+        assert [item['id'] for item in result] == [5, 3, 9, 1]
+    
+    def test_no_sync_browser_pool(self, tmp_path):
+        """Test że monitory asynchroniczne nie tworzą nieużywanej puli przeglądarek RCLBrowserPool."""
+        tag_monitor = AsyncRCLTagMonitor(load_tags_fn=list, browser_manager=_manager())
+        search_monitor = AsyncRCLSearchMonitor(
+            load_queries_fn=list, output_file=tmp_path / 'search.json', browser_manager=_manager()
+        )
+        
+        assert tag_monitor.browser_pool is None
+        assert search_monitor.browser_pool is None
+    
+    def test_search_form_used_when_url_gives_no_table(self, tmp_path):
+        """Test że bez tabeli pod bezpośrednim URL formularz jest czyszczony i wypełniany."""
+        manager = _manager()
+        monitor = AsyncRCLSearchMonitor(
+            load_queries_fn=lambda: [{"kprm_number": "UC2"}, {"ue_act_number": "2023/1114"}],
+            output_file=tmp_path / 'search.json',
+            browser_manager=manager
+        )
+        found = {
+            "UC2": [{"id": 2, "title": "B", "number": "UC2"}],
+            "2023/1114": [{"id": 1, "title": "A", "number": "UC1"}, {"id": 2, "title": "B", "number": "UC2"}],
+        }
+        
+        async def url_search(page, search_url, description, start_date, end_date):
+            return None
+        
+        async def form_search(page, kind, value, start_date, end_date):
+            return found[value]
+        
+        with patch.object(monitor, '_search_identifier_http', return_value=None), \
+                patch.object(monitor, '_asearch_url_browser', side_effect=url_search), \
+                patch.object(monitor, '_asearch_form', side_effect=form_search), \
+                patch.object(manager, 'clear_search_form', wraps=manager.clear_search_form) as clear:
+            result = asyncio.run(monitor.amonitor(datetime(2025, 1, 1), datetime(2025, 12, 31)))
+        
+        assert [project['id'] for project in result] == [2, 1]
+        assert clear.call_count == 2
@@ -0,0 +1,186 @@
+"""Testy dla modułu browser_launcher."""
+
+import json
+
+from pl_monitoring.utils.browser_launcher import BrowserLauncher
+from pl_monitoring.utils.browser_waits import BrowserWaits
+from pl_monitoring.utils.rcl_browser_manager import RCLBrowserManager
+from pl_monitoring.utils.resource_blocking import ResourceBlockingProfile
+
+
+class _FakePage:
+    def __init__(self):
+        self.handlers = {}
+        self.closed = False
+        self.heap_bytes = None
+    
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+    
+    def emit(self, event):
+        for handler in self.handlers.get(event, []):
+            handler(self)
+    
+    def is_closed(self):
+        return self.closed
+    
+    def close(self):
+        self.closed = True
+        self.emit('close')
+    
+    def evaluate(self, script):
+        return self.heap_bytes
+    
+    def goto(self, url, wait_until=None, timeout=None):
+        pass
+    
+    def wait_for_selector(self, selector, state=None, timeout=None):
+        pass
+
+
+class _FakeContext:
+    def __init__(self, browser=None, options=None):
+        self.browser = browser
+        self.options = options or {}
+        self.pages = []
+        self.closed = False
+    
+    def route(self, pattern, handler):
+        pass
+    
+    def on(self, event, handler):
+        pass
+    
+    def new_page(self):
+        page = _FakePage()
+        page.on('close', lambda page: self.pages.remove(page))
+        self.pages.append(page)
+        return page
+    
+    def storage_state(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'cookies': [{'name': 'sesja'}], 'origins': []}, f)
+    
+    def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self, headless):
+        self.headless = headless
+        self.closed = False
+        self.contexts = []
+    
+    def new_context(self, **options):
+        self.contexts.append(_FakeContext(self, options))
+        return self.contexts[-1]
+    
+    def close(self):
+        self.closed = True
+
+
+class _FakeChromium:
+    def __init__(self):
+        self.browsers = []
+        self.profiles = []
+    
+    def launch(self, headless):
+        self.browsers.append(_FakeBrowser(headless))
+        return self.browsers[-1]
+    
+    def launch_persistent_context(self, user_data_dir, headless, **options):
+        self.profiles.append((user_data_dir, headless))
+        return _FakeContext(options=options)
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.chromium = _FakeChromium()
+    
+    def stop(self):
+        pass
+
+
+def _launcher(**kwargs):
+    return BrowserLauncher(resource_blocking=ResourceBlockingProfile(blocked_types=(), blocked_hosts=()), **kwargs)
+
+
+class TestBrowserLauncher:
+    """Testy dla klasy BrowserLauncher."""
+    
+    def test_headless_by_default(self):
+        """Test że przeglądarka domyślnie startuje w trybie headless i jest zamykana razem z kontekstem."""
+        playwright = _FakePlaywright()
+        launcher = _launcher()
+        
+        context = launcher.launch(playwright)
+        launcher.close(context)
+        
+        browser, = playwright.chromium.browsers
+        assert browser.headless is True
+        assert context.closed and browser.closed
+    
+    def test_persistent_profiles_per_browser(self, tmp_path):
+        """Test że równoległe przeglądarki dostają osobne katalogi profilu, zwalniane przy zamknięciu."""
+        playwright = _FakePlaywright()
+        launcher = _launcher(user_data_dir=tmp_path)
+        
+        first = launcher.launch(playwright)
+        second = launcher.launch(playwright)
+        launcher.close(first)
+        launcher.launch(playwright)
+        
+        assert [path for path, _ in playwright.chromium.profiles] == [
+            str(tmp_path / 'profile-0'), str(tmp_path / 'profile-1'), str(tmp_path / 'profile-0')
+        ]
+        assert second.options['user_agent']
+    
+    def test_profile_locked_by_other_process_skipped(self, tmp_path):
+        """Test że profil zajęty przez inny proces (inny launcher) jest pomijany, a po zwolnieniu znów dostępny."""
+        playwright = _FakePlaywright()
+        # Osobne launchery mają osobne rejestry numerów - jak dwa równolegle uruchomione skrypty
+        first_run = _launcher(user_data_dir=tmp_path)
+        second_run = _launcher(user_data_dir=tmp_path)
+        
+        first = first_run.launch(playwright)
+        second = second_run.launch(playwright)
+        first_run.close(first)
+        second_run.launch(playwright)
+        second_run.close(second)
+        
+        assert [path for path, _ in playwright.chromium.profiles] == [
+            str(tmp_path / 'profile-0'), str(tmp_path / 'profile-1'), str(tmp_path / 'profile-0')
+        ]
+    
+    def test_storage_state_loaded_and_saved(self, tmp_path):
+        """Test że stan sesji jest zapisywany przy zamknięciu i wczytywany przy kolejnym starcie."""
+        playwright = _FakePlaywright()
+        state = tmp_path / 'state' / 'browser_state.json'
+        launcher = _launcher(storage_state=state)
+        
+        first = launcher.launch(playwright)
+        launcher.close(first)
+        second = launcher.launch(playwright)
+        
+        assert 'storage_state' not in first.options
+        assert second.options['storage_state'] == str(state)
+        assert json.loads(state.read_text(encoding='utf-8'))['cookies'] == [{'name': 'sesja'}]
+
+
+class TestRCLBrowserManagerStartup:
+    """Testy pomiaru startu przeglądarki w RCLBrowserManager."""
+    
+    def test_startup_and_first_navigation_timed(self, monkeypatch):
+        """Test że czas startu przeglądarki i pierwszej nawigacji trafia do statystyk oczekiwania."""
+        playwright = _FakePlaywright()
+        monkeypatch.setattr(
+            'pl_monitoring.utils.rcl_browser_manager.sync_playwright',
+            lambda: type('Starter', (), {'start': lambda self: playwright})()
+        )
+        manager = RCLBrowserManager(waits=BrowserWaits(), launcher=_launcher())
+        
+        manager.start_browser()
+        manager.close_browser()
+        
+        assert {'start przeglądarki', 'pierwsza nawigacja'} <= set(manager.waits.timings.summary())
+        assert playwright.chromium.browsers[0].closed
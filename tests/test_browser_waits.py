@@ -0,0 +1,87 @@
+"""Testy dla modułu browser_waits."""
+
+from contextlib import contextmanager
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from pl_monitoring.constants import RCL_SEARCH_RESULTS_SELECTOR
+from pl_monitoring.utils.browser_waits import BrowserWaits, WaitTimings
+
+
+class _FakePage:
+    """Zastępuje Playwright Page - zapisuje wywołania oczekiwania."""
+    
+    def __init__(self, results_timeout=False, response_timeout=False):
+        self.calls = []
+        self.results_timeout = results_timeout
+        self.response_timeout = response_timeout
+    
+    def goto(self, url, wait_until=None, timeout=None):
+        self.calls.append(('goto', url, wait_until))
+    
+    def wait_for_selector(self, selector, state=None, timeout=None):
+        self.calls.append(('selector', selector, state))
+        if self.results_timeout and selector == RCL_SEARCH_RESULTS_SELECTOR:
+            raise PlaywrightTimeoutError("brak wyników")
+    
+    @contextmanager
+    def expect_response(self, predicate, timeout=None):
+        self.calls.append(('response',))
+        yield
+        if self.response_timeout:
+            raise PlaywrightTimeoutError("brak odpowiedzi")
+    
+    def wait_for_timeout(self, timeout):
+        raise AssertionError("stała pauza zamiast oczekiwania na zdarzenie")
+
+
+class TestWaitTimings:
+    """Testy dla klasy WaitTimings."""
+    
+    def test_record_and_summary(self):
+        """Test że statystyki zliczają liczbę, sumę i maksimum oczekiwań."""
+        timings = WaitTimings()
+        timings.record('wyniki', 0.5)
+        timings.record('wyniki', 1.5)
+        timings.record('formularz', 0.2)
+        
+        assert timings.summary() == {'wyniki': (2, 2.0, 1.5), 'formularz': (1, 0.2, 0.2)}
+
+
+class TestBrowserWaits:
+    """Testy dla klasy BrowserWaits."""
+    
+    def test_submit_search_waits_for_response_and_results(self):
+        """Test że wysłanie formularza czeka na odpowiedź i tabelę wyników, a czasy są zapisywane."""
+        page = _FakePage()
+        submitted = []
+        waits = BrowserWaits()
+        
+        waits.submit_search(page, lambda: submitted.append(True))
+        
+        assert submitted == [True]
+        assert page.calls == [('response',), ('selector', RCL_SEARCH_RESULTS_SELECTOR, 'attached')]
+        assert set(waits.timings.summary()) == {'odpowiedź wyszukiwania', 'wyniki'}
+    
+    def test_missing_response_and_results_are_not_errors(self):
+        """Test że brak odpowiedzi lub tabeli w limicie czasu nie przerywa wyszukiwania."""
+        page = _FakePage(results_timeout=True, response_timeout=True)
+        waits = BrowserWaits()
+        
+        waits.submit_search(page, lambda: None)
+        
+        assert waits.timings.summary()['wyniki'][0] == 1
+    
+    def test_page_loads_do_not_wait_for_network_idle(self):
+        """Test że ładowanie strony czeka na DOM i konkretny selektor, a nie na bezczynność sieci."""
+        page = _FakePage()
+        waits = BrowserWaits()
+        
+        waits.open_search_form(page, 'https://example.test/szukaj')
+        waits.input_ready(page, 'input#number', visible=False)
+        
+        assert page.calls == [
+            ('goto', 'https://example.test/szukaj', 'domcontentloaded'),
+            ('selector', 'form#searchForm', 'attached'),
+            ('selector', 'input#number:enabled', 'attached'),
+        ]
@@ -0,0 +1,83 @@
+"""Testy dla modułu circuit_breaker."""
+
+from unittest import mock
+
+import pytest
+import requests
+
+from pl_monitoring.exceptions import HostUnavailableError
+from pl_monitoring.utils.circuit_breaker import CircuitBreaker, RetryBudget
+from pl_monitoring.utils.http_client import retry_request
+
+
+class TestCircuitBreaker:
+    """Testy dla klasy CircuitBreaker."""
+    
+    def test_opens_after_consecutive_failures(self):
+        """Test otwarcia bezpiecznika po failure_threshold kolejnych błędach."""
+        breaker = CircuitBreaker(failure_threshold=3, probe_interval=30)
+        for _ in range(3):
+            breaker.before_request('www.sejm.gov.pl')
+            breaker.record_failure('www.sejm.gov.pl')
+        
+        with pytest.raises(HostUnavailableError) as exc_info:
+            breaker.before_request('www.sejm.gov.pl')
+        assert exc_info.value.host == 'www.sejm.gov.pl'
+        
+        # Inne hosty działają niezależnie
+        breaker.before_request('legislacja.rcl.gov.pl')
+    
+    def test_success_resets_failure_count(self):
+        """Test że udane żądanie zeruje licznik błędów."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure('rcl')
+        breaker.record_success('rcl')
+        breaker.record_failure('rcl')
+        assert not breaker.is_open('rcl')
+    
+    def test_probe_after_interval_closes_breaker(self):
+        """Test żądania próbnego po probe_interval i zamknięcia po sukcesie."""
+        breaker = CircuitBreaker(failure_threshold=1, probe_interval=30)
+        with mock.patch('pl_monitoring.utils.circuit_breaker.time.monotonic', return_value=100.0):
+            breaker.record_failure('rcl')
+        
+        with mock.patch('pl_monitoring.utils.circuit_breaker.time.monotonic', return_value=131.0):
+            breaker.before_request('rcl')
+            # W trakcie żądania próbnego pozostałe żądania są odrzucane
+            with pytest.raises(HostUnavailableError):
+                breaker.before_request('rcl')
+        
+        breaker.record_success('rcl')
+        assert not breaker.is_open('rcl')
+    
+    def test_failed_probe_reopens_breaker(self):
+        """Test ponownego otwarcia po nieudanym żądaniu próbnym."""
+        breaker = CircuitBreaker(failure_threshold=1, probe_interval=30)
+        with mock.patch('pl_monitoring.utils.circuit_breaker.time.monotonic', return_value=100.0):
+            breaker.record_failure('rcl')
+        with mock.patch('pl_monitoring.utils.circuit_breaker.time.monotonic', return_value=131.0):
+            breaker.before_request('rcl')
+            breaker.record_failure('rcl')
+        with mock.patch('pl_monitoring.utils.circuit_breaker.time.monotonic', return_value=150.0):
+            with pytest.raises(HostUnavailableError):
+                breaker.before_request('rcl')
+
+
+class TestRetryBudget:
+    """Testy dla klasy RetryBudget."""
+    
+    @mock.patch('pl_monitoring.utils.http_client.time.sleep')
+    def test_exhausted_budget_stops_retries(self, mock_sleep):
+        """Test że po wyczerpaniu budżetu błędy nie są ponawiane."""
+        budget = RetryBudget(max_retries=2)
+        request_fn = mock.Mock(side_effect=requests.ConnectionError())
+        
+        with pytest.raises(requests.ConnectionError):
+            retry_request(request_fn, max_retries=3, retry_budget=budget)
+        assert request_fn.call_count == 3
+        
+        request_fn.reset_mock()
+        with pytest.raises(requests.ConnectionError):
+            retry_request(request_fn, max_retries=3, retry_budget=budget)
+        assert request_fn.call_count == 1
+        assert budget.used == 2
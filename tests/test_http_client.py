@@ -0,0 +1,79 @@
+"""Testy dla modułu http_client."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pl_monitoring.monitors.rcl_project_monitor import RCLProjectMonitor
+from pl_monitoring.monitors.sejm_project_monitor import SejmProjectMonitor
+from pl_monitoring.utils.http_client import HTTPClient, get_default_http_client
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Prosty handler HTTP/1.1 z obsługą keep-alive."""
+    
+    protocol_version = 'HTTP/1.1'
+    
+    def do_GET(self):
+        body = b'<html><body>ok</body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Uruchamia lokalny serwer HTTP na czas testu."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHTTPClient:
+    """Testy dla klasy HTTPClient."""
+    
+    def test_session_uses_default_headers(self):
+        """Test że sesja ma ustawione nagłówki przeglądarki."""
+        client = HTTPClient()
+        assert 'User-Agent' in client.session.headers
+        assert client.session.headers['Accept-Language'].startswith('pl-PL')
+    
+    def test_pool_size_is_configurable(self):
+        """Test że rozmiar puli połączeń per host jest konfigurowalny."""
+        client = HTTPClient(pool_size=3)
+        adapter = client.session.get_adapter('https://legislacja.rcl.gov.pl')
+        assert adapter._pool_maxsize == 3
+    
+    def test_connections_are_reused(self, local_server):
+        """Test że kolejne żądania do tego samego hosta używają jednego połączenia."""
+        with HTTPClient() as client:
+            for _ in range(5):
+                response = client.get(f"{local_server}/projekt/1")
+                assert response.status_code == 200
+            
+            stats = client.get_stats()
+        
+        host_stats = stats[local_server.replace('http://', '')]
+        assert host_stats['requests'] == 5
+        assert host_stats['connections'] == 1
+        assert host_stats['reused'] == 4
+    
+    def test_default_client_is_shared(self):
+        """Test że domyślny klient jest współdzielony między monitorami."""
+        assert get_default_http_client() is get_default_http_client()
+        assert RCLProjectMonitor().http_client is SejmProjectMonitor().http_client
+    
+    def test_monitor_accepts_injected_client(self):
+        """Test wstrzykiwania klienta HTTP do monitora."""
+        client = HTTPClient(pool_size=2)
+        monitor = RCLProjectMonitor(http_client=client)
+        assert monitor.http_client is client
@@ -0,0 +1,103 @@
+"""Testy dla modułu kprm_register."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pl_monitoring.exceptions import KPRMConnectionError
+from pl_monitoring.fetchers.kprm_register import KPRMRegisterFetcher
+from pl_monitoring.utils.http_client import HTTPClient
+
+CSV_BODY = 'Numer;Tytuł\nUC1;Projekt A\n'.encode('utf-8')
+
+
+class _RegisterHandler(BaseHTTPRequestHandler):
+    """Serwer pliku CSV z obsługą ETag; content_type pozwala udawać stronę HTML."""
+    
+    requests = []
+    content_type = 'text/csv'
+    
+    def do_GET(self):
+        _RegisterHandler.requests.append(self.headers.get('If-None-Match'))
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', _RegisterHandler.content_type)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(CSV_BODY)))
+        self.end_headers()
+        self.wfile.write(CSV_BODY)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class _NoBrowserLauncher:
+    """Launcher, którego użycie oznacza przejście na przeglądarkę."""
+    
+    def session(self):
+        raise RuntimeError("przeglądarka nie jest dostępna")
+
+
+@pytest.fixture
+def register_url():
+    """Uruchamia lokalny serwer pliku rejestru na czas testu."""
+    _RegisterHandler.requests = []
+    _RegisterHandler.content_type = 'text/csv'
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _RegisterHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/register-file/Rejestr.csv"
+    server.shutdown()
+    server.server_close()
+
+
+def _fetcher(tmp_path, url):
+    return KPRMRegisterFetcher(
+        output_file=tmp_path / 'Rejestr.csv',
+        direct_url=url,
+        launcher=_NoBrowserLauncher(),
+        http_client=HTTPClient()
+    )
+
+
+class TestKPRMRegisterFetcher:
+    """Testy pobierania rejestru KPRM przez HTTP z żądaniem warunkowym."""
+    
+    def test_unchanged_register_not_downloaded_again(self, tmp_path, register_url):
+        """Test że drugie pobranie wysyła ETag i przy 304 zostawia plik bez zmian."""
+        first = _fetcher(tmp_path, register_url)
+        assert first.download()
+        assert not first.unchanged
+        assert (tmp_path / 'Rejestr.csv').read_bytes() == CSV_BODY
+        assert (tmp_path / 'Rejestr.csv.validators.json').exists()
+        
+        # Nowa instancja (kolejne uruchomienie) czyta walidator zapisany obok pliku CSV
+        second = _fetcher(tmp_path, register_url)
+        assert second.download()
+        assert second.unchanged
+        assert _RegisterHandler.requests == [None, '"v1"']
+        assert (tmp_path / 'Rejestr.csv').read_bytes() == CSV_BODY
+    
+    def test_missing_file_downloaded_without_validator(self, tmp_path, register_url):
+        """Test że usunięty plik CSV jest pobierany ponownie mimo zapisanego walidatora."""
+        _fetcher(tmp_path, register_url).download()
+        (tmp_path / 'Rejestr.csv').unlink()
+        
+        fetcher = _fetcher(tmp_path, register_url)
+        
+        assert fetcher.download()
+        assert not fetcher.unchanged
+        assert _RegisterHandler.requests == [None, None]
+    
+    def test_html_response_falls_back_to_browser(self, tmp_path, register_url):
+        """Test że strona HTML zamiast CSV nie nadpisuje pliku i uruchamia przeglądarkę."""
+        _RegisterHandler.content_type = 'text/html; charset=utf-8'
+        
+        with pytest.raises(KPRMConnectionError):
+            _fetcher(tmp_path, register_url).download()
+        
+        assert not (tmp_path / 'Rejestr.csv').exists()
@@ -1,13 +1,26 @@
 """Testy jednostkowe dla modułów monitoringu."""
 
+import asyncio
+import socket
+import threading
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch, MagicMock
 from typing import List, Dict
+from urllib.parse import parse_qs, urlsplit
 
 from pl_monitoring.monitors.rcl_project_monitor import RCLProjectMonitor
+from pl_monitoring.monitors.rcl_search_monitor import RCLSearchMonitor
+from pl_monitoring.monitors.rcl_tag_monitor import RCLTagMonitor
 from pl_monitoring.monitors.sejm_project_monitor import SejmProjectMonitor
 from pl_monitoring.exceptions import RCLConnectionError, SejmConnectionError
+from pl_monitoring.utils.circuit_breaker import CircuitBreaker, RetryBudget
+from pl_monitoring.utils.http_client import HTTPClient
+from pl_monitoring.utils.rcl_browser_manager import RCLBrowserPool
+from pl_monitoring.utils.validator_cache import ValidatorCache
+
+from .test_rcl_browser_manager import _FakeBrowserManager
 
 
 class TestRCLProjectMonitor:
@@ -69,6 +82,34 @@ class TestRCLProjectMonitor:
             # Powinno zwrócić tylko projekty RCL (2 projekty)
             assert len(result) == 2
             assert all(p.get('source') == 'rcl' for p in result)
+    
+    def test_monitor_concurrent_keeps_order(self):
+        """Test że równoległe sprawdzanie zachowuje kolejność i zapisuje wyniki raz."""
+        projects = [{"id": i, "source": "rcl", "title": f"Projekt {i}"} for i in range(1, 9)]
+        save_fn = Mock()
+        
+        monitor = RCLProjectMonitor(
+            load_projects_fn=lambda: [dict(p) for p in projects],
+            save_projects_fn=save_fn,
+            max_workers=4
+        )
+        
+        def fake_fetch(project_id):
+            return f'<div class="small2">Data ostatniej modyfikacji: {project_id:02d}-03-2025</div>'.encode()
+        
+        with patch.object(monitor, '_fetch_project_page', side_effect=fake_fetch):
+            result = monitor.monitor(datetime(2025, 3, 1), datetime(2025, 3, 5))
+        
+        assert [p['id'] for p in result] == list(range(1, 9))
+        assert [p.get('last_hit') for p in result[:6]] == [
+            '2025-03-01', '2025-03-02', '2025-03-03', '2025-03-04', '2025-03-05', None
+        ]
+        save_fn.assert_called_once()
+    
+    def test_max_workers_bounded_by_pool_size(self):
+        """Test że liczba wątków nie przekracza rozmiaru puli połączeń."""
+        monitor = RCLProjectMonitor(http_client=HTTPClient(pool_size=2), max_workers=16)
+        assert monitor.max_workers == 2
 
 
 class TestSejmProjectMonitor:
@@ -130,8 +171,546 @@ class TestSejmProjectMonitor:
             # Powinno zwrócić tylko projekty Sejm (2 projekty)
             assert len(result) == 2
             assert all(p.get('source') == 'sejm' for p in result)
+    
+    def test_unavailable_host_skips_remaining_projects(self):
+        """Test że po otwarciu bezpiecznika pozostałe projekty są pomijane bez łączenia."""
+        # Port, na którym nikt nie nasłuchuje - połączenie odrzucane od razu
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            dead_url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        
+        projects = [{"id": str(n), "source": "sejm"} for n in range(1, 6)]
+        http_client = HTTPClient(
+            circuit_breaker=CircuitBreaker(failure_threshold=2),
+            retry_budget=RetryBudget(max_retries=0)
+        )
+        monitor = SejmProjectMonitor(
+            load_projects_fn=lambda: projects,
+            save_projects_fn=Mock(),
+            base_url=dead_url,
+            http_client=http_client
+        )
+        
+        with patch.object(http_client.session, 'get', wraps=http_client.session.get) as session_get:
+            result = monitor.monitor(datetime(2025, 1, 1), datetime(2025, 12, 31))
+        
+        assert len(result) == 5
+        assert session_get.call_count == 2
+        assert monitor.skipped_projects == ['3', '4', '5']
+    
+    def test_duplicate_prints_fetched_once(self, sejm_server):
+        """Test że ten sam druk zapisany pod różnymi ID jest pobierany i parsowany raz."""
+        projects = [
+            {"id": 1234, "source": "sejm", "title": "Ustawa"},
+            {"id": "1234", "source": "sejm", "title": "Ustawa (kopia)"},
+            {"id": " 01234", "source": "sejm", "title": "Ustawa (inna nazwa)"},
+        ]
+        monitor = SejmProjectMonitor(
+            load_projects_fn=lambda: projects,
+            save_projects_fn=Mock(),
+            base_url=sejm_server,
+            http_client=HTTPClient()
+        )
+        
+        with patch.object(monitor, '_parse_process_stages', wraps=monitor._parse_process_stages) as parse:
+            result = monitor.monitor(datetime(2025, 5, 13), datetime(2025, 6, 30))
+        
+        assert parse.call_count == 1
+        assert [p['last_hit'] for p in result] == ['2025-06-06'] * 3
+        assert monitor._single_flight.deduplicated == 2
+
+
+SEJM_PROCESS_HTML = """
+<html><body>
+<ul class="proces">
+  <li class="rok">2025</li>
+  <li class="krok">
+    <span>12 maja 2025</span>
+    <h3>Projekt wpłynął do Sejmu <a href="druk.xsp?nr=1234">druk nr 1234</a></h3>
+    <div><p>Skierowano do I czytania</p></div>
+    <ul>
+      <li class="poczatek"><span>14 maja 2025</span><h4>Praca w komisjach</h4></li>
+      <li class="koniec"><span>3 czerwca 2025</span><h4>Sprawozdanie komisji</h4>
+        <div><p>Komisja Finansów Publicznych</p></div></li>
+    </ul>
+  </li>
+  <li class="krok">
+    <span>6 czerwca 2025</span>
+    <h3>II czytanie na posiedzeniu Sejmu</h3>
+    <div>
+      <p>Nr posiedzenia: <strong>35</strong></p>
+      <p>Głosowanie: za 420, przeciw 10</p>
+      <p>Wynik: przyjęto</p>
+    </div>
+  </li>
+</ul>
+</body></html>
+"""
+
+
+class _SejmHandler(BaseHTTPRequestHandler):
+    """Handler HTTP zwracający stronę przebiegu procesu."""
+    
+    protocol_version = 'HTTP/1.1'
+    
+    def do_GET(self):
+        body = SEJM_PROCESS_HTML.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def sejm_server():
+    """Uruchamia lokalny serwer udający stronę Sejmu."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _SejmHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+RCL_PROJECT_HTML = """
+<html><body>
+<div class="small2">Data ostatniej modyfikacji: 10-02-2025</div>
+<div class="small2">Data ostatniej modyfikacji: 14-03-2025</div>
+</body></html>
+"""
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """Handler HTTP obsługujący If-None-Match."""
+    
+    protocol_version = 'HTTP/1.1'
+    etag = '"v1"'
+    body = RCL_PROJECT_HTML
+    statuses: List[int] = []
+    
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == self.etag:
+            self.statuses.append(304)
+            self.send_response(304)
+            self.send_header('ETag', self.etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
+        body = self.body.encode('utf-8')
+        self.statuses.append(200)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('ETag', self.etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class _SejmETagHandler(_ETagHandler):
+    """Handler HTTP zwracający stronę przebiegu procesu z obsługą If-None-Match."""
+    
+    body = SEJM_PROCESS_HTML
 
 
+class TestConditionalRequests:
+    """Testy żądań warunkowych (ETag / 304) z cache walidatorów."""
+    
+    def test_second_run_reuses_dates_on_304(self, tmp_path):
+        """Test że przy 304 monitor używa zapisanych dat zamiast parsować stronę."""
+        _ETagHandler.statuses = []
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _ETagHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        cache_file = tmp_path / 'validators.json'
+        
+        try:
+            runs = []
+            for _ in range(2):
+                cache = ValidatorCache(cache_file=cache_file)
+                monitor = RCLProjectMonitor(
+                    load_projects_fn=lambda: [{"id": 1, "source": "rcl"}],
+                    save_projects_fn=Mock(),
+                    base_url=base_url,
+                    http_client=HTTPClient(),
+                    validator_cache=cache
+                )
+                with patch.object(monitor, '_parse_modification_dates', wraps=monitor._parse_modification_dates) as extract:
+                    result = monitor.monitor(datetime(2025, 3, 1), datetime(2025, 3, 31))
+                runs.append((result, extract.call_count))
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert _ETagHandler.statuses == [200, 304]
+        (first_result, first_parses), (second_result, second_parses) = runs
+        assert first_result[0]['last_hit'] == '2025-03-14'
+        assert second_result[0]['last_hit'] == '2025-03-14'
+        # Przy drugim uruchomieniu strona nie była parsowana
+        assert first_parses == 1
+        assert second_parses == 0
+        assert cache.hits == 1
+    
+    def test_save_keeps_entries_of_other_monitor(self, tmp_path):
+        """Test że zapis cache jednego monitora nie usuwa wpisów zapisanych przez inny."""
+        cache_file = tmp_path / 'validators.json'
+        rcl_cache = ValidatorCache(cache_file=cache_file)
+        sejm_cache = ValidatorCache(cache_file=cache_file)
+        
+        rcl_cache.remember_validators('https://rcl/projekt/1', {'ETag': '"r1"'})
+        rcl_cache.store_payload('https://rcl/projekt/1', ['2025-03-14'])
+        rcl_cache.save()
+        sejm_cache.remember_validators('https://sejm/druk/100', {'ETag': '"s1"'})
+        sejm_cache.store_payload('https://sejm/druk/100', [])
+        sejm_cache.save()
+        
+        reloaded = ValidatorCache(cache_file=cache_file)
+        assert reloaded.get_payload('https://rcl/projekt/1') == ['2025-03-14']
+        assert reloaded.get_payload('https://sejm/druk/100') == []
+
+
+class TestAsyncSejmProjectMonitor:
+    """Testy dla AsyncSejmProjectMonitor."""
+    
+    def _projects(self):
+        return [
+            {"id": str(n), "source": "sejm", "title": f"Druk {n}"}
+            for n in range(100, 112)
+        ] + [{"id": "9", "source": "rcl"}]
+    
+    def test_amonitor_matches_sync_monitor(self, sejm_server):
+        """Test że wersja asyncio daje ten sam wynik co synchroniczna."""
+        pytest.importorskip('aiohttp')
+        from pl_monitoring.monitors.async_sejm_project_monitor import AsyncSejmProjectMonitor
+        
+        start_date = datetime(2025, 5, 13)
+        end_date = datetime(2025, 6, 30)
+        
+        sync_save = Mock()
+        sync_monitor = SejmProjectMonitor(
+            load_projects_fn=self._projects,
+            save_projects_fn=sync_save,
+            base_url=sejm_server,
+            http_client=HTTPClient()
+        )
+        sync_result = sync_monitor.monitor(start_date, end_date)
+        
+        async_save = Mock()
+        async_monitor = AsyncSejmProjectMonitor(
+            load_projects_fn=self._projects,
+            save_projects_fn=async_save,
+            base_url=sejm_server,
+            max_concurrency=4
+        )
+        async_result = asyncio.run(async_monitor.amonitor(start_date, end_date))
+        
+        assert async_result == sync_result
+        assert [p['id'] for p in async_result] == [str(n) for n in range(100, 112)]
+        assert async_result[0]['last_hit'] == '2025-06-06'
+        assert [s['date'] for s in async_result[0]['referred_to']] == [
+            '2025-05-14', '2025-06-03', '2025-06-06'
+        ]
+        async_save.assert_called_once_with(sync_save.call_args[0][0])
+    
+    def test_second_run_reuses_stages_on_304(self, tmp_path):
+        """Test że wersja asyncio wysyła żądanie warunkowe i przy 304 używa zapisanych etapów."""
+        pytest.importorskip('aiohttp')
+        from pl_monitoring.monitors.async_sejm_project_monitor import AsyncSejmProjectMonitor
+        
+        _ETagHandler.statuses = []
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _SejmETagHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        cache_file = tmp_path / 'validators.json'
+        
+        try:
+            runs = []
+            for _ in range(2):
+                cache = ValidatorCache(cache_file=cache_file)
+                monitor = AsyncSejmProjectMonitor(
+                    load_projects_fn=lambda: [{"id": "100", "source": "sejm"}],
+                    save_projects_fn=Mock(),
+                    base_url=base_url,
+                    validator_cache=cache
+                )
+                with patch.object(monitor, '_parse_process_stages', wraps=monitor._parse_process_stages) as parse:
+                    result = asyncio.run(monitor.amonitor(datetime(2025, 5, 13), datetime(2025, 6, 30)))
+                runs.append((result, parse.call_count))
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert _ETagHandler.statuses == [200, 304]
+        (first_result, first_parses), (second_result, second_parses) = runs
+        assert second_result == first_result
+        assert second_result[0]['last_hit'] == '2025-06-06'
+        assert first_parses == 1
+        assert second_parses == 0
+        assert cache.hits == 1
+
+
+RCL_SEARCH_HTML = """
+<html><body>
+<div class="rcl-title">Projekty według wybranych kryteriów: 2</div>
+<table id="table">
+<tr><th>Tytuł</th><th>Wnioskodawca</th><th>Numer</th><th>Utworzony</th><th>Zmodyfikowany</th></tr>
+<tr><td><a href="/projekt/101">Projekt A</a></td><td>MF</td><td>UC1</td><td>01-02-2025</td><td>10-03-2025</td></tr>
+<tr><td><a href="/projekt/102">Projekt B</a></td><td>MF</td><td>UC2</td><td>01-01-2025</td><td>05-01-2025</td></tr>
+</table>
+</body></html>
+"""
+
+
+class _SearchHandler(BaseHTTPRequestHandler):
+    """Handler HTTP zwracający stronę wyników wyszukiwania RCL."""
+    
+    protocol_version = 'HTTP/1.1'
+    body = RCL_SEARCH_HTML
+    paths = []
+    
+    def do_GET(self):
+        _SearchHandler.paths.append(self.path)
+        body = self.body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRCLTagMonitor:
+    """Testy wyszukiwania po tagach przez HTTP z przeglądarką jako rezerwą."""
+    
+    def _search(self, tmp_path, body, tags=None):
+        _SearchHandler.body = body
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _SearchHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        
+        monitor = RCLTagMonitor(
+            load_tags_fn=lambda: [{"id": tag_id, "name": ""} for tag_id in tags or []],
+            output_file=tmp_path / 'results.json',
+            base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            http_client=HTTPClient(),
+            browser_pool=RCLBrowserPool(size=3, manager_factory=_FakeBrowserManager)
+        )
+        
+        def browser_search(page, tag_id, search_url, start_date, end_date):
+            return ['z przeglądarki'] if tags is None else [{"id": tag_id}]
+        
+        try:
+            with patch.object(monitor, '_search_by_tag_browser', side_effect=browser_search) as browser:
+                if tags is None:
+                    result = monitor._search_by_tag(7, datetime(2025, 3, 1), datetime(2025, 3, 31))
+                else:
+                    result = monitor.monitor(datetime(2025, 3, 1), datetime(2025, 3, 31))
+        finally:
+            server.shutdown()
+            server.server_close()
+        return result, browser
+    
+    def test_results_fetched_without_browser(self, tmp_path):
+        """Test że tabela wyników pobrana przez HTTP nie uruchamia przeglądarki."""
+        result, browser = self._search(tmp_path, RCL_SEARCH_HTML)
+        
+        assert result == [{"title": "Projekt A", "id": 101, "updated_date": "10-03-2025", "number": "UC1"}]
+        browser.assert_not_called()
+    
+    def test_empty_result_without_browser(self, tmp_path):
+        """Test że pusta lista wyników (licznik 0) nie uruchamia przeglądarki."""
+        result, browser = self._search(tmp_path, '<div>Projekty według wybranych kryteriów: 0</div>')
+        
+        assert result == []
+        browser.assert_not_called()
+    
+    def test_browser_fallback_without_table(self, tmp_path):
+        """Test użycia przeglądarki, gdy HTML nie zawiera tabeli wyników."""
+        result, browser = self._search(tmp_path, '<html><body><div id="app"></div></body></html>')
+        
+        assert result == ['z przeglądarki']
+        browser.assert_called_once()
+    
+    def test_browser_tags_dispatched_to_pool(self, tmp_path):
+        """Test że tagi wymagające przeglądarki trafiają do puli, a wyniki zachowują kolejność tagów."""
+        result, browser = self._search(tmp_path, '<div id="app"></div>', tags=[5, 3, 9, 1])
+        
+        assert [item['id'] for item in result] == [5, 3, 9, 1]
+        assert browser.call_count == 4
+
+
+class _PagedSearchHandler(BaseHTTPRequestHandler):
+    """Handler HTTP zwracający page_rows wierszy dla danego pSize (domyślnie 2), a wszystkie dla pSize=0."""
+    
+    protocol_version = 'HTTP/1.1'
+    dates: List[str] = []
+    page_rows: Dict[str, int] = {}
+    sizes: List[str] = []
+    queries: List[Dict] = []
+    
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query, keep_blank_values=True)
+        _PagedSearchHandler.sizes.append(query.get('pSize', [''])[0])
+        _PagedSearchHandler.queries.append(query)
+        rows = [
+            f'<tr><td><a href="/projekt/{idx}">P{idx}</a></td><td>MF</td><td>UC{idx}</td><td>01-01-2025</td><td>{date}</td></tr>'
+            for idx, date in enumerate(self.dates, 1)
+        ]
+        if _PagedSearchHandler.sizes[-1] != '0':
+            rows = rows[:self.page_rows.get(_PagedSearchHandler.sizes[-1], 2)]
+        body = (
+            f'<div>Projekty według wybranych kryteriów: {len(self.dates)}</div><table id="table">'
+            '<tr><th>Tytuł</th><th>Wnioskodawca</th><th>Numer</th><th>Utworzony</th><th>Zmodyfikowany</th></tr>'
+            f'{"".join(rows)}</table>'
+        ).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRCLSearchPagination:
+    """Testy pobierania wyników wyszukiwania RCL, które nie mieszczą się na pierwszej stronie."""
+    
+    def _search(
+        self, tmp_path, dates, start_date=datetime(2025, 3, 1), end_date=datetime(2025, 3, 31),
+        page_rows=None, search_url=None
+    ):
+        _PagedSearchHandler.dates = dates
+        _PagedSearchHandler.page_rows = page_rows or {}
+        _PagedSearchHandler.sizes = []
+        _PagedSearchHandler.queries = []
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _PagedSearchHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        
+        monitor = RCLTagMonitor(
+            load_tags_fn=list,
+            output_file=tmp_path / 'results.json',
+            base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            http_client=HTTPClient(),
+            browser_pool=RCLBrowserPool(manager_factory=_FakeBrowserManager)
+        )
+        try:
+            if search_url is None:
+                result = monitor._search_by_tag(7, start_date, end_date)
+            else:
+                result = monitor._search_url_http(monitor.base_url + search_url, "tagu 7", start_date, end_date)
+        finally:
+            server.shutdown()
+            server.server_close()
+        return [item['id'] for item in result], _PagedSearchHandler.sizes
+    
+    def test_sorted_first_page_before_date_range(self, tmp_path):
+        """Test że pierwsza strona sięgająca sprzed zakresu dat nie pobiera pozostałych wyników."""
+        ids, sizes = self._search(tmp_path, ['20-03-2025', '28-02-2025', '10-02-2025', '01-02-2025'])
+        
+        assert ids == [1]
+        assert sizes == ['100']
+    
+    def test_remaining_results_fetched_once_without_duplicates(self, tmp_path):
+        """Test że pozostałe wyniki są pobierane jednym żądaniem (pSize=0), bez powtórzeń pierwszej strony."""
+        ids, sizes = self._search(tmp_path, ['20-03-2025', '15-03-2025', '10-03-2025', '28-02-2025', '01-02-2025'])
+        
+        assert ids == [1, 2, 3]
+        assert sizes == ['100', '0']
+    
+    def test_page_grown_until_date_range_reached(self, tmp_path):
+        """Test że strona jest powiększana krok po kroku (10 -> 50) i bez pSize=0, gdy 50 wierszy wystarcza."""
+        ids, sizes = self._search(
+            tmp_path,
+            ['20-03-2025', '15-03-2025', '10-03-2025', '28-02-2025', '01-02-2025'],
+            page_rows={'10': 2, '50': 4},
+            search_url='/szukaj?wordkeyId=7&sKey=modifiedDate&sOrder=desc&pSize=10'
+        )
+        
+        assert ids == [1, 2, 3]
+        assert sizes == ['10', '50']
+    
+    def test_unknown_order_fetches_all_results(self, tmp_path):
+        """Test że przy nieznanej kolejności wierszy pobierane są wszystkie wyniki."""
+        ids, sizes = self._search(tmp_path, ['10-03-2025', '20-03-2025', '01-02-2025', '28-02-2025', '05-03-2025'])
+        
+        assert ids == [1, 2, 5]
+        assert sizes == ['100', '0']
+    
+    def test_date_window_sent_to_server(self, tmp_path):
+        """Test że okno dat trafia do parametrów wyszukiwania, a wąskie okno dostaje małą stronę wyników."""
+        self._search(tmp_path, ['20-03-2025'])
+        month_query = _PagedSearchHandler.queries[0]
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self._search(tmp_path, [today.strftime('%d-%m-%Y')], today - timedelta(days=1), today)
+        recent_query = _PagedSearchHandler.queries[0]
+        
+        assert month_query['createDateFrom'] == [''] and month_query['createDateTo'] == ['01-04-2025']
+        assert month_query['pSize'] == ['100']
+        assert recent_query['createDateTo'] == [(today + timedelta(days=1)).strftime('%d-%m-%Y')]
+        assert recent_query['pSize'] == ['10']
+    
+    def test_narrow_past_window_uses_full_page(self, tmp_path):
+        """Test że wąskie okno w przeszłości nie dostaje małej strony (wyniki od dziś w tył)."""
+        self._search(tmp_path, ['20-03-2025'], datetime(2025, 3, 20), datetime(2025, 3, 21))
+        
+        assert _PagedSearchHandler.queries[0]['createDateTo'] == ['22-03-2025']
+        assert _PagedSearchHandler.queries[0]['pSize'] == ['100']
+    
+    def test_busy_narrow_window_grows_to_next_page_size(self, tmp_path):
+        """Test że wąskie okno z ponad 10 zmianami pobiera stronę 50 wierszy, a nie wszystkie wyniki."""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        dates = [today.strftime('%d-%m-%Y')] * 12 + [(today - timedelta(days=30)).strftime('%d-%m-%Y')] * 60
+        
+        ids, sizes = self._search(
+            tmp_path, dates, today - timedelta(days=1), today, page_rows={'10': 10, '50': 50}
+        )
+        
+        assert ids == list(range(1, 13))
+        assert sizes == ['10', '50']
+
+
+class TestRCLSearchMonitorDirectURL:
+    """Testy wyszukiwania po identyfikatorach zewnętrznych bezpośrednio przez URL (bez formularza)."""
+    
+    def test_queries_fetched_by_url_without_browser(self, tmp_path):
+        """Test że wyszukiwanie po akcie UE i numerze KPRM to zwykłe żądania GET z parametrami formularza."""
+        _SearchHandler.body = RCL_SEARCH_HTML
+        _SearchHandler.paths = []
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _SearchHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        
+        monitor = RCLSearchMonitor(
+            load_queries_fn=lambda: [{"ue_act_number": "2023/1114", "kprm_number": "UC1"}],
+            output_file=tmp_path / 'search.json',
+            base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            http_client=HTTPClient(),
+            browser_pool=RCLBrowserPool(manager_factory=_FakeBrowserManager)
+        )
+        try:
+            with patch.object(monitor, '_run_browser_search') as browser:
+                result = monitor.monitor(datetime(2025, 3, 1), datetime(2025, 3, 31))
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert [project['id'] for project in result] == [101]
+        browser.assert_not_called()
+        queries = [parse_qs(urlsplit(path).query, keep_blank_values=True) for path in _SearchHandler.paths]
+        assert [(q['UEActValue'], q['number']) for q in queries] == [(['2023/1114'], ['']), ([''], ['UC1'])]
+        assert queries[0]['typeId'] == ['1', '2'] and queries[0]['activeTab'] == ['tab2']
+
 class TestDateValidation:
     """Testy walidacji dat."""
     
@@ -0,0 +1,242 @@
+"""Testy dla pakietu parsers."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from pl_monitoring.constants import HTML_PARSER_ENV
+from pl_monitoring.exceptions import ConfigurationError
+from pl_monitoring.monitors.rcl_project_monitor import RCLProjectMonitor
+from pl_monitoring.monitors.rcl_tag_monitor import RCLTagMonitor
+from pl_monitoring.monitors.sejm_project_monitor import SejmProjectMonitor
+from pl_monitoring.parsers.html_backend import get_html_parser, make_soup
+from pl_monitoring.parsers.rcl_project_page import extract_modification_dates
+from pl_monitoring.parsers.rcl_search_results import SearchRow, extract_search_rows, extract_search_rows_from_page
+from pl_monitoring.parsers.sejm_process import ProcessStage, extract_process_stages
+
+from .test_monitors import RCL_PROJECT_HTML, SEJM_PROCESS_HTML
+
+SAVED_SEARCH_PAGE = next(
+    Path(__file__).parent.parent.glob('view-source_https___legislacja.rcl.gov.pl_szukaj*.html'), None
+)
+
+
+class _FakePage:
+    """Zastępuje Playwright Page w testach parsowania."""
+    
+    def __init__(self, html: str):
+        self.html = html
+    
+    def content(self) -> str:
+        return self.html
+
+
+class _FakeScriptPage:
+    """Zastępuje Playwright Page - page.evaluate zwraca przygotowane wiersze, page.content() jest niedostępne."""
+    
+    def __init__(self, data):
+        self.data = data
+        self.args = None
+    
+    def evaluate(self, script, arg):
+        if isinstance(arg, str):
+            return None  # Liczba wyników z nagłówka strony
+        self.args = arg
+        return self.data
+    
+    def content(self):
+        raise AssertionError("serializacja całego DOM w trybie 'js'")
+
+
+class TestHTMLBackend:
+    """Testy wyboru parsera HTML."""
+    
+    def test_lxml_is_default(self, monkeypatch):
+        """Test że domyślnym parserem jest lxml."""
+        monkeypatch.delenv(HTML_PARSER_ENV, raising=False)
+        assert get_html_parser() == 'lxml'
+    
+    def test_parser_selected_by_env(self, monkeypatch):
+        """Test wyboru parsera zmienną środowiskową."""
+        monkeypatch.setenv(HTML_PARSER_ENV, 'html.parser')
+        assert get_html_parser() == 'html.parser'
+        assert get_html_parser('lxml') == 'lxml'
+    
+    def test_unknown_parser_raises(self):
+        """Test błędu konfiguracji dla nieznanego parsera."""
+        with pytest.raises(ConfigurationError):
+            get_html_parser('regex')
+    
+    @pytest.mark.parametrize('parser', ['lxml', 'html.parser'])
+    def test_monitors_parse_identically(self, parser):
+        """Test że parsery dają te same daty modyfikacji i etapy procesu."""
+        dates = RCLProjectMonitor()._extract_modification_dates(make_soup(RCL_PROJECT_HTML, parser))
+        stages = SejmProjectMonitor()._parse_process_stages(make_soup(SEJM_PROCESS_HTML, parser))
+        
+        assert dates == [datetime(2025, 2, 10), datetime(2025, 3, 14)]
+        assert [stage.date for stage in stages] == [
+            datetime(2025, 5, 12), datetime(2025, 5, 14), datetime(2025, 6, 3), datetime(2025, 6, 6)
+        ]
+    
+    @pytest.mark.skipif(SAVED_SEARCH_PAGE is None, reason="brak zapisanej strony wyszukiwania RCL")
+    def test_saved_search_page_same_results(self, monkeypatch):
+        """Test że lxml i html.parser dają te same wyniki na zapisanej stronie wyszukiwania RCL."""
+        page = _FakePage(SAVED_SEARCH_PAGE.read_text(encoding='utf-8'))
+        monitor = RCLTagMonitor(load_tags_fn=list, browser_extraction='html')
+        
+        results = {}
+        for parser in ('lxml', 'html.parser'):
+            monkeypatch.setenv(HTML_PARSER_ENV, parser)
+            results[parser] = monitor._parse_search_results(page, datetime(2000, 1, 1), datetime(2100, 1, 1))
+        
+        assert results['lxml'] == results['html.parser']
+        assert {row['id'] for row in results['lxml']} == {12405051, 12382311}
+
+
+class TestRCLProjectPage:
+    """Testy szybkiego wyciągania dat modyfikacji ze strony projektu RCL."""
+    
+    def test_fast_path_matches_dom(self):
+        """Test że skan surowego HTML daje te same daty co parsowanie DOM."""
+        expected = RCLProjectMonitor()._extract_modification_dates(make_soup(RCL_PROJECT_HTML))
+        
+        assert extract_modification_dates(RCL_PROJECT_HTML.encode('utf-8')) == expected
+        assert extract_modification_dates(RCL_PROJECT_HTML) == expected
+    
+    def test_tags_and_attributes_inside_div(self):
+        """Test rozpoznania daty otoczonej tagami i diva z wieloma klasami."""
+        html = (
+            b'<div id="m1" class="col small2 text-muted">'
+            b'<span>Data ostatniej modyfikacji:</span>&nbsp;<b>05-01-2025</b></div>'
+        )
+        assert extract_modification_dates(html) == [datetime(2025, 1, 5)]
+    
+    @pytest.mark.parametrize('html', [
+        b'<p>Brak etap\xc3\xb3w</p>',
+        b'<div class=small2>Data ostatniej modyfikacji: 05-01-2025</div>',
+        b'<div class="small2">Data ostatniej modyfikacji: 31-02-2025</div>',
+    ])
+    def test_uncertain_result_returns_none(self, html):
+        """Test że nierozpoznany układ strony kieruje do pełnego parsowania."""
+        assert extract_modification_dates(html) is None
+    
+    def test_monitor_falls_back_to_dom(self):
+        """Test że monitor parsuje całą stronę, gdy szybka ścieżka nic nie znajduje."""
+        html = b'<div class=small2>Data ostatniej modyfikacji: 05-01-2025</div>'
+        assert RCLProjectMonitor()._parse_modification_dates(html) == [datetime(2025, 1, 5)]
+
+
+SEARCH_HEADER = '<tr><th>Tytuł</th><th>Wnioskodawca</th><th>Numer</th><th>Utworzony</th><th>Zmodyfikowany</th></tr>'
+
+
+class TestRCLSearchResults:
+    """Testy wyciągania wierszy z tabeli wyników wyszukiwania RCL."""
+    
+    @pytest.mark.skipif(SAVED_SEARCH_PAGE is None, reason="brak zapisanej strony wyszukiwania RCL")
+    def test_saved_search_page_rows(self):
+        """Test typowanych wierszy z zapisanej strony wyszukiwania RCL."""
+        rows = extract_search_rows(SAVED_SEARCH_PAGE.read_text(encoding='utf-8'))
+        
+        assert [row.project_id for row in rows] == [12405051, 12382311]
+        assert rows[0] == SearchRow(
+            project_id=12405051,
+            title='Projekt ustawy o rynku kryptoaktywów',
+            number='UC131',
+            created_date='09-12-2025',
+            updated_date='10-12-2025',
+            updated=datetime(2025, 12, 10)
+        )
+    
+    def test_rows_from_page_script(self):
+        """Test zamiany wierszy zwróconych przez skrypt w przeglądarce na SearchRow."""
+        page = _FakeScriptPage([[7, 'Projekt', 'UC7', '01-02-2025', '03-02-2025']])
+        
+        rows = extract_search_rows_from_page(page)
+        
+        assert rows == [SearchRow(7, 'Projekt', 'UC7', '01-02-2025', '03-02-2025', datetime(2025, 2, 3))]
+        assert page.args['headers']['Zmodyfikowany'] == 'updated_date'
+        assert extract_search_rows_from_page(_FakeScriptPage(None)) is None
+    
+    def test_monitor_extracts_rows_in_browser(self):
+        """Test że monitor w domyślnym trybie nie serializuje DOM, a tryb nieznany jest odrzucany."""
+        page = _FakeScriptPage([
+            [1, 'A', 'UC1', '01-02-2025', '03-02-2025'],
+            [2, 'B', 'UC2', '01-02-2024', '03-02-2024'],
+        ])
+        monitor = RCLTagMonitor(load_tags_fn=list)
+        
+        results = monitor._parse_search_results(page, datetime(2025, 1, 1), datetime(2025, 12, 31))
+        
+        assert [row['id'] for row in results] == [1]
+        with pytest.raises(ConfigurationError):
+            RCLTagMonitor(load_tags_fn=list, browser_extraction='xml')
+    
+    def test_columns_resolved_from_header(self):
+        """Test pozycji kolumn z nagłówka i przesunięcia o dodatkową kolumnę checkboxa."""
+        html = (
+            '<table id="table">' + SEARCH_HEADER +
+            '<tr><td><a href="/zapisz/projekt/7">+</a></td><td><a href="/projekt/7">Projekt</a></td>'
+            '<td>MF</td><td>UC7</td><td>01-02-2025</td><td>03-02-2025</td></tr>'
+            '</table>'
+        )
+        rows = extract_search_rows(html)
+        
+        assert [(row.project_id, row.number, row.updated_date) for row in rows] == [(7, 'UC7', '03-02-2025')]
+    
+    def test_table_without_id(self):
+        """Test znalezienia tabeli wyników bez id po linkach do projektów."""
+        html = (
+            '<table><tr><td>Menu</td></tr></table>'
+            '<table>' + SEARCH_HEADER +
+            '<tr><td><a href="/projekt/5">Projekt</a></td><td>MF</td><td>UC5</td>'
+            '<td>01-02-2025</td><td>nieznana</td></tr>'
+            '</table>'
+        )
+        rows = extract_search_rows(html)
+        
+        assert rows[0].project_id == 5
+        assert rows[0].updated is None
+    
+    def test_no_results_table(self):
+        """Test braku tabeli wyników."""
+        assert extract_search_rows('<table><tr><td>Menu</td></tr></table>') is None
+
+
+class TestSejmProcess:
+    """Testy wyciągania etapów procesu legislacyjnego Sejmu."""
+    
+    def test_stages_serialized_to_json(self):
+        """Test etapów głównych i zagnieżdżonych w formacie zapisywanym w projects.json."""
+        stages = extract_process_stages(make_soup(SEJM_PROCESS_HTML))
+        
+        assert [stage.to_json() for stage in stages] == [
+            {
+                'date': '2025-05-12',
+                'stage_type': 'Projekt wpłynął do Sejmudruk nr 1234',
+                'print_number': '1234',
+                'description': 'Skierowano do I czytania'
+            },
+            {'date': '2025-05-14', 'stage_type': 'Praca w komisjach'},
+            {'date': '2025-06-03', 'stage_type': 'Sprawozdanie komisji', 'description': 'Komisja Finansów Publicznych'},
+            {
+                'date': '2025-06-06',
+                'stage_type': 'II czytanie na posiedzeniu Sejmu',
+                'sitting_number': '35',
+                'voting_result': 'przyjęto',
+                'description': 'Nr posiedzenia:35 | Głosowanie: za 420, przeciw 10 | Wynik: przyjęto'
+            },
+        ]
+        assert stages[3].voting == 'za 420, przeciw 10'
+    
+    def test_json_round_trip(self):
+        """Test odtworzenia etapu z zapisanego JSON (cache walidatorów)."""
+        stage = extract_process_stages(make_soup(SEJM_PROCESS_HTML))[3]
+        restored = ProcessStage.from_json(stage.to_json())
+        
+        assert restored.date == datetime(2025, 6, 6)
+        assert restored.to_json() == stage.to_json()
+    
+    def test_missing_process_list(self):
+        """Test braku listy procesu na stronie."""
+        assert extract_process_stages(make_soup('<ul class="menu"><li>Sejm</li></ul>')) is None
@@ -0,0 +1,164 @@
+"""Testy dla modułu rate_control i ponawiania żądań."""
+
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+import requests
+
+from pl_monitoring.utils.http_client import async_retry_request, retry_request
+from pl_monitoring.utils.rate_control import HostController, RateController, parse_retry_after
+
+
+def _http_error(status_code: int, headers=None) -> requests.HTTPError:
+    """Tworzy requests.HTTPError z odpowiedzią o podanym kodzie."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return requests.HTTPError(f"{status_code} Error", response=response)
+
+
+class TestParseRetryAfter:
+    """Testy dla funkcji parse_retry_after."""
+    
+    def test_seconds(self):
+        """Test wartości w sekundach."""
+        assert parse_retry_after('5') == 5.0
+    
+    def test_http_date(self):
+        """Test wartości w formacie daty HTTP."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+    
+    def test_invalid_or_missing(self):
+        """Test nieprawidłowej i brakującej wartości."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after('jutro') is None
+    
+    def test_capped(self):
+        """Test ograniczenia do MAX_RETRY_AFTER."""
+        assert parse_retry_after('86400') == 60
+
+
+class TestHostController:
+    """Testy dla klasy HostController."""
+    
+    def test_concurrency_limit_blocks_extra_requests(self):
+        """Test że żądanie ponad limit współbieżności musi czekać."""
+        controller = HostController('rcl', rate=100, initial_concurrency=1)
+        assert controller._try_acquire() == 0
+        assert controller._try_acquire() > 0
+        
+        controller.release(200, 0.1)
+        assert controller._try_acquire() == 0
+    
+    def test_throttling_halves_limit(self):
+        """Test zmniejszenia limitu o połowę po odpowiedzi 429."""
+        controller = HostController('rcl', initial_concurrency=8, max_concurrency=10)
+        controller._try_acquire()
+        controller.release(429, 0.1)
+        
+        assert int(controller.limit) == 4
+        assert controller.throttled == 1
+    
+    def test_fast_responses_increase_limit(self):
+        """Test zwiększania limitu przy szybkich odpowiedziach (do max_concurrency)."""
+        controller = HostController('rcl', initial_concurrency=2, max_concurrency=3, latency_target=1.0)
+        for _ in range(20):
+            controller.release(200, 0.1)
+        
+        assert controller.limit == 3
+    
+    def test_slow_responses_keep_limit(self):
+        """Test że wolne odpowiedzi nie zwiększają limitu."""
+        controller = HostController('rcl', initial_concurrency=2, latency_target=1.0)
+        controller.release(200, 5.0)
+        assert controller.limit == 2
+    
+    def test_retry_after_pauses_host(self):
+        """Test że Retry-After wstrzymuje kolejne żądania do hosta."""
+        controller = HostController('rcl', rate=100, initial_concurrency=4)
+        controller._try_acquire()
+        controller.release(503, 0.1, retry_after=10)
+        
+        assert controller._try_acquire() > 9
+    
+    def test_rate_limit(self):
+        """Test że po wyczerpaniu tokenów trzeba czekać."""
+        controller = HostController('rcl', rate=1, burst=2, initial_concurrency=10, max_concurrency=10)
+        assert controller._try_acquire() == 0
+        assert controller._try_acquire() == 0
+        assert controller._try_acquire() > 0
+    
+    def test_registry_shares_controller_per_host(self):
+        """Test że RateController zwraca ten sam kontroler dla hosta."""
+        registry = RateController(rate_limits={'www.sejm.gov.pl': 2.0})
+        assert registry.for_host('www.sejm.gov.pl') is registry.for_host('www.sejm.gov.pl')
+        assert registry.for_host('www.sejm.gov.pl').rate == 2.0
+
+
+class TestRetryRequest:
+    """Testy ponawiania żądań zależnie od kodu HTTP."""
+    
+    @mock.patch('pl_monitoring.utils.http_client.time.sleep')
+    def test_server_error_is_retried(self, mock_sleep):
+        """Test ponawiania po odpowiedzi 503."""
+        request_fn = mock.Mock(side_effect=[_http_error(503), 'ok'])
+        assert retry_request(request_fn) == 'ok'
+        assert request_fn.call_count == 2
+    
+    @mock.patch('pl_monitoring.utils.http_client.time.sleep')
+    def test_client_error_is_not_retried(self, mock_sleep):
+        """Test że 404 nie jest ponawiane."""
+        request_fn = mock.Mock(side_effect=_http_error(404))
+        with pytest.raises(requests.HTTPError):
+            retry_request(request_fn)
+        assert request_fn.call_count == 1
+        mock_sleep.assert_not_called()
+    
+    @mock.patch('pl_monitoring.utils.http_client.time.sleep')
+    def test_retry_after_is_honored(self, mock_sleep):
+        """Test oczekiwania zgodnie z nagłówkiem Retry-After."""
+        request_fn = mock.Mock(side_effect=[_http_error(429, {'Retry-After': '7'}), 'ok'])
+        retry_request(request_fn)
+        mock_sleep.assert_called_once_with(7.0)
+    
+    @mock.patch('pl_monitoring.utils.http_client.time.sleep')
+    def test_backoff_has_jitter(self, mock_sleep):
+        """Test że opóźnienie bez Retry-After mieści się w [delay/2, delay]."""
+        request_fn = mock.Mock(side_effect=[requests.ConnectionError(), 'ok'])
+        retry_request(request_fn, retry_delay=2.0)
+        assert 1.0 <= mock_sleep.call_args[0][0] <= 2.0
+
+
+class TestAsyncRetryRequest:
+    """Testy dla funkcji async_retry_request."""
+    
+    @staticmethod
+    def _run(results):
+        """Wywołuje async_retry_request dla korutyny zwracającej lub zgłaszającej kolejne results."""
+        calls = []
+        
+        async def request():
+            calls.append(None)
+            result = results[len(calls) - 1]
+            if isinstance(result, BaseException):
+                raise result
+            return result
+        
+        return calls, asyncio.run(async_retry_request(request, retry_delay=0.01))
+    
+    def test_timeout_is_retried(self):
+        """Test ponawiania po przekroczeniu czasu żądania."""
+        calls, result = self._run([asyncio.TimeoutError(), 'ok'])
+        assert result == 'ok'
+        assert len(calls) == 2
+    
+    def test_program_error_is_not_retried(self):
+        """Test że błąd programu (nie sieci) jest zgłaszany od razu, bez ponawiania."""
+        with mock.patch('pl_monitoring.utils.http_client.asyncio.sleep') as mock_sleep:
+            with pytest.raises(KeyError):
+                self._run([KeyError('stage'), 'ok'])
+        mock_sleep.assert_not_called()
@@ -0,0 +1,284 @@
+"""Testy dla modułu rcl_browser_manager."""
+
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from pl_monitoring.monitors.rcl_search_monitor import RCLSearchMonitor
+from pl_monitoring.utils.browser_waits import BrowserWaits
+from pl_monitoring.utils.rcl_browser_manager import RCLBrowserManager, RCLBrowserPool
+
+
+class _FakeBrowserManager:
+    """Zastępuje RCLBrowserManager - bez uruchamiania Playwright."""
+    
+    instances = []
+    fail_start = False
+    
+    def __init__(self):
+        self.page = object()
+        self.cleared = 0
+        self.closed = False
+        self.thread = None
+        self.healthy = True
+        self.recycles = 0
+        _FakeBrowserManager.instances.append(self)
+    
+    def start_browser(self):
+        if _FakeBrowserManager.fail_start:
+            _FakeBrowserManager.fail_start = False
+            raise RuntimeError("brak przeglądarki")
+        self.thread = threading.current_thread()
+    
+    def clear_search_form(self):
+        self.cleared += 1
+    
+    def close_browser(self):
+        self.closed = True
+    
+    def recycle_page(self):
+        self.healthy = True
+        self.recycles += 1
+    
+    def recycle_if_needed(self):
+        if not self.healthy:
+            self.recycle_page()
+
+
+def _pool(size):
+    _FakeBrowserManager.instances = []
+    return RCLBrowserPool(size=size, manager_factory=_FakeBrowserManager)
+
+
+class TestRCLBrowserPool:
+    """Testy dla klasy RCLBrowserPool."""
+    
+    def test_results_in_item_order(self):
+        """Test że wyniki są zwracane w kolejności zadań, a przeglądarki zamykane."""
+        pool = _pool(3)
+        
+        results = pool.map(lambda browser, item: item * 10, range(7))
+        
+        assert results == [0, 10, 20, 30, 40, 50, 60]
+        assert len(_FakeBrowserManager.instances) == 3
+        assert all(manager.closed for manager in _FakeBrowserManager.instances)
+    
+    def test_tasks_run_concurrently_on_separate_pages(self):
+        """Test że zadania wykonują się równolegle, każde na stronie własnego wątku."""
+        pool = _pool(3)
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def search(browser, item):
+            barrier.wait()  # Zakleszczenie, gdyby zadania szły po kolei
+            assert browser.thread is threading.current_thread()
+            return browser
+        
+        browsers = pool.map(search, range(3))
+        
+        assert len({id(browser) for browser in browsers}) == 3
+    
+    def test_failed_start_and_task_errors(self):
+        """Test że inne przeglądarki przejmują zadania, a błąd zadania daje None."""
+        pool = _pool(2)
+        _FakeBrowserManager.fail_start = True
+        
+        def search(browser, item):
+            if item == 2:
+                raise ValueError("błąd strony")
+            return item
+        
+        assert pool.map(search, range(4)) == [0, 1, None, 3]
+    
+    def test_task_retried_after_page_crash(self):
+        """Test że zadanie przerwane awarią strony jest powtarzane na nowej stronie."""
+        pool = _pool(1)
+        calls = []
+        
+        def search(browser, item):
+            calls.append(item)
+            if calls.count(item) == 1 and item == 1:
+                browser.healthy = False
+                return []
+            return [item]
+        
+        assert pool.map(search, range(3)) == [[0], [1], [2]]
+        assert calls == [0, 1, 1, 2]
+        assert _FakeBrowserManager.instances[0].recycles == 1
+
+
+class TestRCLSearchMonitorPool:
+    """Testy rozdzielania zapytań RCLSearchMonitor między strony z puli."""
+    
+    def test_queries_dispatched_and_deduplicated(self, tmp_path):
+        """Test że wyniki zapytań są łączone w kolejności zapytań bez duplikatów."""
+        queries = [
+            {"ue_act_number": "2023/1114"},
+            {"kprm_number": "UC2"},
+            {"title": "bez wartości"},
+            {"ue_act_number": "2022/2554", "kprm_number": "UD1"},
+        ]
+        found = {
+            "2023/1114": [{"id": 1, "title": "A", "number": "UC1"}],
+            "UC2": [{"id": 2, "title": "B", "number": "UC2"}, {"id": 1, "title": "A", "number": "UC1"}],
+            "2022/2554": [{"id": 3, "title": "C", "number": ""}],
+            "UD1": [],
+        }
+        monitor = RCLSearchMonitor(
+            load_queries_fn=lambda: queries,
+            output_file=tmp_path / 'search.json',
+            browser_pool=_pool(2)
+        )
+        
+        def search(page, value, start_date, end_date):
+            return found[value]
+        
+        # HTTP i bezpośredni URL w przeglądarce bez tabeli wyników - wyszukiwanie przez formularz
+        with patch.object(monitor, '_search_identifier_http', return_value=None), \
+                patch.object(monitor, '_search_url_browser', return_value=None), \
+                patch.object(monitor, '_search_by_ue_act', side_effect=search), \
+                patch.object(monitor, '_search_by_kprm_number', side_effect=search):
+            result = monitor.monitor(datetime(2025, 1, 1), datetime(2025, 12, 31))
+        
+        assert [project['id'] for project in result] == [1, 2, 3]
+        assert all(project['source'] == 'rcl' for project in result)
+        # Formularz czyszczony przed każdym wypełnieniem (po nawigacji na URL wyszukiwania)
+        assert sum(manager.cleared for manager in _FakeBrowserManager.instances) == 4
+
+
+class TestRCLBrowserManagerRecycling:
+    """Testy odświeżania strony w RCLBrowserManager."""
+    
+    def _manager(self, monkeypatch, **kwargs):
+        from .test_browser_launcher import _FakePlaywright, _launcher
+        
+        playwright = _FakePlaywright()
+        monkeypatch.setattr(
+            'pl_monitoring.utils.rcl_browser_manager.sync_playwright',
+            lambda: type('Starter', (), {'start': lambda self: playwright})()
+        )
+        manager = RCLBrowserManager(waits=BrowserWaits(), launcher=_launcher(), **kwargs)
+        manager.start_browser()
+        return manager
+    
+    def test_page_recycled_after_navigation_limit(self, monkeypatch):
+        """Test że po limicie nawigacji strona jest zamykana i otwierana nowa z czystym formularzem."""
+        manager = self._manager(monkeypatch, max_navigations=3, max_js_heap_mb=None)
+        first_page = manager.page
+        
+        for _ in range(2):
+            first_page.emit('domcontentloaded')
+        assert not manager.recycle_if_needed()
+        first_page.emit('domcontentloaded')
+        
+        assert manager.recycle_if_needed()
+        assert first_page.closed and manager.page is not first_page
+        assert manager.navigations == 0
+    
+    def test_page_recycled_after_crash_or_heap_limit(self, monkeypatch):
+        """Test że awaria renderera i przekroczony limit sterty JS powodują otwarcie nowej strony."""
+        manager = self._manager(monkeypatch, max_js_heap_mb=100)
+        
+        manager.page.emit('crash')
+        assert not manager.healthy
+        assert manager.recycle_if_needed() and manager.healthy
+        
+        manager.page.heap_bytes = 150 * 1024 * 1024
+        assert manager.recycle_if_needed()
+        assert not manager.recycle_if_needed()
+
+
+class _FormPage:
+    """Strona zwracająca zadany wynik czyszczenia formularza w DOM."""
+    
+    def __init__(self, clean):
+        self.clean = clean
+        self.visited = []
+    
+    def evaluate(self, script, arg=None):
+        if isinstance(self.clean, Exception):
+            raise self.clean
+        return self.clean
+    
+    def goto(self, url, wait_until=None, timeout=None):
+        self.visited.append(url)
+    
+    def wait_for_selector(self, selector, state=None, timeout=None):
+        pass
+
+
+class TestRCLBrowserManagerFormReset:
+    """Testy czyszczenia formularza wyszukiwania w RCLBrowserManager."""
+    
+    def _clear(self, clean):
+        manager = RCLBrowserManager(active_tab='tab2', waits=BrowserWaits())
+        manager.page = _FormPage(clean)
+        
+        manager.clear_search_form()
+        
+        return manager.page.visited
+    
+    def test_form_cleared_in_page_without_navigation(self):
+        """Test że potwierdzone czyszczenie w DOM nie ładuje strony od nowa."""
+        assert self._clear(True) == []
+    
+    def test_navigation_fallback_when_form_not_clean(self):
+        """Test że przy nieudanym czyszczeniu w DOM strona z czystym formularzem jest ładowana od nowa."""
+        assert self._clear(False) == ['https://legislacja.rcl.gov.pl/szukaj?activeTab=tab2#list']
+        assert len(self._clear(RuntimeError("brak kontekstu"))) == 1
+
+
+# Strona RCL ma osobny form#searchForm dla każdej zakładki (pierwszy to ukryta zakładka "wszystkie")
+MULTI_FORM_HTML = """
+<html><body>
+<form id="searchForm" style="display: none">
+  <input type="text" name="title" value="">
+</form>
+<form id="searchForm">
+  <input type="text" id="UEActValue" name="UEActValue" value="2023/1114">
+  <input id="number" name="number" value="UC2">
+  <input type="datea" name="createDateFrom" value="01-01-2025">
+  <input type="hidden" name="activeTab" value="tab2">
+  <input type="checkbox" name="typeId" value="1" checked>
+  <select name="status"><option value=""></option><option value="1" selected>W toku</option></select>
+</form>
+<div>Projekty według wybranych kryteriów: 2</div>
+<table id="table"><tr><td>UC2</td></tr></table>
+</body></html>
+"""
+
+
+@pytest.fixture
+def chromium_page():
+    """Strona Chromium (Playwright); test jest pomijany, gdy przeglądarka nie jest zainstalowana."""
+    from playwright.sync_api import sync_playwright
+    
+    playwright = sync_playwright().start()
+    try:
+        browser = playwright.chromium.launch()
+    except Exception as e:
+        playwright.stop()
+        pytest.skip(f"Chromium niedostępny: {e}")
+    yield browser.new_page()
+    browser.close()
+    playwright.stop()
+
+
+class TestResetSearchFormScript:
+    """Testy skryptu czyszczącego formularz wyszukiwania w prawdziwej przeglądarce."""
+    
+    def test_all_search_forms_cleared(self, chromium_page):
+        """Test że czyszczone są pola wszystkich form#searchForm, także daty type="datea"."""
+        chromium_page.set_content(MULTI_FORM_HTML)
+        manager = RCLBrowserManager(active_tab='tab2', waits=BrowserWaits())
+        manager.page = chromium_page
+        
+        assert manager._reset_form_in_page()
+        
+        values = chromium_page.evaluate(
+            "() => Array.from(document.querySelectorAll('form#searchForm input, form#searchForm select'))"
+            ".map((el) => el.value)"
+        )
+        assert values == ['', '', '', '', 'tab2', '1', '']
+        assert chromium_page.locator('table#table').count() == 0
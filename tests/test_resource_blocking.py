@@ -0,0 +1,89 @@
+"""Testy dla modułu resource_blocking."""
+
+from pl_monitoring.utils.resource_blocking import ResourceBlockingProfile
+
+
+class _FakeRequest:
+    def __init__(self, resource_type, url):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class _FakeRoute:
+    def __init__(self):
+        self.outcome = None
+    
+    def abort(self, error_code=None):
+        self.outcome = 'abort'
+    
+    def continue_(self):
+        self.outcome = 'continue'
+
+
+class _FakeResponse:
+    def __init__(self, length):
+        self.headers = {'content-length': length} if length is not None else {}
+
+
+class _FakeContext:
+    def __init__(self):
+        self.routes = []
+        self.handlers = {}
+    
+    def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+    
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+
+class TestResourceBlockingProfile:
+    """Testy dla klasy ResourceBlockingProfile."""
+    
+    def test_should_block_types_and_hosts(self):
+        """Test że blokowane są wskazane typy zasobów i hosty wraz z subdomenami."""
+        profile = ResourceBlockingProfile()
+        
+        assert profile.should_block('image', 'https://legislacja.rcl.gov.pl/static/img/rcl_icon.png')
+        assert profile.should_block('font', 'https://legislacja.rcl.gov.pl/static/font.woff')
+        assert profile.should_block('script', 'https://www.google-analytics.com/analytics.js')
+        assert not profile.should_block('script', 'https://legislacja.rcl.gov.pl/static/js/rpl.js')
+        assert not profile.should_block('document', 'https://legislacja.rcl.gov.pl/szukaj')
+        assert not profile.should_block('stylesheet', 'https://legislacja.rcl.gov.pl/static/css/rpl.css')
+        assert not profile.should_block('script', 'https://notgoogle-analytics.com/a.js')
+    
+    def test_routes_and_counters(self):
+        """Test że przechwytywanie przerywa zbędne żądania i zlicza zablokowane oraz przepuszczone."""
+        profile = ResourceBlockingProfile()
+        context = _FakeContext()
+        profile.install(context)
+        (pattern, handle_route), = context.routes
+        count_response = context.handlers['response']
+        
+        outcomes = []
+        for resource_type, url in [
+            ('document', 'https://legislacja.rcl.gov.pl/szukaj'),
+            ('image', 'https://legislacja.rcl.gov.pl/a.png'),
+            ('image', 'https://legislacja.rcl.gov.pl/b.png'),
+            ('script', 'https://www.googletagmanager.com/gtm.js'),
+        ]:
+            route = _FakeRoute()
+            handle_route(route, _FakeRequest(resource_type, url))
+            outcomes.append(route.outcome)
+        count_response(_FakeResponse('2048'))
+        count_response(_FakeResponse(None))
+        
+        assert pattern == '**/*'
+        assert outcomes == ['continue', 'abort', 'abort', 'abort']
+        assert profile.blocked_requests == {'image': 2, 'script': 1}
+        assert (profile.allowed_requests, profile.allowed_bytes) == (2, 2048)
+    
+    def test_empty_profile_does_not_intercept(self):
+        """Test że pusty profil nie włącza przechwytywania żądań."""
+        profile = ResourceBlockingProfile(blocked_types=(), blocked_hosts=())
+        context = _FakeContext()
+        
+        profile.install(context)
+        
+        assert not profile.enabled
+        assert context.routes == [] and context.handlers == {}
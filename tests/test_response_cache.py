@@ -0,0 +1,164 @@
+"""Testy dla modułu response_cache."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+import requests
+
+from pl_monitoring.exceptions import CacheMissError
+from pl_monitoring.utils.http_client import HTTPClient
+from pl_monitoring.utils.response_cache import ResponseCache
+
+
+def _response(content: bytes, status_code: int = 200) -> requests.Response:
+    """Tworzy odpowiedź HTTP o podanej treści."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers['Content-Type'] = 'text/html; charset=utf-8'
+    return response
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    """Handler HTTP zliczający otrzymane żądania."""
+    
+    protocol_version = 'HTTP/1.1'
+    requests_count = 0
+    
+    def do_GET(self):
+        type(self).requests_count += 1
+        body = '<html><body>Data ostatniej modyfikacji: 15-03-2025</body></html>'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def counting_server():
+    """Uruchamia lokalny serwer HTTP zliczający żądania."""
+    _CountingHandler.requests_count = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestResponseCache:
+    """Testy dla klasy ResponseCache."""
+    
+    def test_store_and_get_roundtrip(self, tmp_path):
+        """Test zapisu i odczytu strony (także po ponownym wczytaniu indeksu)."""
+        cache = ResponseCache(cache_dir=tmp_path)
+        cache.store('https://legislacja.rcl.gov.pl/projekt/1', _response('zażółć'.encode('utf-8')))
+        cache.save()
+        
+        cached = ResponseCache(cache_dir=tmp_path).get('https://legislacja.rcl.gov.pl/projekt/1')
+        
+        assert cached.status_code == 200
+        assert cached.text == 'zażółć'
+    
+    def test_invalid_index_entries_skipped(self, tmp_path):
+        """Test że uszkodzone wpisy indeksu są pomijane, a poprawne nadal czytane z cache."""
+        url = 'https://legislacja.rcl.gov.pl/projekt/1'
+        cache = ResponseCache(cache_dir=tmp_path)
+        cache.store(url, _response(b'strona'))
+        cache.save()
+        index_file = tmp_path / 'index.json'
+        index = json.loads(index_file.read_text(encoding='utf-8'))
+        # Wpis przerwany w połowie zapisu (istniejący plik, brak pól), wpis bez pliku i wpis innego typu
+        index['https://legislacja.rcl.gov.pl/projekt/2'] = {'file': index[url]['file']}
+        index['https://legislacja.rcl.gov.pl/projekt/3'] = {'size': 10}
+        index['https://legislacja.rcl.gov.pl/projekt/4'] = 'uszkodzony'
+        index_file.write_text(json.dumps(index), encoding='utf-8')
+        
+        reloaded = ResponseCache(cache_dir=tmp_path)
+        
+        assert reloaded.get(url).content == b'strona'
+        assert reloaded.get('https://legislacja.rcl.gov.pl/projekt/2') is None
+    
+    def test_entry_expires_after_host_ttl(self, tmp_path):
+        """Test że wpis wygasa po TTL ustawionym dla hosta."""
+        cache = ResponseCache(cache_dir=tmp_path, ttl_by_host={'legislacja.rcl.gov.pl': 60}, default_ttl=3600)
+        url = 'https://legislacja.rcl.gov.pl/projekt/1'
+        
+        with mock.patch('pl_monitoring.utils.response_cache.time.time', return_value=1000.0):
+            cache.store(url, _response(b'ok'))
+        with mock.patch('pl_monitoring.utils.response_cache.time.time', return_value=1059.0):
+            assert cache.get(url) is not None
+        with mock.patch('pl_monitoring.utils.response_cache.time.time', return_value=1061.0):
+            assert cache.get(url) is None
+    
+    def test_least_recently_used_entry_is_evicted(self, tmp_path):
+        """Test usuwania najdawniej używanego wpisu po przekroczeniu limitu rozmiaru."""
+        cache = ResponseCache(cache_dir=tmp_path, max_size_bytes=10 ** 6)
+        cache.store('https://a/1', _response(b'1' * 100))
+        cache.store('https://a/2', _response(b'2' * 100))
+        cache.get('https://a/1')
+        
+        # Limit mieści dwa wpisy - trzeci wypiera najdawniej używany ('https://a/2')
+        cache.max_size_bytes = sum(entry['size'] for entry in cache._index.values())
+        cache.store('https://a/3', _response(b'3' * 100))
+        
+        assert cache.get('https://a/2') is None
+        assert cache.get('https://a/1') is not None
+        assert cache.get('https://a/3') is not None
+        assert cache.evictions == 1
+    
+    def test_error_responses_are_not_stored(self, tmp_path):
+        """Test że odpowiedzi inne niż 200 nie trafiają do cache."""
+        cache = ResponseCache(cache_dir=tmp_path)
+        cache.store('https://a/1', _response(b'', status_code=500))
+        assert cache.get('https://a/1') is None
+    
+    def test_unknown_mode_raises(self, tmp_path):
+        """Test walidacji trybu pracy."""
+        with pytest.raises(ValueError):
+            ResponseCache(cache_dir=tmp_path, mode='never')
+
+
+class TestHTTPClientResponseCache:
+    """Testy integracji ResponseCache z HTTPClient."""
+    
+    def test_repeated_request_served_from_cache(self, tmp_path, counting_server):
+        """Test że powtórzone żądanie nie trafia do serwera."""
+        url = f"{counting_server}/projekt/1"
+        with HTTPClient(response_cache=ResponseCache(cache_dir=tmp_path)) as client:
+            first = client.get(url)
+            second = client.get(url)
+        
+        assert _CountingHandler.requests_count == 1
+        assert second.text == first.text
+    
+    def test_refresh_mode_always_hits_server(self, tmp_path, counting_server):
+        """Test że tryb refresh pobiera stronę z serwera i odświeża cache."""
+        url = f"{counting_server}/projekt/1"
+        with HTTPClient(response_cache=ResponseCache(cache_dir=tmp_path, mode='refresh')) as client:
+            client.get(url)
+            client.get(url)
+        
+        assert _CountingHandler.requests_count == 2
+        assert ResponseCache(cache_dir=tmp_path).get(url) is not None
+    
+    def test_offline_mode_never_hits_server(self, tmp_path, counting_server):
+        """Test że tryb offline korzysta tylko z cache (bez względu na TTL)."""
+        url = f"{counting_server}/projekt/1"
+        with HTTPClient(response_cache=ResponseCache(cache_dir=tmp_path)) as client:
+            client.get(url)
+        
+        offline_cache = ResponseCache(cache_dir=tmp_path, default_ttl=0, mode='offline')
+        with HTTPClient(response_cache=offline_cache) as client:
+            assert client.get(url).status_code == 200
+            with pytest.raises(CacheMissError):
+                client.get(f"{counting_server}/projekt/2")
+        
+        assert _CountingHandler.requests_count == 1
@@ -0,0 +1,83 @@
+"""Testy dla modułu single_flight."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pl_monitoring.utils.project_utils import normalize_project_id
+from pl_monitoring.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Testy dla klasy SingleFlight."""
+    
+    def test_concurrent_calls_share_one_execution(self):
+        """Test że równoległe wywołania z tym samym kluczem wykonują funkcję raz."""
+        flight = SingleFlight()
+        calls = []
+        lock = threading.Lock()
+        
+        def fetch():
+            with lock:
+                calls.append(1)
+            time.sleep(0.05)
+            return ['2025-03-14']
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: flight.do('https://rcl/projekt/1', fetch), range(4)))
+        
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.executed == 1
+        assert flight.deduplicated == 3
+    
+    def test_repeated_calls_reuse_result(self):
+        """Test że późniejsze wywołanie z tym samym kluczem nie wykonuje funkcji ponownie."""
+        flight = SingleFlight()
+        assert flight.do('a', lambda: 1) == 1
+        assert flight.do('a', lambda: 2) == 1
+        assert flight.do('b', lambda: 3) == 3
+    
+    def test_exception_is_shared(self):
+        """Test że wyjątek z pierwszego wywołania trafia do wszystkich wywołań."""
+        flight = SingleFlight()
+        
+        def fail():
+            raise ValueError("błąd")
+        
+        with pytest.raises(ValueError):
+            flight.do('a', fail)
+        with pytest.raises(ValueError):
+            flight.do('a', lambda: 1)
+    
+    def test_async_calls_share_one_coroutine(self):
+        """Test wariantu asyncio."""
+        flight = SingleFlight()
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'etapy'
+        
+        async def run():
+            return await asyncio.gather(*(flight.ado('druk-1', fetch) for _ in range(5)))
+        
+        assert asyncio.run(run()) == ['etapy'] * 5
+        assert len(calls) == 1
+        assert flight.deduplicated == 4
+
+
+class TestNormalizeProjectId:
+    """Testy dla funkcji normalize_project_id."""
+    
+    def test_int_and_string_ids_are_equal(self):
+        """Test że ID liczbowe i tekstowe dają ten sam wynik."""
+        assert normalize_project_id(1234) == normalize_project_id('1234') == normalize_project_id(' 01234 ')
+    
+    def test_non_numeric_id_is_kept(self):
+        """Test że ID nieliczbowe są tylko przycinane."""
+        assert normalize_project_id(' 1234-A ') == '1234-A'